@@ -1,17 +1,32 @@
 import argparse
+import json
 import sys
+import time
+from itertools import islice
 
+from logic.batch import collect_paths, solve_batch
+from logic.cache import (SolutionCache, cached_count, cached_solutions,
+                         cached_uniqueness)
 from logic.converter import convert_puzzle
 from logic.error_checker import check_puzzle
-from logic.puzzle_maker import make_puzzle
-from logic.solver import solve_puzzle
-from utilities.iterable import Iterable
+from logic.generator import generate_puzzles
+from logic.puzzle_maker import make_puzzle, make_puzzles
+from logic.heuristics import STRATEGIES
+from logic.parallel import count_solutions_parallel, solve_puzzle_parallel
+from logic.propagation import BLOCK_FILTERS
+from logic.snapshot import (CHECKED, PROPAGATED, load_puzzle, load_puzzles,
+                            write_snapshots)
+from logic.solver import (ENGINES, check_uniqueness, compare_strategies,
+                          count_solutions, solve_puzzle)
+from logic.tracing import Profiler, Tracer, timed
+from logic.transposition import TranspositionTable
+from logic.writer import (FORMATS, SolutionWriter, apply_digits,
+                          decode_deltas)
 from visual import visual
 
 
 def print_puzzle(puzzle: dict):
-    for string in convert_puzzle(puzzle):
-        print(string)
+    print('\n'.join(convert_puzzle(puzzle)))
 
 
 def define_arguments() -> argparse.ArgumentParser:
@@ -20,12 +35,213 @@ def define_arguments() -> argparse.ArgumentParser:
     parser.add_argument('-v', '--visual', help='launch visual interface',
                         action='store_true')
     parser.add_argument('-f', '--file', help='file with cross sums puzzle')
+    parser.add_argument('-b', '--batch', metavar='PATH', nargs='+',
+                        help='solve every puzzle file in directories or '
+                             'glob patterns and print JSON lines')
     parser.add_argument('-l', '--limit', metavar='n',
                         help='limit of possible solutions '
                              '(integer or asterisk)', default='1')
+    parser.add_argument('-s', '--strategy', metavar='name',
+                        choices=STRATEGIES, default='first',
+                        help='branching strategy of brute force search '
+                             '({0})'.format(', '.join(STRATEGIES)))
+    parser.add_argument('-c', '--consistency', metavar='level',
+                        choices=BLOCK_FILTERS, default='sums',
+                        help='block propagation level '
+                             '({0})'.format(', '.join(BLOCK_FILTERS)))
+    parser.add_argument('-e', '--engine', metavar='name',
+                        choices=ENGINES, default='search',
+                        help='solving backend '
+                             '({0})'.format(', '.join(ENGINES)))
+    parser.add_argument('-j', '--jobs', metavar='n', type=int, default=1,
+                        help='number of processes searching for solutions')
+    parser.add_argument('--depth', metavar='k', type=int, default=3,
+                        help='branching decisions made before the search '
+                             'is split between processes')
+    parser.add_argument('--unordered', action='store_true',
+                        help='print solutions of parallel search as soon '
+                             'as they are found')
+    parser.add_argument('--count', action='store_true',
+                        help='print the number of solutions and elapsed '
+                             'time instead of solutions')
+    parser.add_argument('--unique', action='store_true',
+                        help='report whether the solution is unique and '
+                             'print at most two witness solutions')
+    parser.add_argument('--stats', action='store_true',
+                        help='print per-phase time, search and propagation '
+                             'counters and cache hit ratios after solving')
+    parser.add_argument('-t', '--table', metavar='MiB', type=int, default=0,
+                        help='memory limit of the transposition table '
+                             'shared by the search (disabled by default)')
+    parser.add_argument('--compare', action='store_true',
+                        help='report search node counts of every strategy '
+                             'instead of solutions')
+    parser.add_argument('--split', metavar='DELIMITER', nargs='?', const='',
+                        help='treat every batch file as a stream of puzzles '
+                             'separated by blank lines or DELIMITER lines')
+    parser.add_argument('--snapshot', metavar='FILE',
+                        help='write checked and propagated binary snapshots '
+                             'of the input puzzles instead of solving')
+    parser.add_argument('--format', metavar='name', choices=FORMATS,
+                        default='text',
+                        help='solution output format '
+                             '({0})'.format(', '.join(FORMATS)))
+    parser.add_argument('--decode', metavar='FILE',
+                        help='rebuild solutions of the input puzzle from a '
+                             'file written with --format delta')
+    parser.add_argument('--solution', metavar='n', type=int,
+                        help='rebuild only the n-th solution when decoding')
+    parser.add_argument('--cache', metavar='DIR',
+                        help='reuse solutions and counts stored in DIR by '
+                             'earlier runs and store new ones there')
+    parser.add_argument('-g', '--generate', metavar='n', type=int,
+                        help='print n random puzzles separated by blank '
+                             'lines instead of solving')
+    parser.add_argument('--size', metavar=('ROWS', 'COLUMNS'), type=int,
+                        nargs=2, default=[10, 10],
+                        help='size of generated puzzles including hints')
+    parser.add_argument('--density', metavar='ratio', type=float,
+                        default=0.8,
+                        help='share of generated cells that are white '
+                             'before runs are repaired')
+    parser.add_argument('--seed', metavar='n', type=int,
+                        help='seed that makes generated puzzles '
+                             'reproducible')
+    parser.add_argument('--nodes', metavar=('MIN', 'MAX'), type=int,
+                        nargs=2,
+                        help='keep generated puzzles whose uniqueness check '
+                             'takes between MIN and MAX search nodes')
     return parser
 
 
+def print_comparison(report: dict):
+    for name, statistics in report.items():
+        print('{0}: {1} nodes, {2} backtracks, {3} solutions.'
+              .format(name, statistics.nodes, statistics.backtracks,
+                      statistics.solutions))
+
+
+def print_statistics(report: dict):
+    print('Phases: {0}.'.format(', '.join(
+        '{0} {1:.3f} s'.format(*phase) for phase in report['phases'].items())),
+        file=sys.stderr)
+    print('Search: {decisions} decisions, {backtracks} backtracks, '
+          '{solutions} solutions, maximum depth {depth}.'.format(**report),
+          file=sys.stderr)
+    print('Propagation: {propagations} passes in {propagation_time:.3f} s, '
+          '{probes} probes in {probe_time:.3f} s, {wipe_outs} wipe-outs.'
+          .format(**report), file=sys.stderr)
+    print('Caches: {0}.'.format(', '.join(
+        '{0} {hits} hits, {misses} misses ({hit_rate:.1%} hit rate)'
+        .format(name, **cache) for name, cache in report['caches'].items())),
+        file=sys.stderr)
+
+
+def print_table(table: TranspositionTable):
+    print('Transposition table: {0} hits, {1} misses ({2:.1%} hit rate), '
+          '{3} evictions, {4} bytes.'
+          .format(table.hits, table.misses, table.hit_rate,
+                  table.evictions, table.size), file=sys.stderr)
+
+
+def print_cache(cache: SolutionCache):
+    print('Solution cache: {0} hits, {1} misses ({2:.1%} hit rate), '
+          '{3} evictions.'
+          .format(cache.hits, cache.misses, cache.hit_rate, cache.evictions),
+          file=sys.stderr)
+
+
+def solve(arguments: argparse.Namespace, puzzle: dict, writer: SolutionWriter,
+          table: TranspositionTable = None, tracer: Tracer = None,
+          prepared: bool = False, cache: SolutionCache = None):
+    limit = arguments.limit
+    start = time.perf_counter()
+    if arguments.unique:
+        status, solutions = cached_uniqueness(
+            cache, puzzle,
+            lambda: check_uniqueness(
+                puzzle, arguments.strategy,
+                consistency=arguments.consistency, engine=arguments.engine,
+                table=table, tracer=tracer, prepared=prepared))
+        if tracer is not None:
+            tracer.phase('solve', time.perf_counter() - start)
+        writer.write_status(status)
+        for number, solution in enumerate(solutions, start=1):
+            writer.write_solution(number, solution)
+        return
+    if arguments.count:
+        total = cached_count(
+            cache, puzzle,
+            lambda: count_solutions(puzzle, arguments.strategy,
+                                    consistency=arguments.consistency,
+                                    engine=arguments.engine, table=table,
+                                    tracer=tracer, prepared=prepared)
+            if arguments.jobs == 1 else
+            count_solutions_parallel(puzzle, arguments.jobs,
+                                     arguments.depth, arguments.strategy,
+                                     consistency=arguments.consistency))
+        elapsed = time.perf_counter() - start
+        if tracer is not None:
+            tracer.phase('solve', elapsed)
+        print('{0} solutions found in {1:.3f} seconds.'
+              .format(total, elapsed))
+        return
+    limit = int(limit) if limit != '*' else None
+    solutions = cached_solutions(
+        cache, puzzle, limit,
+        lambda: solve_puzzle(puzzle, arguments.strategy,
+                             consistency=arguments.consistency,
+                             engine=arguments.engine, table=table,
+                             tracer=tracer, prepared=prepared)
+        if arguments.jobs == 1 else
+        solve_puzzle_parallel(puzzle, arguments.jobs, arguments.depth,
+                              arguments.strategy,
+                              consistency=arguments.consistency,
+                              ordered=not arguments.unordered, limit=limit))
+    if tracer is not None:
+        solutions = timed(solutions, tracer, 'solve')
+    for number, solution in enumerate(solutions, start=1):
+        writer.write_solution(number, solution)
+
+
+def decode(arguments: argparse.Namespace, puzzle: dict):
+    number = arguments.solution
+    if number is not None and number < 1:
+        raise ValueError('Solution number must be positive.')
+    with open(arguments.decode, 'rb') as file, \
+            SolutionWriter(sys.stdout.buffer, arguments.format) as writer:
+        solutions = enumerate(decode_deltas(file), start=1)
+        if number is not None:
+            solutions = islice(solutions, number - 1, number)
+        written = 0
+        for position, digits in solutions:
+            writer.write_solution(position, apply_digits(puzzle, digits))
+            written += 1
+    if number is not None and not written:
+        raise ValueError('{0} has no solution #{1}.'
+                         .format(arguments.decode, number))
+
+
+def generate(arguments: argparse.Namespace):
+    for number, puzzle in enumerate(generate_puzzles(
+            arguments.generate, *arguments.size, arguments.density,
+            arguments.seed, arguments.unique, arguments.nodes)):
+        if number:
+            print()
+        print_puzzle(puzzle)
+
+
+def input_puzzles(arguments: argparse.Namespace):
+    delimiter = arguments.split or None
+    if arguments.file is None:
+        return (make_puzzles(sys.stdin, delimiter)
+                if arguments.split is not None else [make_puzzle(sys.stdin)])
+    if arguments.split is not None:
+        return (puzzle for puzzle, _ in load_puzzles(arguments.file,
+                                                      delimiter))
+    return [load_puzzle(arguments.file)[0]]
+
+
 def main(parser: argparse.ArgumentParser):
     arguments = parser.parse_args()
 
@@ -37,17 +253,71 @@ def main(parser: argparse.ArgumentParser):
             or limit.isnumeric() and int(limit) < 1):
         raise SyntaxError('Limit value must be positive '
                           'number or asterisk.')
-    with (sys.stdin if arguments.file is None
-          else open(arguments.file, encoding='utf-8')) as file:
-        puzzle = make_puzzle(file)
+    if arguments.generate is not None:
+        generate(arguments)
+        return
+    if arguments.batch:
+        for record in solve_batch(collect_paths(arguments.batch),
+                                  arguments.jobs,
+                                  int(limit) if limit != '*' else None,
+                                  arguments.strategy, arguments.consistency,
+                                  arguments.count, arguments.engine,
+                                  arguments.unique, arguments.stats,
+                                  arguments.split is not None,
+                                  arguments.split or None, arguments.cache):
+            print(json.dumps(record), flush=True)
+        return
+    if arguments.snapshot is not None:
+        total = write_snapshots(arguments.snapshot, input_puzzles(arguments),
+                                consistency=arguments.consistency)
+        print('Snapshots written to {0}: {1}.'
+              .format(arguments.snapshot, total))
+        return
+    if arguments.split is not None:
+        raise ValueError('Puzzle streams can only be split in batch mode '
+                         'or when writing snapshots.')
+    if arguments.jobs > 1 and arguments.engine != 'search':
+        raise ValueError('Parallel solving of one puzzle is only available '
+                         'for the search engine.')
+    if arguments.table < 0:
+        raise ValueError('Transposition table size must not be negative.')
+    table = (TranspositionTable(arguments.table << 20)
+             if arguments.table and arguments.jobs == 1
+             and arguments.engine == 'search' else None)
+    tracer = Profiler(table) if arguments.stats else None
+    started = time.perf_counter()
+    puzzle, flags = (load_puzzle(arguments.file) if arguments.file
+                     else (make_puzzle(sys.stdin), 0))
+    parsed = time.perf_counter()
+    if not flags & CHECKED:
         check_puzzle(puzzle)
-        solutions = enumerate(solve_puzzle(puzzle), start=1)
-        solutions = (Iterable(solutions).take(int(limit))
-                     if limit != '*' else solutions)
-        for pair in solutions:
-            print('Solution #{0}'.format(pair[0]))
-            print_puzzle(pair[1])
-            print()
+    if tracer is not None:
+        tracer.phase('parse', parsed - started)
+        tracer.phase('check', time.perf_counter() - parsed)
+    if arguments.decode is not None:
+        decode(arguments, puzzle)
+        return
+    if arguments.compare:
+        print_comparison(compare_strategies(
+            puzzle, int(limit) if limit != '*' else None,
+            arguments.consistency))
+        return
+    cache = (SolutionCache(arguments.cache) if arguments.cache is not None
+             else None)
+    writer = SolutionWriter(sys.stdout.buffer, arguments.format)
+    try:
+        solve(arguments, puzzle, writer, table, tracer,
+              bool(flags & PROPAGATED), cache)
+    finally:
+        writer.flush()
+        if tracer is not None:
+            print_statistics(tracer.report())
+        if table is not None:
+            print_table(table)
+        if cache is not None:
+            if arguments.stats:
+                print_cache(cache)
+            cache.close()
 
 
 if __name__ == '__main__':
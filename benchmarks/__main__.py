@@ -0,0 +1,129 @@
+import argparse
+import json
+import os
+import sys
+
+from benchmarks.compare import compare_results, reference_scale
+from benchmarks.iterable import MICROBENCHMARKS, run_microbenchmarks
+from benchmarks.runner import (PHASES, ROOT, collect_corpus,
+                               run_benchmarks)
+
+BASELINE = os.path.join(ROOT, 'benchmarks', 'baseline.json')
+
+
+def define_arguments() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description='Benchmarks of the cross sums solver.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='time every phase over the '
+                                          'corpus and print JSON')
+    run.add_argument('paths', metavar='PATH', nargs='*',
+                     help='puzzle files (bundled corpus by default)')
+    run.add_argument('-r', '--repeats', metavar='n', type=int, default=5,
+                     help='timed runs of every phase')
+    run.add_argument('-p', '--phases', metavar='name', nargs='+',
+                     choices=PHASES, default=[*PHASES],
+                     help='phases to run ({0})'.format(', '.join(PHASES)))
+    run.add_argument('-o', '--output', metavar='FILE',
+                     help='write JSON to file instead of standard output')
+
+    compare = commands.add_parser('compare', help='flag regressions '
+                                                  'against a baseline')
+    compare.add_argument('current', metavar='CURRENT',
+                         help='JSON written by the run command')
+    compare.add_argument('-b', '--baseline', metavar='FILE',
+                         default=BASELINE,
+                         help='baseline JSON (committed baseline by '
+                              'default)')
+    compare.add_argument('-t', '--tolerance', metavar='ratio', type=float,
+                         default=0.25,
+                         help='allowed relative slowdown or memory growth')
+    compare.add_argument('--floor', metavar='seconds', type=float,
+                         default=0.001,
+                         help='slowdowns below this are ignored as noise')
+
+    micro = commands.add_parser('micro', help='per-element overhead of '
+                                              'Iterable pipelines')
+    micro.add_argument('-n', '--size', metavar='n', type=int, default=10000,
+                       help='number of elements per pipeline')
+    micro.add_argument('-r', '--repeats', metavar='n', type=int, default=5,
+                       help='timed runs of every pipeline')
+    micro.add_argument('-b', '--benchmarks', metavar='name', nargs='+',
+                       choices=MICROBENCHMARKS, default=[*MICROBENCHMARKS],
+                       help='pipelines to run ({0})'
+                            .format(', '.join(MICROBENCHMARKS)))
+    return parser
+
+
+def print_summary(results: dict):
+    for path, phases in results['results'].items():
+        print('{0}: {1}'.format(path, ', '.join(
+            '{0} {1:.4f} s'.format(name, metrics['median'])
+            for name, metrics in phases.items())), file=sys.stderr)
+
+
+def run(arguments: argparse.Namespace):
+    paths = ([os.path.relpath(os.path.abspath(path), ROOT)
+              for path in arguments.paths]
+             if arguments.paths else collect_corpus())
+    results = run_benchmarks(paths, arguments.repeats,
+                             {name: PHASES[name]
+                              for name in arguments.phases})
+    print_summary(results)
+    if arguments.output is None:
+        print(json.dumps(results, indent=2))
+        return
+    with open(arguments.output, 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2)
+        file.write('\n')
+
+
+def compare(arguments: argparse.Namespace) -> int:
+    with open(arguments.baseline, encoding='utf-8') as file:
+        baseline = json.load(file)
+    with open(arguments.current, encoding='utf-8') as file:
+        current = json.load(file)
+    regressions = compare_results(baseline, current, arguments.tolerance,
+                                  arguments.floor)
+    print('Baseline times scaled by {0:.2f}x to match the reference '
+          'workload of this run.'.format(reference_scale(baseline, current)))
+    for regression in regressions:
+        print('{0} {1} {2}: {3:.6g} -> {4:.6g} ({5:.2f}x)'
+              .format(regression.file, regression.phase, regression.metric,
+                      regression.baseline, regression.current,
+                      regression.ratio))
+    if not regressions:
+        print('No regressions beyond {0:.0%} tolerance.'
+              .format(arguments.tolerance))
+    return 1 if regressions else 0
+
+
+def micro(arguments: argparse.Namespace):
+    results = run_microbenchmarks(arguments.size, arguments.repeats,
+                                  {name: MICROBENCHMARKS[name]
+                                   for name in arguments.benchmarks})
+    for name, result in results.items():
+        print('{0}: {1:.1f} ns Iterable, {2:.1f} ns comprehension per '
+              'element ({3:.2f}x)'.format(name, result['iterable'] * 1e9,
+                                          result['comprehension'] * 1e9,
+                                          result['overhead']))
+
+
+def main(parser: argparse.ArgumentParser) -> int:
+    arguments = parser.parse_args()
+    if arguments.command == 'run':
+        run(arguments)
+        return 0
+    if arguments.command == 'micro':
+        micro(arguments)
+        return 0
+    return compare(arguments)
+
+
+if __name__ == '__main__':
+    try:
+        sys.exit(main(define_arguments()))
+    except (OSError, ValueError) as exception:
+        print(str(exception), file=sys.stderr)
+        sys.exit(2)
@@ -0,0 +1,71 @@
+__all__ = ['METRICS', 'check_environment', 'reference_scale', 'Regression',
+           'compare_results']
+
+METRICS = ('median', 'peak')
+
+
+def check_environment(baseline: dict, current: dict):
+    versions = (baseline.get('python'), current.get('python'))
+    if (None not in versions
+            and versions[0].split('.')[:2] != versions[1].split('.')[:2]):
+        raise ValueError('Baseline was recorded with Python {0}, but this '
+                         'run used Python {1}. Regenerate the baseline '
+                         'locally.'.format(*versions))
+    machines = (baseline.get('machine'), current.get('machine'))
+    if None not in machines and machines[0] != machines[1]:
+        raise ValueError('Baseline was recorded on {0}, but this run used '
+                         '{1}. Regenerate the baseline locally.'
+                         .format(*machines))
+
+
+def reference_scale(baseline: dict, current: dict) -> float:
+    if baseline.get('reference') and current.get('reference'):
+        return current['reference'] / baseline['reference']
+    return 1.0
+
+
+class Regression:
+    __slots__ = ('file', 'phase', 'metric', 'baseline', 'current')
+
+    def __init__(self, file: str, phase: str, metric: str, baseline: float,
+                 current: float):
+        self.file = file
+        self.phase = phase
+        self.metric = metric
+        self.baseline = baseline
+        self.current = current
+
+    def __repr__(self) -> str:
+        return ('Regression(file={0!r}, phase={1!r}, metric={2!r}, '
+                'baseline={3!r}, current={4!r})'
+                .format(self.file, self.phase, self.metric, self.baseline,
+                        self.current))
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float('inf')
+
+
+def compare_results(baseline: dict, current: dict, tolerance: float = 0.25,
+                    floor: float = 0.001) -> list:
+    if tolerance < 0:
+        raise ValueError('Tolerance must not be negative.')
+    check_environment(baseline, current)
+    scale = reference_scale(baseline, current)
+    regressions = []
+    for path, phases in current['results'].items():
+        for phase, metrics in phases.items():
+            expected = baseline['results'].get(path, {}).get(phase)
+            if expected is None:
+                continue
+            for metric in METRICS:
+                reference = expected[metric] * (scale if metric == 'median'
+                                                else 1)
+                limit = reference * (1 + tolerance)
+                if metric == 'median':
+                    limit = max(limit, reference + floor)
+                if metrics[metric] > limit:
+                    regressions.append(Regression(path, phase, metric,
+                                                  reference,
+                                                  metrics[metric]))
+    return regressions
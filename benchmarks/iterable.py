@@ -0,0 +1,67 @@
+import timeit
+
+from utilities.iterable import Iterable
+
+__all__ = ['MICROBENCHMARKS', 'time_per_element', 'run_microbenchmarks']
+
+
+def increment(entry: int) -> int:
+    return entry + 1
+
+
+def double(entry: int) -> int:
+    return entry * 2
+
+
+def is_odd(entry: int) -> bool:
+    return entry & 1 == 1
+
+
+def is_last(entry: int) -> bool:
+    return entry == -1
+
+
+MICROBENCHMARKS = {
+    'to_tuple': (lambda data: Iterable(data).to_tuple(),
+                 lambda data: tuple(entry for entry in data)),
+    'map': (lambda data: Iterable(data).map(increment).to_tuple(),
+            lambda data: tuple(increment(entry) for entry in data)),
+    'map_map': (lambda data: Iterable(data).map(increment, double).to_tuple(),
+                lambda data: tuple(double(increment(entry))
+                                   for entry in data)),
+    'map_filter': (lambda data: Iterable(data).map(increment).filter(is_odd)
+                   .to_tuple(),
+                   lambda data: tuple(value for value in (
+                       increment(entry) for entry in data) if is_odd(value))),
+    'filter_map': (lambda data: Iterable(data).filter(is_odd).map(increment)
+                   .to_tuple(),
+                   lambda data: tuple(increment(entry) for entry in data
+                                      if is_odd(entry))),
+    'count': (lambda data: Iterable(data).count(is_odd),
+              lambda data: sum(1 for entry in data if is_odd(entry))),
+    'first_or_default': (lambda data: Iterable(data)
+                         .first_or_default(is_last),
+                         lambda data: next((entry for entry in data
+                                            if is_last(entry)), None)),
+    'distinct': (lambda data: Iterable(data).distinct().to_tuple(),
+                 lambda data: tuple(dict.fromkeys(data)))}
+
+
+def time_per_element(function, data: list, repeats: int) -> float:
+    timer = timeit.Timer(lambda: function(data))
+    number = max(1, 100000 // max(1, len(data)))
+    return min(timer.repeat(repeats, number)) / number / max(1, len(data))
+
+
+def run_microbenchmarks(size: int = 10000, repeats: int = 5,
+                        benchmarks=MICROBENCHMARKS) -> dict:
+    if size < 1 or repeats < 1:
+        raise ValueError('Size and repeats must be positive.')
+    data = [entry % (size // 2 + 1) for entry in range(size)]
+    results = {}
+    for name, (pipeline, comprehension) in benchmarks.items():
+        iterable = time_per_element(pipeline, data, repeats)
+        plain = time_per_element(comprehension, data, repeats)
+        results[name] = {'iterable': iterable, 'comprehension': plain,
+                         'overhead': iterable / plain if plain else 0.0}
+    return results
@@ -0,0 +1,125 @@
+import glob
+import os
+import platform
+import time
+import tracemalloc
+from io import StringIO
+from statistics import median
+
+from logic.error_checker import check_puzzle
+from logic.propagation import exclude_state, reduce_state
+from logic.puzzle_maker import make_puzzle
+from logic.solver import solve_puzzle
+from logic.state import State
+
+__all__ = ['ROOT', 'CORPUS', 'PHASES', 'collect_corpus', 'percentile',
+           'time_phase', 'peak_memory', 'summarize', 'reference_workload',
+           'time_reference', 'run_benchmarks']
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORPUS = (os.path.join('test_resources', '*.txt'),
+          os.path.join('benchmarks', 'corpus', '*.txt'))
+
+
+def parse(text: str) -> dict:
+    return make_puzzle(StringIO(text))
+
+
+def check(text: str) -> dict:
+    puzzle = parse(text)
+    check_puzzle(puzzle)
+    return puzzle
+
+
+def probe(state: State) -> State:
+    return exclude_state(state.copy())
+
+
+def first_solution(puzzle: dict) -> dict:
+    return next(solve_puzzle(puzzle))
+
+
+def enumerate_solutions(puzzle: dict) -> int:
+    return sum(1 for _ in solve_puzzle(puzzle))
+
+
+PHASES = {'parse': (parse, lambda text: text),
+          'check': (check, lambda text: text),
+          'propagation': (reduce_state, lambda text: State(parse(text))),
+          'probing': (probe, lambda text: reduce_state(State(parse(text)))),
+          'first': (first_solution, parse),
+          'enumeration': (enumerate_solutions, parse)}
+
+
+def collect_corpus(patterns=CORPUS, root: str = ROOT) -> list:
+    return [os.path.relpath(path, root) for pattern in patterns
+            for path in sorted(glob.glob(os.path.join(root, pattern)))]
+
+
+def percentile(times: list, fraction: float) -> float:
+    ordered = sorted(times)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (
+        position - lower)
+
+
+def time_phase(function, prepare, text: str) -> float:
+    argument = prepare(text)
+    started = time.perf_counter()
+    function(argument)
+    return time.perf_counter() - started
+
+
+def peak_memory(function, prepare, text: str) -> int:
+    argument = prepare(text)
+    tracemalloc.start()
+    try:
+        function(argument)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def summarize(times: list, peak: int) -> dict:
+    return {'median': median(times), 'p90': percentile(times, 0.9),
+            'min': min(times), 'peak': peak}
+
+
+def reference_workload(size: int = 20000) -> dict:
+    table = {}
+    for value in range(size):
+        key = value & 1023
+        table[key] = table.get(key, 0) + (value ^ value >> 3)
+    return table
+
+
+def time_reference(size: int = 20000) -> float:
+    started = time.perf_counter()
+    reference_workload(size)
+    return time.perf_counter() - started
+
+
+def run_benchmarks(paths, repeats: int = 5, phases=PHASES,
+                   root: str = ROOT) -> dict:
+    if repeats < 1:
+        raise ValueError('Repeats must be positive.')
+    texts = {}
+    for path in paths:
+        with open(os.path.join(root, path), encoding='utf-8') as file:
+            texts[path.replace(os.sep, '/')] = file.read()
+    times = {path: {name: [] for name in phases} for path in texts}
+    references = []
+    for _ in range(repeats):
+        references.append(time_reference())
+        for path, text in texts.items():
+            for name, (function, prepare) in phases.items():
+                times[path][name].append(time_phase(function, prepare, text))
+    return {'python': platform.python_version(),
+            'machine': platform.machine(),
+            'repeats': repeats,
+            'reference': median(references),
+            'results': {path: {name: summarize(
+                times[path][name], peak_memory(*phases[name], text))
+                for name in phases} for path, text in texts.items()}}
@@ -1 +1,5 @@
-__all__ = ['converter', 'error_checker', 'puzzle_maker', 'solver']
+__all__ = ['batch', 'cache', 'cdcl', 'combinations', 'converter',
+           'decomposition', 'domain', 'error_checker', 'generator', 'grid',
+           'heuristics', 'layout', 'parallel', 'propagation', 'puzzle_maker',
+           'sat', 'search', 'snapshot', 'solver', 'state', 'tracing',
+           'transposition', 'writer']
@@ -0,0 +1,126 @@
+import glob
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+
+from logic.cache import (cached_count, cached_solutions, cached_uniqueness,
+                         open_cache)
+from logic.converter import convert_puzzle
+from logic.error_checker import check_puzzle
+from logic.exceptions import UnsolvablePuzzleError
+from logic.snapshot import CHECKED, PROPAGATED, load_puzzle, load_puzzles
+from logic.solver import check_uniqueness, count_solutions, solve_puzzle
+from logic.tracing import Profiler
+
+__all__ = ['collect_paths', 'solve_record', 'solve_file', 'split_files',
+           'solve_batch']
+
+FAILURES = (OSError, SyntaxError, ValueError, UnsolvablePuzzleError)
+
+
+def collect_paths(patterns) -> list:
+    paths = {}
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = (os.path.join(pattern, name)
+                       for name in sorted(os.listdir(pattern)))
+            matches = [*filter(os.path.isfile, matches)]
+        else:
+            matches = sorted(glob.glob(pattern, recursive=True)) or [pattern]
+        paths.update(dict.fromkeys(matches))
+    return [*paths]
+
+
+def solve_record(record: dict, source, limit: int = None,
+                 strategy: str = 'first', consistency: str = 'sums',
+                 count: bool = False, engine: str = 'search',
+                 unique: bool = False, stats: bool = False,
+                 cache: str = None) -> dict:
+    start = time.perf_counter()
+    record['status'] = 'solved'
+    tracer = Profiler() if stats else None
+    try:
+        if isinstance(source, Exception):
+            raise source
+        puzzle, flags = (load_puzzle(source) if isinstance(source, str)
+                         else source)
+        if not flags & CHECKED:
+            check_puzzle(puzzle)
+        prepared = bool(flags & PROPAGATED)
+        solutions_cache = open_cache(cache) if cache is not None else None
+        if count:
+            record['count'] = cached_count(
+                solutions_cache, puzzle,
+                lambda: count_solutions(puzzle, strategy,
+                                        consistency=consistency,
+                                        engine=engine, tracer=tracer,
+                                        prepared=prepared))
+        elif unique:
+            record['uniqueness'], solutions = cached_uniqueness(
+                solutions_cache, puzzle,
+                lambda: check_uniqueness(puzzle, strategy,
+                                         consistency=consistency,
+                                         engine=engine, tracer=tracer,
+                                         prepared=prepared))
+            record['solutions'] = [[*convert_puzzle(solution)]
+                                   for solution in solutions]
+        else:
+            solutions = cached_solutions(
+                solutions_cache, puzzle, limit,
+                lambda: solve_puzzle(puzzle, strategy,
+                                     consistency=consistency, engine=engine,
+                                     tracer=tracer, prepared=prepared))
+            record['solutions'] = [[*convert_puzzle(solution)]
+                                   for solution in solutions]
+    except FAILURES as exception:
+        record.update(status='failed', error=type(exception).__name__,
+                      message=str(exception))
+    record['time'] = round(time.perf_counter() - start, 6)
+    if tracer is not None:
+        record['stats'] = tracer.report()
+    return record
+
+
+def solve_file(path: str, limit: int = None, strategy: str = 'first',
+               consistency: str = 'sums', count: bool = False,
+               engine: str = 'search', unique: bool = False,
+               stats: bool = False, cache: str = None) -> dict:
+    return solve_record({'file': path}, path, limit, strategy, consistency,
+                        count, engine, unique, stats, cache)
+
+
+def split_files(paths, delimiter: str = None):
+    for path in paths:
+        number = 0
+        try:
+            for number, entry in enumerate(load_puzzles(path, delimiter),
+                                           start=1):
+                yield {'file': path, 'puzzle': number}, entry
+        except FAILURES as exception:
+            yield {'file': path, 'puzzle': number + 1}, exception
+
+
+def solve_batch(paths, jobs: int = 1, limit: int = None,
+                strategy: str = 'first', consistency: str = 'sums',
+                count: bool = False, engine: str = 'search',
+                unique: bool = False, stats: bool = False,
+                split: bool = False, delimiter: str = None,
+                cache: str = None):
+    if jobs < 1:
+        raise ValueError('Jobs must be positive.')
+    entries = (split_files(paths, delimiter) if split else
+               (({'file': path}, path) for path in paths))
+    running = set()
+    with ProcessPoolExecutor(jobs) as executor:
+        while True:
+            for record, puzzle in islice(entries, jobs * 2 - len(running)):
+                running.add(executor.submit(solve_record, record, puzzle,
+                                            limit, strategy, consistency,
+                                            count, engine, unique, stats,
+                                            cache))
+            if not running:
+                return
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
@@ -0,0 +1,232 @@
+import hashlib
+import os
+import sqlite3
+import struct
+from array import array
+from itertools import islice
+
+from logic.grid import DIGIT, FREE, HINT, HINT_BITS, NO_SUM, Grid, to_grid
+from logic.solver import ENGINE_VERSION, UNIQUENESS
+
+__all__ = ['DATABASE', 'transpose', 'canonical_key', 'SolutionCache',
+           'open_cache', 'cached_count', 'cached_uniqueness',
+           'cached_solutions']
+
+DATABASE = 'solutions.sqlite'
+SIZE = struct.Struct('<II')
+SCHEMA = ('CREATE TABLE IF NOT EXISTS solutions (key BLOB PRIMARY KEY, '
+          'version INTEGER NOT NULL, count INTEGER, '
+          'stored INTEGER NOT NULL, solutions BLOB NOT NULL, '
+          'used INTEGER NOT NULL) WITHOUT ROWID',
+          'CREATE INDEX IF NOT EXISTS solutions_used ON solutions (used)')
+NEXT_USE = 'SELECT COALESCE(MAX(used), 0) + 1 FROM solutions'
+CACHES = {}
+
+
+def transpose(grid: Grid) -> Grid:
+    height, width = grid.height, grid.width
+    transposed = Grid.__new__(Grid)
+    transposed.height, transposed.width = width, height
+    transposed.kinds = bytearray().join(grid.kinds[column::width]
+                                        for column in range(width))
+    contents = array(grid.contents.typecode)
+    for column in range(width):
+        contents.extend(grid.contents[column::width])
+    for index, kind in enumerate(transposed.kinds):
+        if kind == HINT:
+            packed = contents[index]
+            contents[index] = packed >> HINT_BITS | (packed & NO_SUM) << (
+                HINT_BITS)
+    transposed.contents = contents
+    return transposed
+
+
+def serialize(grid: Grid) -> bytes:
+    contents = array(grid.contents.typecode, grid.contents)
+    for index, kind in enumerate(grid.kinds):
+        if kind == FREE:
+            contents[index] = 0
+    return SIZE.pack(grid.height, grid.width) + grid.kinds + contents.tobytes()
+
+
+def canonical_key(puzzle: dict) -> tuple:
+    grid = to_grid(puzzle)
+    transposed = transpose(grid)
+    data, other = serialize(grid), serialize(transposed)
+    if other < data:
+        data = other
+        cells = tuple((column, row)
+                      for row, column in transposed.positions(FREE))
+    else:
+        cells = grid.positions(FREE)
+    return hashlib.blake2b(data, digest_size=16).digest(), cells
+
+
+class SolutionCache:
+    __slots__ = ('path', 'capacity', 'keep', 'connection', 'hits',
+                 'misses', 'evictions')
+
+    def __init__(self, directory: str, capacity: int = 1 << 16,
+                 keep: int = 16):
+        if capacity < 1 or keep < 0:
+            raise ValueError('Cache capacity must be positive and the '
+                             'number of kept solutions non-negative.')
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, DATABASE)
+        self.capacity = capacity
+        self.keep = keep
+        self.connection = sqlite3.connect(self.path, timeout=60,
+                                          isolation_level=None)
+        self.connection.execute('PRAGMA journal_mode = WAL')
+        self.connection.execute('PRAGMA synchronous = NORMAL')
+        for statement in SCHEMA:
+            self.connection.execute(statement)
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return self.connection.execute(
+            'SELECT COUNT(*) FROM solutions').fetchone()[0]
+
+    def __repr__(self) -> str:
+        return ('SolutionCache(path={0!r}, hits={1}, misses={2}, '
+                'evictions={3})'.format(self.path, self.hits, self.misses,
+                                        self.evictions))
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def close(self):
+        self.connection.close()
+
+    def entry(self, key: tuple):
+        row = self.connection.execute(
+            'SELECT count, stored, solutions FROM solutions '
+            'WHERE key = ? AND version = ?',
+            (key[0], ENGINE_VERSION)).fetchone()
+        if row is not None:
+            self.connection.execute(
+                'UPDATE solutions SET used = ({0}) WHERE key = ?'
+                .format(NEXT_USE), (key[0],))
+        return row
+
+    def count(self, key: tuple):
+        row = self.entry(key)
+        if row is None or row[0] is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[0]
+
+    def solutions(self, key: tuple, puzzle: dict, limit: int = None,
+                  empty: bool = True):
+        row = self.entry(key)
+        if row is not None and (empty or row[0] != 0):
+            total, stored, data = row
+            if (limit is not None and stored >= limit
+                    or total is not None and stored == total):
+                self.hits += 1
+                return decode_solutions(puzzle, key[1], data, stored,
+                                        limit)
+        self.misses += 1
+        return None
+
+    def put(self, key: tuple, solutions=(), count: int = None):
+        solutions = solutions[:self.keep]
+        data = b''.join(bytes(solution[cell] for cell in key[1])
+                        for solution in solutions)
+        connection = self.connection
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            row = connection.execute(
+                'SELECT count, stored, solutions FROM solutions '
+                'WHERE key = ? AND version = ?',
+                (key[0], ENGINE_VERSION)).fetchone()
+            stored = len(solutions)
+            if row is not None:
+                count = row[0] if count is None else count
+                if row[1] > stored:
+                    stored, data = row[1], row[2]
+            connection.execute(
+                'INSERT OR REPLACE INTO solutions '
+                'VALUES (?, ?, ?, ?, ?, ({0}))'.format(NEXT_USE),
+                (key[0], ENGINE_VERSION, count, stored, data))
+            if row is None:
+                self.evict()
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+
+    def evict(self):
+        excess = len(self) - self.capacity
+        if excess > 0:
+            self.evictions += self.connection.execute(
+                'DELETE FROM solutions WHERE key IN (SELECT key FROM '
+                'solutions ORDER BY used LIMIT ?)', (excess,)).rowcount
+
+
+def decode_solutions(puzzle: dict, cells: tuple, data: bytes, stored: int,
+                     limit: int = None) -> tuple:
+    grid, length = to_grid(puzzle), len(cells)
+    indices = [grid.index(cell) for cell in cells]
+    solutions = []
+    for number in range(stored if limit is None else min(stored, limit)):
+        solution = grid.copy()
+        digits = data[number * length:(number + 1) * length]
+        for index, digit in zip(indices, digits):
+            solution.kinds[index] = DIGIT
+            solution.contents[index] = digit
+        solutions.append(solution)
+    return tuple(solutions)
+
+
+def open_cache(directory: str) -> SolutionCache:
+    cache = CACHES.get(directory)
+    if cache is None:
+        cache = CACHES[directory] = SolutionCache(directory)
+    return cache
+
+
+def cached_count(cache: SolutionCache, puzzle: dict, counter) -> int:
+    if cache is None:
+        return counter()
+    key = canonical_key(puzzle)
+    total = cache.count(key)
+    if total is None:
+        total = counter()
+        cache.put(key, count=total)
+    return total
+
+
+def cached_uniqueness(cache: SolutionCache, puzzle: dict, checker) -> tuple:
+    if cache is None:
+        return checker()
+    key = canonical_key(puzzle)
+    solutions = cache.solutions(key, puzzle, 2)
+    if solutions is not None:
+        return UNIQUENESS[len(solutions)], solutions
+    status, solutions = checker()
+    cache.put(key, solutions, len(solutions) if len(solutions) < 2 else None)
+    return status, solutions
+
+
+def cached_solutions(cache: SolutionCache, puzzle: dict, limit: int,
+                     solver):
+    if cache is None:
+        yield from islice(solver(), limit)
+        return
+    key = canonical_key(puzzle)
+    solutions = cache.solutions(key, puzzle, limit, False)
+    if solutions is not None:
+        yield from solutions
+        return
+    found, number = [], 0
+    for solution in islice(solver(), limit):
+        number += 1
+        if number <= cache.keep:
+            found.append(solution)
+        yield solution
+    cache.put(key, found,
+              number if limit is None or number < limit else None)
@@ -0,0 +1,234 @@
+from heapq import heappop, heappush
+
+__all__ = ['luby', 'Solver']
+
+RESTART_INTERVAL = 100
+ACTIVITY_DECAY = 0.95
+ACTIVITY_LIMIT = 1e100
+
+
+def luby(index: int) -> int:
+    size, exponent = 1, 0
+    while size < index + 1:
+        size, exponent = 2 * size + 1, exponent + 1
+    while size - 1 != index:
+        size = (size - 1) >> 1
+        exponent -= 1
+        index %= size
+    return 1 << exponent
+
+
+def code(literal: int) -> int:
+    return literal << 1 if literal > 0 else -literal << 1 | 1
+
+
+class Solver:
+    __slots__ = ('assigns', 'levels', 'reasons', 'activity', 'phases',
+                 'watches', 'clauses', 'learned', 'trail', 'limits', 'head',
+                 'heap', 'increment', 'unsatisfiable', 'decisions',
+                 'conflicts', 'restarts')
+
+    def __init__(self):
+        self.assigns = [0]
+        self.levels = [0]
+        self.reasons = [None]
+        self.activity = [0.0]
+        self.phases = [False]
+        self.watches = [[], []]
+        self.clauses = []
+        self.learned = []
+        self.trail = []
+        self.limits = []
+        self.head = 0
+        self.heap = []
+        self.increment = 1.0
+        self.unsatisfiable = False
+        self.decisions = self.conflicts = self.restarts = 0
+
+    def new_variable(self) -> int:
+        variable = len(self.assigns)
+        self.assigns.append(0)
+        self.levels.append(0)
+        self.reasons.append(None)
+        self.activity.append(0.0)
+        self.phases.append(False)
+        self.watches += [[], []]
+        heappush(self.heap, (0.0, variable))
+        return variable
+
+    def value(self, literal: int) -> int:
+        value = self.assigns[abs(literal)]
+        return value if literal > 0 else -value
+
+    def add_clause(self, literals) -> bool:
+        if self.unsatisfiable:
+            return False
+        self.backtrack(0)
+        clause = []
+        for literal in dict.fromkeys(literals):
+            if -literal in clause or self.value(literal) > 0:
+                return True
+            if not self.value(literal):
+                clause.append(literal)
+        if not clause:
+            self.unsatisfiable = True
+        elif len(clause) == 1:
+            self.enqueue(clause[0], None)
+            self.unsatisfiable = self.propagate() is not None
+        else:
+            self.attach(clause)
+            self.clauses.append(clause)
+        return not self.unsatisfiable
+
+    def attach(self, clause: list):
+        self.watches[code(clause[0])].append(clause)
+        self.watches[code(clause[1])].append(clause)
+
+    def enqueue(self, literal: int, reason):
+        variable = abs(literal)
+        self.assigns[variable] = 1 if literal > 0 else -1
+        self.levels[variable] = len(self.limits)
+        self.reasons[variable] = reason
+        self.trail.append(literal)
+
+    def propagate(self):
+        assigns, watches, trail = self.assigns, self.watches, self.trail
+        while self.head < len(trail):
+            false = -trail[self.head]
+            self.head += 1
+            watchers = watches[code(false)]
+            watches[code(false)] = kept = []
+            for position, clause in enumerate(watchers):
+                if clause[0] == false:
+                    clause[0], clause[1] = clause[1], false
+                first = clause[0]
+                first_value = (assigns[first] if first > 0
+                               else -assigns[-first])
+                if first_value > 0:
+                    kept.append(clause)
+                    continue
+                for index in range(2, len(clause)):
+                    other = clause[index]
+                    if (assigns[other] if other > 0
+                            else -assigns[-other]) >= 0:
+                        clause[1], clause[index] = other, false
+                        watches[code(other)].append(clause)
+                        break
+                else:
+                    kept.append(clause)
+                    if first_value < 0:
+                        kept += watchers[position + 1:]
+                        self.head = len(trail)
+                        return clause
+                    self.enqueue(first, clause)
+        return None
+
+    def bump(self, variable: int):
+        self.activity[variable] += self.increment
+        if self.activity[variable] > ACTIVITY_LIMIT:
+            self.activity = [activity / ACTIVITY_LIMIT
+                             for activity in self.activity]
+            self.increment /= ACTIVITY_LIMIT
+            self.heap = [(-activity, index) for index, activity
+                         in enumerate(self.activity) if index]
+            self.heap.sort()
+        if not self.assigns[variable]:
+            heappush(self.heap, (-self.activity[variable], variable))
+
+    def analyze(self, conflict: list) -> tuple:
+        levels, reasons, trail = self.levels, self.reasons, self.trail
+        level = len(self.limits)
+        seen, learned = set(), [0]
+        pending, index, literal, clause = 0, len(trail) - 1, 0, conflict
+        while True:
+            for other in clause if not literal else clause[1:]:
+                variable = abs(other)
+                if variable not in seen and levels[variable]:
+                    seen.add(variable)
+                    self.bump(variable)
+                    if levels[variable] == level:
+                        pending += 1
+                    else:
+                        learned.append(other)
+            while abs(trail[index]) not in seen:
+                index -= 1
+            literal = trail[index]
+            index -= 1
+            clause = reasons[abs(literal)]
+            pending -= 1
+            if not pending:
+                break
+        learned[0] = -literal
+
+        backjump = 0
+        if len(learned) > 1:
+            highest = max(range(1, len(learned)),
+                          key=lambda position: levels[abs(learned[position])])
+            learned[1], learned[highest] = learned[highest], learned[1]
+            backjump = levels[abs(learned[1])]
+        return learned, backjump
+
+    def backtrack(self, level: int):
+        if len(self.limits) <= level:
+            return
+        assigns, phases, activity = self.assigns, self.phases, self.activity
+        for literal in self.trail[self.limits[level]:]:
+            variable = abs(literal)
+            assigns[variable] = 0
+            self.reasons[variable] = None
+            phases[variable] = literal > 0
+            heappush(self.heap, (-activity[variable], variable))
+        del self.trail[self.limits[level]:]
+        del self.limits[level:]
+        self.head = len(self.trail)
+
+    def pick(self):
+        while self.heap:
+            variable = heappop(self.heap)[1]
+            if not self.assigns[variable]:
+                return variable
+        return None
+
+    def solve(self, limit: int = None):
+        if self.unsatisfiable:
+            return False
+        budget = luby(self.restarts) * RESTART_INTERVAL
+        while True:
+            conflict = self.propagate()
+            if conflict is not None:
+                self.conflicts += 1
+                budget -= 1
+                if not self.limits:
+                    self.unsatisfiable = True
+                    return False
+                if limit is not None:
+                    limit -= 1
+                    if limit < 0:
+                        self.backtrack(0)
+                        return None
+                learned, level = self.analyze(conflict)
+                self.backtrack(level)
+                if len(learned) == 1:
+                    self.enqueue(learned[0], None)
+                else:
+                    self.attach(learned)
+                    self.learned.append(learned)
+                    self.enqueue(learned[0], learned)
+                self.increment /= ACTIVITY_DECAY
+                continue
+            if budget <= 0:
+                self.restarts += 1
+                budget = luby(self.restarts) * RESTART_INTERVAL
+                self.backtrack(0)
+                continue
+            variable = self.pick()
+            if variable is None:
+                return True
+            self.decisions += 1
+            self.limits.append(len(self.trail))
+            self.enqueue(variable if self.phases[variable] else -variable,
+                         None)
+
+    def model(self) -> set:
+        return {variable for variable, value in enumerate(self.assigns)
+                if value > 0}
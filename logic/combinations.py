@@ -0,0 +1,86 @@
+from time import perf_counter
+
+from logic import domain
+
+__all__ = ['MAXIMUM_SUM', 'BUILD_TIME', 'subsets', 'lookup',
+           'possible_digits', 'required_digits', 'count_combinations']
+
+MAXIMUM_SUM = sum(domain.DIGITS)
+_lengths = len(domain.DIGITS) + 1
+_masks = domain.FULL_DOMAIN + 1
+
+
+def _index(summary: int, length: int, restricted: int) -> int:
+    return (summary * _lengths + length) * _masks + restricted
+
+
+def _build_table():
+    groups = [[[] for _ in range(_lengths)] for _ in range(MAXIMUM_SUM + 1)]
+    for mask in range(_masks):
+        digits = domain.to_digits(mask)
+        groups[sum(digits)][len(digits)].append(mask)
+
+    size = (MAXIMUM_SUM + 1) * _lengths * _masks
+    unions, required, counts = [0] * size, [0] * size, [0] * size
+    for summary in range(MAXIMUM_SUM + 1):
+        for length in range(_lengths):
+            group = groups[summary][length]
+            if not group:
+                continue
+            for restricted in range(_masks):
+                union, common, count = 0, domain.FULL_DOMAIN, 0
+                for mask in group:
+                    if not mask & restricted:
+                        union |= mask
+                        common &= mask
+                        count += 1
+                if count:
+                    index = _index(summary, length, restricted)
+                    unions[index] = union
+                    required[index] = common
+                    counts[index] = count
+
+    groups = tuple(tuple(map(tuple, row)) for row in groups)
+    return groups, tuple(unions), tuple(required), tuple(counts)
+
+
+_started = perf_counter()
+_groups, _unions, _required, _counts = _build_table()
+BUILD_TIME = perf_counter() - _started
+
+
+def _is_present(summary: int, length: int) -> bool:
+    return 0 <= summary <= MAXIMUM_SUM and 0 <= length < _lengths
+
+
+def subsets(summary: int, length: int) -> tuple:
+    return _groups[summary][length] if _is_present(summary, length) else ()
+
+
+def lookup(summary: int, length: int,
+           restricted: int = domain.EMPTY_DOMAIN) -> tuple:
+    if not _is_present(summary, length):
+        return 0, 0, 0
+    index = _index(summary, length, restricted)
+    return _unions[index], _required[index], _counts[index]
+
+
+def possible_digits(summary: int, length: int,
+                    restricted: int = domain.EMPTY_DOMAIN) -> int:
+    if not _is_present(summary, length):
+        return domain.EMPTY_DOMAIN
+    return _unions[_index(summary, length, restricted)]
+
+
+def required_digits(summary: int, length: int,
+                    restricted: int = domain.EMPTY_DOMAIN) -> int:
+    if not _is_present(summary, length):
+        return domain.EMPTY_DOMAIN
+    return _required[_index(summary, length, restricted)]
+
+
+def count_combinations(summary: int, length: int,
+                       restricted: int = domain.EMPTY_DOMAIN) -> int:
+    if not _is_present(summary, length):
+        return 0
+    return _counts[_index(summary, length, restricted)]
@@ -1,5 +1,7 @@
 from utilities.iterable import Iterable
 from functools import singledispatch
+from logic import domain
+from logic.grid import Grid, to_grid
 
 
 @singledispatch
@@ -10,11 +12,19 @@ def convert_to_token(item) -> str:
 
 # noinspection PyUnresolvedReferences
 @convert_to_token.register(int)
-@convert_to_token.register(set)
 def _(item) -> str:
     return str(item)
 
 
+# noinspection PyUnresolvedReferences
+@convert_to_token.register(set)
+def _(item) -> str:
+    mask = domain.mask_of(item)
+    if mask == domain.FULL_DOMAIN:
+        return '_'
+    return '{{{0}}}'.format(', '.join(map(str, domain.to_digits(mask))))
+
+
 # noinspection PyUnresolvedReferences
 @convert_to_token.register(tuple)
 def _(item) -> str:
@@ -23,25 +33,23 @@ def _(item) -> str:
                           '' if element is None else str(element)))
 
 
+def convert_cells(grid: Grid) -> list:
+    tokens, converted = {}, []
+    for index, key in enumerate(zip(grid.kinds, grid.contents)):
+        token = tokens.get(key)
+        if token is None:
+            token = tokens[key] = convert_to_token(grid.decode(index))
+        converted.append(token)
+    return converted
+
+
 def convert_puzzle(puzzle: dict):
     def yield_strings():
-        maximum_length = (Iterable(puzzle.values())
-                          .map(convert_to_token, len)
-                          .max())
-
-        converted = ''
-        height, width = (Iterable(Iterable(puzzle)
-                                  .map(lambda subject: subject[position])
-                                  .max()
-                                  for position in range(2))
-                         .map(lambda subject: subject + 1))
-
-        for x in range(height):
-            for y in range(width):
-                token = convert_to_token(puzzle.get((x, y)))
-                tabulation = ' ' * (maximum_length - len(token) + 1)
-                converted += token + tabulation
-            yield converted
-            converted = ''
+        tokens = convert_cells(grid)
+        length = max(map(len, tokens), default=0) + 1
+        for row in range(grid.height):
+            yield ''.join(token.ljust(length) for token in tokens[
+                row * grid.width:(row + 1) * grid.width])
 
+    grid = to_grid(puzzle)
     return [*yield_strings()]
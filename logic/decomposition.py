@@ -0,0 +1,149 @@
+from utilities.iterable import Iterable
+from logic import domain
+from logic.exceptions import UnsolvablePuzzleError
+from logic.heuristics import make_strategy
+from logic.search import SearchStatistics, count, search
+from logic.state import State
+from logic.transposition import TranspositionTable
+
+__all__ = ['find_components', 'component_puzzle', 'lazy_product',
+           'yield_component_solutions', 'solve_components',
+           'count_components']
+
+
+def find_components(state: State) -> list:
+    values, neighbors = state.values, state.layout.neighbors
+    visited = [False] * len(values)
+    components = []
+    for start, value in enumerate(values):
+        if value or visited[start]:
+            continue
+        visited[start] = True
+        component = [start]
+        for cell in component:
+            for neighbor in neighbors[cell]:
+                if not values[neighbor] and not visited[neighbor]:
+                    visited[neighbor] = True
+                    component.append(neighbor)
+        components.append(tuple(sorted(component)))
+    return components
+
+
+def component_puzzle(state: State, component: tuple) -> dict:
+    layout, values, domains = state.layout, state.values, state.domains
+    numbers = {number for cell in component
+               for number in layout.cell_numbers[cell]}
+    puzzle = {}
+    for number in sorted(numbers):
+        block = layout.blocks[number]
+        hint = [*puzzle.get(block.hint, (None, None))]
+        hint[block.horizontal] = block.summary
+        puzzle[block.hint] = tuple(hint)
+    cells = {cell for number in numbers
+             for cell in layout.blocks[number].cells}
+    for cell in sorted(cells):
+        puzzle[layout.cells[cell]] = (values[cell] if values[cell] else
+                                      domain.to_set(domains[cell]))
+    return puzzle
+
+
+def lazy_product(*iterables):
+    def entries(position: int):
+        cache, index = caches[position], 0
+        while True:
+            if index == len(cache):
+                entry = next(iterators[position], cache)
+                if entry is cache:
+                    return
+                cache.append(entry)
+            yield cache[index]
+            index += 1
+
+    def generator(position: int, prefix: tuple):
+        if position == len(iterators):
+            yield prefix
+            return
+        for entry in (iterators[0] if not position else entries(position)):
+            yield from generator(position + 1, (*prefix, entry))
+
+    iterators = [iter(iterable) for iterable in iterables]
+    caches = [[] for _ in iterators]
+    try:
+        for position in range(1, len(iterators)):
+            if next(entries(position), caches) is caches:
+                return
+        yield from generator(0, ())
+    finally:
+        for iterator in iterators:
+            getattr(iterator, 'close', lambda: None)()
+
+
+def yield_component_solutions(state: State, component: tuple,
+                              strategy: str = 'first',
+                              statistics: SearchStatistics = None,
+                              table: TranspositionTable = None):
+    component_state = State(component_puzzle(state, component),
+                            consistency=state.consistency,
+                            tracer=state.tracer)
+    indices = [component_state.layout.indices[state.layout.cells[cell]]
+               for cell in component]
+    progress = SearchStatistics()
+    try:
+        for solution in search(component_state, progress,
+                               make_strategy(strategy), table):
+            yield tuple(solution.values[index] for index in indices)
+    finally:
+        if statistics is not None:
+            statistics.nodes += progress.nodes
+            statistics.backtracks += progress.backtracks
+
+
+def are_solved_blocks_valid(state: State) -> bool:
+    totals = state.totals
+    return all(totals.sums[number] == block.summary
+               for number, block in enumerate(state.layout.blocks)
+               if not totals.remaining[number])
+
+
+def solve_components(puzzle: dict, state: State, components: list,
+                     strategy: str = 'first',
+                     statistics: SearchStatistics = None,
+                     table: TranspositionTable = None):
+    statistics = SearchStatistics() if statistics is None else statistics
+    coordinates = [state.layout.cells[cell]
+                   for cell in Iterable(components).chain()]
+    base = state.to_puzzle(puzzle)
+    found_solution = False
+    if are_solved_blocks_valid(state):
+        for solutions in lazy_product(*(
+                yield_component_solutions(state, component, strategy,
+                                          statistics, table)
+                for component in components)):
+            found_solution = True
+            statistics.solutions += 1
+            solution = base.copy()
+            solution.update(zip(coordinates, Iterable(solutions).chain()))
+            yield solution
+    if not found_solution:
+        raise UnsolvablePuzzleError('No solutions were found via brute force.')
+
+
+def count_components(state: State, components: list,
+                     strategy: str = 'first',
+                     statistics: SearchStatistics = None,
+                     table: TranspositionTable = None) -> int:
+    statistics = SearchStatistics() if statistics is None else statistics
+    total = int(are_solved_blocks_valid(state))
+    for component in components if total else ():
+        component_state = State(component_puzzle(state, component),
+                                consistency=state.consistency,
+                                tracer=state.tracer)
+        progress = SearchStatistics()
+        total *= count(component_state, progress, make_strategy(strategy),
+                       table)
+        statistics.nodes += progress.nodes
+        statistics.backtracks += progress.backtracks
+        if not total:
+            break
+    statistics.solutions += total
+    return total
@@ -0,0 +1,50 @@
+from functools import reduce
+from operator import or_
+
+__all__ = ['DIGITS', 'EMPTY_DOMAIN', 'FULL_DOMAIN', 'bit', 'popcount',
+           'lowest_digit', 'is_singleton', 'to_digits', 'from_digits',
+           'is_domain', 'mask_of', 'to_set']
+
+DIGITS = range(1, 10)
+EMPTY_DOMAIN = 0
+FULL_DOMAIN = (1 << len(DIGITS)) - 1
+
+_popcounts = tuple(bin(mask).count('1') for mask in range(FULL_DOMAIN + 1))
+_digits = tuple(tuple(digit for digit in DIGITS if mask >> (digit - 1) & 1)
+                for mask in range(FULL_DOMAIN + 1))
+
+
+def bit(digit: int) -> int:
+    return 1 << (digit - 1)
+
+
+def popcount(mask: int) -> int:
+    return _popcounts[mask]
+
+
+def lowest_digit(mask: int) -> int:
+    return (mask & -mask).bit_length()
+
+
+def is_singleton(mask: int) -> bool:
+    return mask != 0 and mask & (mask - 1) == 0
+
+
+def to_digits(mask: int) -> tuple:
+    return _digits[mask]
+
+
+def from_digits(digits) -> int:
+    return reduce(or_, map(bit, digits), EMPTY_DOMAIN)
+
+
+def is_domain(value) -> bool:
+    return isinstance(value, set)
+
+
+def mask_of(value) -> int:
+    return from_digits(value) if is_domain(value) else bit(value)
+
+
+def to_set(mask: int) -> set:
+    return {*_digits[mask]}
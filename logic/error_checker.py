@@ -1,17 +1,20 @@
-from utilities.iterable import Iterable
 from functools import wraps
+from logic.grid import DIGIT, FREE, HINT, to_grid
+from utilities.iterable import Iterable
 
 
 def find_invalid_hints(puzzle: dict, vertical: bool):
-    def possible_after_hint(hint_cell: tuple) -> bool:
-        next_cell = puzzle.get((hint_cell[0] + vertical,
-                                hint_cell[1] + (not vertical)))
-        return isinstance(next_cell, (int, set))
-
-    return (Iterable(puzzle).first_or_default(
-        lambda point: (isinstance(puzzle.get(point), tuple)
-                       and puzzle.get(point)[not vertical] is not None
-                       and not possible_after_hint(point))))
+    grid = to_grid(puzzle)
+    kinds, width = grid.kinds, grid.width
+    step = width if vertical else 1
+    for index, kind in enumerate(kinds):
+        if kind != HINT or grid.summary(index, not vertical) is None:
+            continue
+        following = index + step
+        if (following >= len(kinds) or not vertical and not following % width
+                or kinds[following] not in (DIGIT, FREE)):
+            return grid.cell(index)
+    return None
 
 
 def check(message):
@@ -45,24 +48,26 @@ def check_vertical_hints(puzzle: dict):
        'Not a number, the free cell or a hint '
        'before free cell in {0} line, {1} token.')
 def find_impossible_free_cells(puzzle: dict):
-    def possible_before_free_cell(free_cell: tuple) -> bool:
-        for orientation in range(2):
-            previous = (free_cell[0] - orientation,
-                        free_cell[1] - (not orientation))
-            previous_value = puzzle.get(previous)
-            if not (isinstance(previous_value, tuple)
-                    and previous_value[not orientation]
-                    or isinstance(previous_value, (set, int))):
+    def possible_before_free_cell(index: int) -> bool:
+        for horizontal, previous in enumerate((index - width, index - 1)):
+            if (previous < 0 or horizontal and not index % width
+                    or not (kinds[previous] == HINT
+                            and grid.summary(previous, horizontal)
+                            or kinds[previous] in (DIGIT, FREE))):
                 return False
         return True
 
-    return (Iterable(puzzle)
-            .first_or_default(lambda cell: isinstance(puzzle.get(cell), set)
-                              and not possible_before_free_cell(cell)))
+    grid = to_grid(puzzle)
+    kinds, width = grid.kinds, grid.width
+    for index, kind in enumerate(kinds):
+        if kind == FREE and not possible_before_free_cell(index):
+            return grid.cell(index)
+    return None
 
 
 def check_puzzle(puzzle: dict):
+    grid = to_grid(puzzle)
     (Iterable((check_horizontal_hints,
                check_vertical_hints,
                find_impossible_free_cells))
-     .to_tuple(lambda func: func(puzzle)))
+     .to_tuple(lambda func: func(grid)))
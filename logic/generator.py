@@ -0,0 +1,214 @@
+from random import Random
+
+from logic import domain
+from logic.grid import Grid
+from logic.propagation import reduce_state
+from logic.sat import Encoding
+from logic.search import SearchStatistics
+from logic.solver import check_uniqueness
+from logic.state import State
+from logic.tracing import Tracer
+
+__all__ = ['MAXIMUM_RUN', 'make_layout', 'fill_layout', 'make_hints',
+           'generate_puzzle', 'generate_puzzles']
+
+MAXIMUM_RUN = len(domain.DIGITS)
+FILL_BUDGET = 4
+REVEAL_FRACTION = 4
+REVEAL_CONFLICTS = 500
+DIRECTIONS = ((0, 1), (1, 0))
+
+
+def run_length(white: list, row: int, column: int, step: tuple) -> int:
+    length = 1
+    for sign in (-1, 1):
+        current_row = row + sign * step[0]
+        current_column = column + sign * step[1]
+        while white[current_row][current_column]:
+            length += 1
+            current_row += sign * step[0]
+            current_column += sign * step[1]
+    return length
+
+
+def split_runs(white: list, rng: Random):
+    rows, columns = len(white) - 1, len(white[0]) - 1
+    for step in DIRECTIONS:
+        outer, inner = (rows, columns) if step[1] else (columns, rows)
+        for line in range(1, outer):
+            length = 0
+            for position in range(1, inner + 1):
+                cell = (line, position) if step[1] else (position, line)
+                if not white[cell[0]][cell[1]]:
+                    length = 0
+                    continue
+                length += 1
+                if length > MAXIMUM_RUN:
+                    cut = position - rng.randint(0, MAXIMUM_RUN - 3)
+                    cut = (line, cut) if step[1] else (cut, line)
+                    white[cut[0]][cut[1]] = False
+                    length = (position - (cut[1] if step[1] else cut[0]))
+
+
+def remove_short_runs(white: list):
+    pending = [(row, column) for row in range(len(white))
+               for column in range(len(white[row])) if white[row][column]]
+    while pending:
+        row, column = pending.pop()
+        if not white[row][column]:
+            continue
+        if all(run_length(white, row, column, step) > 1
+               for step in DIRECTIONS):
+            continue
+        white[row][column] = False
+        pending.extend((row + dr, column + dc)
+                       for dr, dc in ((0, 1), (1, 0), (0, -1), (-1, 0)))
+
+
+def make_layout(rows: int, columns: int, density: float,
+                rng: Random) -> list:
+    white = [[0 < row < rows and 0 < column < columns
+              and rng.random() < density for column in range(columns + 1)]
+             for row in range(rows + 1)]
+    split_runs(white, rng)
+    remove_short_runs(white)
+    return white
+
+
+def fill_layout(white: list, rng: Random) -> dict:
+    cells = [(row, column) for row, line in enumerate(white)
+             for column, is_white in enumerate(line) if is_white]
+    digits, choices, index = {}, [], 0
+    budget = len(cells) * FILL_BUDGET
+    while index < len(cells):
+        if index == len(choices):
+            row, column = cells[index]
+            used = set()
+            for dr, dc in ((0, -1), (-1, 0)):
+                current_row, current_column = row + dr, column + dc
+                while white[current_row][current_column]:
+                    used.add(digits[current_row, current_column])
+                    current_row, current_column = (current_row + dr,
+                                                   current_column + dc)
+            candidates = [digit for digit in domain.DIGITS
+                          if digit not in used]
+            rng.shuffle(candidates)
+            choices.append(candidates)
+        if choices[index]:
+            digits[cells[index]] = choices[index].pop()
+            index += 1
+            continue
+        choices.pop()
+        digits.pop(cells[index], None)
+        index -= 1
+        budget -= 1
+        if index < 0 or not budget:
+            return {}
+    return digits
+
+
+def make_hints(white: list, digits: dict) -> Grid:
+    puzzle = Grid(len(white) - 1, len(white[0]) - 1)
+    for row, line in enumerate(white[:-1]):
+        for column, is_white in enumerate(line[:-1]):
+            if is_white:
+                puzzle[row, column] = {*domain.DIGITS}
+                continue
+            hint = [None, None]
+            for horizontal, (dr, dc) in enumerate((DIRECTIONS[1],
+                                                   DIRECTIONS[0])):
+                current_row, current_column = row + dr, column + dc
+                while white[current_row][current_column]:
+                    hint[horizontal] = ((hint[horizontal] or 0)
+                                        + digits[current_row,
+                                                 current_column])
+                    current_row, current_column = (current_row + dr,
+                                                   current_column + dc)
+            if hint != [None, None]:
+                puzzle[row, column] = tuple(hint)
+    return puzzle
+
+
+def reveal_until_unique(puzzle: dict, digits: dict, rng: Random) -> dict:
+    state = reduce_state(State(puzzle))
+    encoding = Encoding(state)
+    solver, variables = encoding.solver, encoding.variables
+    expected = {cell: variables[cell, digits[state.layout.cells[cell]]]
+                for cell in encoding.free}
+    solver.add_clause([-variable for variable in expected.values()])
+    while True:
+        satisfiable = solver.solve(REVEAL_CONFLICTS)
+        if satisfiable is False:
+            return puzzle
+        model = solver.model() if satisfiable else set()
+        differences = [cell for cell, variable in expected.items()
+                       if variable not in model]
+        for cell in rng.sample(differences,
+                               1 + len(differences) // REVEAL_FRACTION):
+            coordinates = state.layout.cells[cell]
+            puzzle[coordinates] = digits[coordinates]
+            solver.add_clause([expected.pop(cell)])
+
+
+class NodeLimitExceeded(Exception):
+    pass
+
+
+class NodeLimit(Tracer):
+    __slots__ = ('statistics', 'limit')
+
+    def __init__(self, statistics: SearchStatistics, limit: int):
+        self.statistics = statistics
+        self.limit = limit
+
+    def decision(self, state: State, cell: int, value: int, depth: int):
+        if self.statistics.nodes > self.limit:
+            raise NodeLimitExceeded()
+
+
+def count_nodes(puzzle: dict, limit: int) -> int:
+    statistics = SearchStatistics()
+    try:
+        check_uniqueness(puzzle, statistics=statistics,
+                         tracer=NodeLimit(statistics, limit))
+    except NodeLimitExceeded:
+        pass
+    return statistics.nodes
+
+
+def check_arguments(rows: int, columns: int, density: float,
+                    nodes: tuple):
+    if rows < 3 or columns < 3:
+        raise ValueError('Puzzle must have at least 3 rows and 3 columns.')
+    if not 0 < density <= 1:
+        raise ValueError('Density must be in (0, 1].')
+    if nodes is not None and not 0 <= nodes[0] <= nodes[1]:
+        raise ValueError('Node range must be non-negative and ordered.')
+
+
+def generate_puzzle(rows: int, columns: int, density: float = 0.8,
+                    rng: Random = None, unique: bool = False,
+                    nodes: tuple = None, attempts: int = 1000) -> Grid:
+    check_arguments(rows, columns, density, nodes)
+    rng = Random() if rng is None else rng
+    for _ in range(attempts):
+        white = make_layout(rows, columns, density, rng)
+        digits = fill_layout(white, rng)
+        if not digits:
+            continue
+        puzzle = make_hints(white, digits)
+        if unique:
+            reveal_until_unique(puzzle, digits, rng)
+        if nodes is None or nodes[0] <= count_nodes(puzzle,
+                                                    nodes[1]) <= nodes[1]:
+            return puzzle
+    raise ValueError('No puzzle was generated in {0} attempts.'
+                     .format(attempts))
+
+
+def generate_puzzles(count: int, rows: int, columns: int,
+                     density: float = 0.8, seed: int = None,
+                     unique: bool = False, nodes: tuple = None):
+    rng = Random(seed)
+    for _ in range(count):
+        yield generate_puzzle(rows, columns, density, rng, unique, nodes)
@@ -0,0 +1,145 @@
+from array import array
+from collections.abc import Mapping
+
+from logic import domain
+
+__all__ = ['BLOCKED', 'DIGIT', 'FREE', 'HINT', 'encode', 'Grid', 'to_grid']
+
+BLOCKED, DIGIT, FREE, HINT = range(4)
+HINT_BITS = 16
+NO_SUM = (1 << HINT_BITS) - 1
+
+
+def encode(value) -> tuple:
+    if value is None:
+        return BLOCKED, 0
+    if isinstance(value, int):
+        return DIGIT, value
+    if domain.is_domain(value):
+        return FREE, domain.mask_of(value)
+    packed = 0
+    for summary in value:
+        if summary is not None and not 0 <= summary < NO_SUM:
+            raise ValueError('Hint sum {0} is too large.'.format(summary))
+        packed = packed << HINT_BITS | (NO_SUM if summary is None
+                                        else summary)
+    return HINT, packed
+
+
+def decode_hint(packed: int) -> tuple:
+    down, across = packed >> HINT_BITS, packed & NO_SUM
+    return (None if down == NO_SUM else down,
+            None if across == NO_SUM else across)
+
+
+class Grid(Mapping):
+    __slots__ = ('height', 'width', 'kinds', 'contents')
+
+    def __init__(self, height: int = 0, width: int = 0):
+        self.height = height
+        self.width = width
+        self.kinds = bytearray(height * width)
+        self.contents = array('I', [0]) * (height * width)
+
+    @classmethod
+    def from_dict(cls, puzzle: dict):
+        height, width = (max((cell[position] + 1 for cell in puzzle),
+                             default=0) for position in range(2))
+        grid = cls(height, width)
+        for cell, value in puzzle.items():
+            grid[cell] = value
+        return grid
+
+    def to_dict(self) -> dict:
+        return dict(self.items())
+
+    def index(self, cell: tuple) -> int:
+        row, column = cell
+        if not (0 <= row < self.height and 0 <= column < self.width):
+            raise KeyError(cell)
+        return row * self.width + column
+
+    def cell(self, index: int) -> tuple:
+        return divmod(index, self.width)
+
+    def positions(self, *kinds) -> tuple:
+        width = self.width
+        return tuple(divmod(index, width)
+                     for index, kind in enumerate(self.kinds)
+                     if kind in kinds)
+
+    def summary(self, index: int, horizontal: bool):
+        packed = self.contents[index]
+        summary = packed & NO_SUM if horizontal else packed >> HINT_BITS
+        return None if summary == NO_SUM else summary
+
+    def decode(self, index: int):
+        kind, value = self.kinds[index], self.contents[index]
+        if kind == DIGIT:
+            return value
+        if kind == FREE:
+            return domain.to_set(value)
+        if kind == HINT:
+            return decode_hint(value)
+        return None
+
+    def assign(self, cell: tuple, value: int, mask: int):
+        index = self.index(cell)
+        self.kinds[index] = DIGIT if value else FREE
+        self.contents[index] = value if value else mask
+
+    def copy(self):
+        grid = Grid.__new__(Grid)
+        grid.height = self.height
+        grid.width = self.width
+        grid.kinds = self.kinds[:]
+        grid.contents = self.contents[:]
+        return grid
+
+    def update(self, pairs=()):
+        for cell, value in (pairs.items() if isinstance(pairs, Mapping)
+                            else pairs):
+            self[cell] = value
+
+    def get(self, cell: tuple, default=None):
+        row, column = cell
+        if 0 <= row < self.height and 0 <= column < self.width:
+            return self.decode(row * self.width + column)
+        return default
+
+    def __getitem__(self, cell: tuple):
+        return self.decode(self.index(cell))
+
+    def __setitem__(self, cell: tuple, value):
+        index = self.index(cell)
+        self.kinds[index], self.contents[index] = encode(value)
+
+    def __contains__(self, cell) -> bool:
+        try:
+            row, column = cell
+        except (TypeError, ValueError):
+            return False
+        return 0 <= row < self.height and 0 <= column < self.width
+
+    def __iter__(self):
+        return (divmod(index, self.width) for index in range(len(self)))
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Grid):
+            return (self.height == other.height
+                    and self.width == other.width
+                    and self.kinds == other.kinds
+                    and self.contents == other.contents)
+        return super().__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return 'Grid({0}, {1})'.format(self.height, self.width)
+
+
+def to_grid(puzzle) -> Grid:
+    return puzzle if isinstance(puzzle, Grid) else Grid.from_dict(puzzle)
@@ -0,0 +1,122 @@
+from logic import combinations, domain
+from logic.state import State
+
+__all__ = ['Strategy', 'FirstUnsolved', 'MinimumRemainingValues',
+           'MostConstrainedBlock', 'DomainOverWeightedDegree',
+           'LeastConstrainingValue', 'STRATEGIES', 'make_strategy']
+
+
+class Strategy:
+    __slots__ = ()
+
+    def select(self, state: State):
+        return next((cell for cell, value in enumerate(state.values)
+                     if not value), None)
+
+    def order(self, state: State, cell: int) -> tuple:
+        return domain.to_digits(state.domains[cell])
+
+    def on_failure(self, state: State):
+        pass
+
+
+class FirstUnsolved(Strategy):
+    __slots__ = ()
+
+
+class MinimumRemainingValues(Strategy):
+    __slots__ = ()
+
+    def select(self, state: State):
+        domains = state.domains
+        best, best_size = None, len(domain.DIGITS) + 1
+        for cell, value in enumerate(state.values):
+            if value:
+                continue
+            size = domain.popcount(domains[cell])
+            if size < best_size:
+                best, best_size = cell, size
+                if size == 2:
+                    break
+        return best
+
+
+class MostConstrainedBlock(Strategy):
+    __slots__ = ()
+
+    def select(self, state: State):
+        totals, values, domains = state.totals, state.values, state.domains
+        best, best_key = None, None
+        for number, block in enumerate(state.layout.blocks):
+            remaining = totals.remaining[number]
+            if not remaining:
+                continue
+            key = (combinations.count_combinations(
+                block.summary - totals.sums[number], remaining,
+                totals.used[number]), remaining)
+            if best_key is None or key < best_key:
+                best, best_key = number, key
+        if best is None:
+            return None
+        return min((cell for cell in state.layout.blocks[best].cells
+                    if not values[cell]),
+                   key=lambda cell: domain.popcount(domains[cell]))
+
+
+class DomainOverWeightedDegree(Strategy):
+    __slots__ = ('weights',)
+
+    def __init__(self):
+        self.weights = None
+
+    def select(self, state: State):
+        if self.weights is None:
+            self.weights = [1] * len(state.layout.blocks)
+        weights, remaining = self.weights, state.totals.remaining
+        cell_numbers, domains = state.layout.cell_numbers, state.domains
+        best, best_score = None, None
+        for cell, value in enumerate(state.values):
+            if value:
+                continue
+            degree = sum(weights[number] for number in cell_numbers[cell]
+                         if remaining[number] > 1)
+            score = domain.popcount(domains[cell]) / max(degree, 1)
+            if best_score is None or score < best_score:
+                best, best_score = cell, score
+        return best
+
+    def on_failure(self, state: State):
+        if self.weights is None:
+            self.weights = [1] * len(state.layout.blocks)
+        for number in state.conflict:
+            self.weights[number] += 1
+
+
+class LeastConstrainingValue(MinimumRemainingValues):
+    __slots__ = ()
+
+    def order(self, state: State, cell: int) -> tuple:
+        def supported_combinations(digit: int) -> int:
+            return sum(combinations.count_combinations(
+                blocks[number].summary - totals.sums[number] - digit,
+                totals.remaining[number] - 1,
+                totals.used[number] | domain.bit(digit))
+                for number in state.layout.cell_numbers[cell])
+
+        blocks, totals = state.layout.blocks, state.totals
+        return tuple(sorted(domain.to_digits(state.domains[cell]),
+                            key=supported_combinations, reverse=True))
+
+
+STRATEGIES = {'first': FirstUnsolved,
+              'mrv': MinimumRemainingValues,
+              'block': MostConstrainedBlock,
+              'domwdeg': DomainOverWeightedDegree,
+              'lcv': LeastConstrainingValue}
+
+
+def make_strategy(name: str) -> Strategy:
+    if name not in STRATEGIES:
+        raise ValueError('Unknown strategy "{0}". Expected one of: {1}.'
+                         .format(name, ', '.join(STRATEGIES)))
+    return STRATEGIES[name]()
@@ -0,0 +1,117 @@
+from logic import domain
+from logic.grid import DIGIT, FREE, HINT, Grid
+from utilities.iterable import Iterable
+
+__all__ = ['Block', 'Layout', 'BlockTotals']
+
+
+class Block:
+    __slots__ = ('hint', 'horizontal', 'cells', 'coordinates', 'summary')
+
+    def __init__(self, hint: tuple, horizontal: bool,
+                 cells: tuple, coordinates: tuple, summary: int):
+        self.hint = hint
+        self.horizontal = horizontal
+        self.cells = cells
+        self.coordinates = coordinates
+        self.summary = summary
+
+    def __repr__(self) -> str:
+        return 'Block({0}, {1}, {2}, {3})'.format(self.hint, self.horizontal,
+                                                  self.cells, self.summary)
+
+
+class Layout:
+    __slots__ = ('cells', 'indices', 'blocks', 'hint_blocks',
+                 'cell_blocks', 'cell_numbers', 'neighbors')
+
+    def __init__(self, puzzle: dict):
+        self.cells = (puzzle.positions(DIGIT, FREE)
+                      if isinstance(puzzle, Grid) else
+                      Iterable(puzzle)
+                      .filter(lambda cell:
+                              isinstance(puzzle.get(cell), (int, set)))
+                      .to_tuple())
+        self.indices = {cell: index for index, cell in enumerate(self.cells)}
+
+        blocks = []
+        self.hint_blocks = {}
+        cell_blocks = [[None, None] for _ in self.cells]
+        hints = (puzzle.positions(HINT) if isinstance(puzzle, Grid) else
+                 Iterable(puzzle)
+                 .filter(lambda cell: isinstance(puzzle.get(cell), tuple)))
+        for hint in hints:
+            for orientation in range(2):
+                summary = puzzle.get(hint)[orientation]
+                if summary is None:
+                    continue
+                horizontal = bool(orientation)
+                cells = tuple(self._walk_block(hint, horizontal))
+                for cell in cells:
+                    cell_blocks[cell][orientation] = len(blocks)
+                self.hint_blocks[hint, horizontal] = len(blocks)
+                coordinates = tuple(self.cells[cell] for cell in cells)
+                blocks.append(Block(hint, horizontal, cells,
+                                    coordinates, summary))
+
+        self.blocks = tuple(blocks)
+        self.cell_blocks = tuple(map(tuple, cell_blocks))
+        self.cell_numbers = tuple(tuple(number for number in numbers
+                                        if number is not None)
+                                  for numbers in self.cell_blocks)
+        self.neighbors = tuple(self._collect_neighbors(index)
+                               for index in range(len(self.cells)))
+
+    def _walk_block(self, hint: tuple, horizontal: bool):
+        current = [*hint]
+        while True:
+            current[horizontal] += 1
+            index = self.indices.get(tuple(current))
+            if index is None:
+                return
+            yield index
+
+    def _collect_neighbors(self, index: int) -> tuple:
+        return (Iterable(self.cell_blocks[index])
+                .filter(lambda number: number is not None)
+                .chain(lambda number: self.blocks[number].cells)
+                .filter(lambda neighbor: neighbor != index)
+                .distinct(hashable=True)
+                .to_tuple())
+
+    def block_of(self, hint: tuple, horizontal: bool) -> Block:
+        return self.blocks[self.hint_blocks[hint, horizontal]]
+
+
+class BlockTotals:
+    __slots__ = ('sums', 'remaining', 'used')
+
+    def __init__(self, layout: Layout, puzzle: dict):
+        self.sums = [0] * len(layout.blocks)
+        self.remaining = [len(block.cells) for block in layout.blocks]
+        self.used = [domain.EMPTY_DOMAIN] * len(layout.blocks)
+        for index, cell in enumerate(layout.cells):
+            value = puzzle.get(cell)
+            if isinstance(value, int):
+                self.assign(layout, index, value)
+
+    def assign(self, layout: Layout, index: int, value: int):
+        digit = domain.bit(value)
+        for number in layout.cell_numbers[index]:
+            self.sums[number] += value
+            self.remaining[number] -= 1
+            self.used[number] |= digit
+
+    def unassign(self, layout: Layout, index: int, value: int):
+        digit = domain.bit(value)
+        for number in layout.cell_numbers[index]:
+            self.sums[number] -= value
+            self.remaining[number] += 1
+            self.used[number] &= ~digit
+
+    def copy(self):
+        totals = BlockTotals.__new__(BlockTotals)
+        totals.sums = self.sums.copy()
+        totals.remaining = self.remaining.copy()
+        totals.used = self.used.copy()
+        return totals
@@ -0,0 +1,215 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from multiprocessing import Process, Queue
+from queue import Empty
+
+from logic.exceptions import UnsolvablePuzzleError
+from logic.heuristics import Strategy, make_strategy
+from logic.propagation import is_state_valid
+from logic.search import SearchStatistics, count, decide, search
+from logic.solver import prepare_state
+from logic.state import State
+
+__all__ = ['split_search', 'solve_subproblem', 'count_subproblem',
+           'solve_puzzle_parallel', 'count_solutions_parallel']
+
+CHUNK_SIZE = 64
+_worker = {}
+
+
+def split_search(state: State, depth: int, strategy: Strategy = None,
+                 statistics: SearchStatistics = None):
+    def generator(decisions: list):
+        cell = strategy.select(state)
+        if cell is None or len(decisions) == depth:
+            yield tuple(decisions)
+            return
+        statistics.nodes += 1
+        for possible_number in strategy.order(state, cell):
+            mark = state.mark()
+            try:
+                decide(state, cell, possible_number)
+            except UnsolvablePuzzleError:
+                statistics.backtracks += 1
+                strategy.on_failure(state)
+            else:
+                decisions.append((cell, possible_number))
+                yield from generator(decisions)
+                decisions.pop()
+            state.undo(mark)
+
+    statistics = SearchStatistics() if statistics is None else statistics
+    strategy = make_strategy('first') if strategy is None else strategy
+    yield from generator([])
+
+
+def _initialize_worker(puzzle: dict, strategy: str, consistency: str):
+    _worker['state'] = prepare_state(puzzle, consistency)
+    _worker['strategy'] = strategy
+
+
+def solve_subproblem(decisions: tuple, limit: int = None,
+                     statistics: SearchStatistics = None):
+    state = _worker['state'].copy()
+    statistics = SearchStatistics() if statistics is None else statistics
+    try:
+        for cell, value in decisions:
+            decide(state, cell, value)
+    except UnsolvablePuzzleError:
+        return
+    for solution in islice(search(state, statistics,
+                                  make_strategy(_worker['strategy'])),
+                           limit):
+        yield tuple(solution.values)
+
+
+def _solve_worker(puzzle: dict, strategy: str, consistency: str,
+                  limit: int, tasks: Queue, results: Queue):
+    _initialize_worker(puzzle, strategy, consistency)
+    for index, decisions in iter(tasks.get, None):
+        statistics, chunk = SearchStatistics(), []
+        try:
+            for values in solve_subproblem(decisions, limit, statistics):
+                chunk.append(values)
+                if len(chunk) == CHUNK_SIZE:
+                    results.put((index, chunk, None))
+                    chunk = []
+        except Exception as error:
+            results.put((index, [], error))
+            return
+        results.put((index, chunk, statistics))
+
+
+def count_subproblem(decisions: tuple) -> tuple:
+    state = _worker['state'].copy()
+    statistics = SearchStatistics()
+    try:
+        for cell, value in decisions:
+            decide(state, cell, value)
+    except UnsolvablePuzzleError:
+        return 0, statistics
+    return (count(state, statistics, make_strategy(_worker['strategy'])),
+            statistics)
+
+
+def check_arguments(jobs: int, depth: int):
+    if jobs < 1 or depth < 0:
+        raise ValueError('Jobs must be positive and depth '
+                         'must not be negative.')
+
+
+def receive(results: Queue, workers: list) -> tuple:
+    while True:
+        try:
+            return results.get(timeout=1)
+        except Empty:
+            if not all(worker.is_alive() for worker in workers):
+                raise RuntimeError('A worker process exited unexpectedly.')
+
+
+def stop_workers(workers: list, tasks: Queue):
+    tasks.cancel_join_thread()
+    for worker in workers:
+        worker.terminate()
+    for worker in workers:
+        worker.join()
+
+
+def solve_puzzle_parallel(puzzle: dict, jobs: int, depth: int = 3,
+                          strategy: str = 'first',
+                          statistics: SearchStatistics = None,
+                          consistency: str = 'sums', ordered: bool = True,
+                          limit: int = None):
+    def emit(values: tuple) -> dict:
+        solution = puzzle.copy()
+        for coordinate, value in zip(state.layout.cells, values):
+            solution[coordinate] = value
+        return solution
+
+    check_arguments(jobs, depth)
+    statistics = SearchStatistics() if statistics is None else statistics
+    state = prepare_state(puzzle, consistency)
+    if state.is_solved():
+        if not is_state_valid(state):
+            raise UnsolvablePuzzleError('No solutions were found via brute '
+                                        'force.')
+        yield state.to_puzzle(puzzle)
+        return
+
+    subproblems = enumerate(split_search(state, depth,
+                                         make_strategy(strategy),
+                                         statistics))
+    tasks, results = Queue(), Queue(jobs * 4)
+    workers = [Process(target=_solve_worker, daemon=True,
+                       args=(puzzle, strategy, consistency, limit, tasks,
+                             results))
+               for _ in range(jobs)]
+    for worker in workers:
+        worker.start()
+    running, buffered, following = 0, {}, 0
+    found_solution = False
+    try:
+        while True:
+            for index, decisions in islice(subproblems, jobs * 4 - running):
+                tasks.put((index, decisions))
+                running += 1
+            if not running:
+                break
+            index, solutions, outcome = receive(results, workers)
+            if isinstance(outcome, Exception):
+                raise outcome
+            if outcome is not None:
+                running -= 1
+                statistics.nodes += outcome.nodes
+                statistics.backtracks += outcome.backtracks
+                statistics.solutions += outcome.solutions
+            if not ordered:
+                for values in solutions:
+                    found_solution = True
+                    yield emit(values)
+                continue
+            pending = buffered.setdefault(index, [[], False])
+            pending[0] += solutions
+            pending[1] = outcome is not None
+            while following in buffered:
+                solutions, done = buffered[following]
+                buffered[following] = [[], done]
+                for values in solutions:
+                    found_solution = True
+                    yield emit(values)
+                if not done:
+                    break
+                del buffered[following]
+                following += 1
+    finally:
+        stop_workers(workers, tasks)
+    if not found_solution:
+        raise UnsolvablePuzzleError('No solutions were found via brute force.')
+
+
+def count_solutions_parallel(puzzle: dict, jobs: int, depth: int = 3,
+                             strategy: str = 'first',
+                             statistics: SearchStatistics = None,
+                             consistency: str = 'sums') -> int:
+    check_arguments(jobs, depth)
+    statistics = SearchStatistics() if statistics is None else statistics
+    try:
+        state = prepare_state(puzzle, consistency)
+    except UnsolvablePuzzleError:
+        return 0
+    if state.is_solved():
+        return int(is_state_valid(state))
+
+    subproblems = split_search(state, depth, make_strategy(strategy),
+                               statistics)
+    total = 0
+    with ProcessPoolExecutor(jobs, initializer=_initialize_worker,
+                             initargs=(puzzle, strategy,
+                                       consistency)) as executor:
+        for subtotal, subproblem_statistics in executor.map(
+                count_subproblem, subproblems, chunksize=jobs):
+            total += subtotal
+            statistics.nodes += subproblem_statistics.nodes
+            statistics.backtracks += subproblem_statistics.backtracks
+            statistics.solutions += subproblem_statistics.solutions
+    return total
@@ -0,0 +1,316 @@
+from collections import deque
+from functools import lru_cache
+from time import perf_counter
+
+from utilities.iterable import Iterable
+from logic import combinations, domain
+from logic.exceptions import UnsolvablePuzzleError
+from logic.state import State
+
+__all__ = ['inc', 'narrow_cells', 'filter_block', 'find_supports',
+           'filter_combinations', 'BLOCK_FILTERS', 'filter_blocks',
+           'assign_cell', 'propagate', 'reduce_state', 'changed_cells',
+           'probe_cell', 'exclude_state', 'is_state_valid']
+
+
+def inc(number: int):
+    return number + 1
+
+
+def no_combination_error(block) -> UnsolvablePuzzleError:
+    return UnsolvablePuzzleError('No possible sum combination for {0} hint '
+                                 'in {1} line, {2} token.'
+                                 .format('horizontal' if block.horizontal
+                                         else 'vertical',
+                                         *Iterable(block.hint).map(inc)))
+
+
+def no_values_error(state: State, cell: int) -> UnsolvablePuzzleError:
+    return UnsolvablePuzzleError('No possible values to fill free '
+                                 'cell in {0} line, {1} token.'
+                                 .format(*Iterable(state.layout.cells[cell])
+                                         .map(inc)))
+
+
+def narrow_cells(state: State, cells: list, masks: list) -> list:
+    domains, trail = state.domains, state.trail
+    changed = []
+    for cell, mask in zip(cells, masks):
+        reduced_cell = domains[cell] & mask
+        if reduced_cell == domains[cell]:
+            continue
+        if not reduced_cell:
+            raise no_values_error(state, cell)
+        trail.append(cell)
+        trail.append(domains[cell])
+        domains[cell] = reduced_cell
+        changed.append(cell)
+    return changed
+
+
+def filter_block(state: State, number: int) -> list:
+    block = state.layout.blocks[number]
+    values = state.values
+    free = [cell for cell in block.cells if not values[cell]]
+    totals = state.totals
+    if not free:
+        if totals.sums[number] != block.summary:
+            raise no_combination_error(block)
+        return []
+    possible_digits = combinations.possible_digits(
+        block.summary - totals.sums[number], len(free), totals.used[number])
+    if not possible_digits:
+        raise no_combination_error(block)
+    return narrow_cells(state, free, [possible_digits] * len(free))
+
+
+def yield_bits(mask: int):
+    while mask:
+        lowest = mask & -mask
+        yield lowest
+        mask ^= lowest
+
+
+@lru_cache(maxsize=2 ** 16)
+def find_supports(cell_domains: tuple, candidates: tuple) -> tuple:
+    def extend(reachable: set, cell_domain: int) -> set:
+        extended = set()
+        for used in reachable:
+            for digit in yield_bits(cell_domain & ~used):
+                if used | digit in submasks:
+                    extended.add(used | digit)
+        return extended
+
+    submasks = set()
+    for candidate in candidates:
+        submask = candidate
+        while submask:
+            submasks.add(submask)
+            submask = (submask - 1) & candidate
+    submasks.add(0)
+
+    forward = [{0}]
+    for cell_domain in cell_domains:
+        forward.append(extend(forward[-1], cell_domain))
+    backward = [{0}]
+    for cell_domain in reversed(cell_domains):
+        backward.append(extend(backward[-1], cell_domain))
+    backward.reverse()
+
+    realisable = tuple(candidate for candidate in candidates
+                       if candidate in forward[-1])
+    supports = []
+    for position, cell_domain in enumerate(cell_domains):
+        support, following = 0, backward[position + 1]
+        for candidate in realisable:
+            for used in forward[position]:
+                if used & ~candidate:
+                    continue
+                rest = candidate & ~used
+                for digit in yield_bits(rest & cell_domain & ~support):
+                    if rest & ~digit in following:
+                        support |= digit
+        supports.append(support)
+    return realisable, tuple(supports)
+
+
+def filter_combinations(state: State, number: int) -> list:
+    block = state.layout.blocks[number]
+    values, domains = state.values, state.domains
+    free = [cell for cell in block.cells if not values[cell]]
+    totals = state.totals
+    if not free:
+        if totals.sums[number] != block.summary:
+            raise no_combination_error(block)
+        return []
+    reachable = domain.EMPTY_DOMAIN
+    for cell in free:
+        reachable |= domains[cell]
+    candidates = tuple(candidate for candidate in combinations.subsets(
+                       block.summary - totals.sums[number], len(free))
+                       if not candidate & (totals.used[number] | ~reachable))
+    if not candidates:
+        raise no_combination_error(block)
+
+    required = domain.FULL_DOMAIN
+    for candidate in candidates:
+        required &= candidate
+    changed = []
+    for digit in yield_bits(required):
+        holders = [cell for cell in free if domains[cell] & digit]
+        if not holders:
+            raise no_combination_error(block)
+        if len(holders) == 1:
+            changed += narrow_cells(state, holders, [digit])
+
+    realisable, supports = find_supports(
+        tuple(domains[cell] for cell in free), candidates)
+    if not realisable:
+        raise no_combination_error(block)
+    return changed + narrow_cells(state, free, supports)
+
+
+BLOCK_FILTERS = {'sums': filter_block, 'combinations': filter_combinations}
+
+
+def filter_blocks(state: State):
+    for number in range(len(state.layout.blocks)):
+        filter_block(state, number)
+
+
+def assign_cell(state: State, cell: int) -> list:
+    value = domain.lowest_digit(state.domains[cell])
+    state.assign(cell, value)
+    removed = domain.bit(value)
+    domains, values, trail = state.domains, state.values, state.trail
+    changed = []
+    for neighbor in state.layout.neighbors[cell]:
+        if values[neighbor] or not domains[neighbor] & removed:
+            continue
+        trail.append(neighbor)
+        trail.append(domains[neighbor])
+        domains[neighbor] &= ~removed
+        if not domains[neighbor]:
+            raise (UnsolvablePuzzleError
+                   ('No possible number after '
+                    'reduce in {0} line, '
+                    '{1} token.'
+                    .format(*Iterable(state.layout.cells[cell]).map(inc))))
+        changed.append(neighbor)
+    return changed
+
+
+def propagate(state: State, cells=None) -> State:
+    def schedule(changed_cells):
+        for changed_cell in changed_cells:
+            for block in cell_numbers[changed_cell]:
+                if not queued[block]:
+                    queued[block] = True
+                    queue.append(block)
+            if (not values[changed_cell]
+                    and domain.is_singleton(domains[changed_cell])):
+                pending.append(changed_cell)
+
+    block_filter = BLOCK_FILTERS[state.consistency]
+    cell_numbers = state.layout.cell_numbers
+    domains, values = state.domains, state.values
+    queued = [False] * len(state.layout.blocks)
+    queue, pending = deque(), deque()
+    if cells is None:
+        queue.extend(range(len(queued)))
+        queued = [True] * len(queued)
+        cells = range(len(values))
+    schedule(cells)
+
+    tracer = state.tracer
+    started = 0.0 if tracer is None else perf_counter()
+    source = ()
+    try:
+        while queue or pending:
+            if pending:
+                cell = pending.popleft()
+                if not values[cell]:
+                    source = cell_numbers[cell]
+                    schedule([cell, *assign_cell(state, cell)])
+                continue
+            number = queue.popleft()
+            queued[number] = False
+            source = (number,)
+            schedule(block_filter(state, number))
+    except UnsolvablePuzzleError:
+        state.conflict = source
+        if tracer is not None:
+            tracer.wipe_out(state)
+        raise
+    finally:
+        if tracer is not None:
+            tracer.propagation(state, perf_counter() - started)
+
+    return state
+
+
+def reduce_state(state: State) -> State:
+    return propagate(state)
+
+
+def changed_cells(state: State, mark: int) -> set:
+    return {cell if cell >= 0 else ~cell for cell in state.trail[mark::2]}
+
+
+def probe_cell(state: State, cell: int) -> tuple:
+    domains, tracer = state.domains, state.tracer
+    started = 0.0 if tracer is None else perf_counter()
+    impossible, supports = domain.EMPTY_DOMAIN, None
+    for possible_number in domain.to_digits(domains[cell]):
+        mark = state.mark()
+        try:
+            state.restrict(cell, domain.bit(possible_number))
+            propagate(state, [cell])
+        except UnsolvablePuzzleError:
+            impossible |= domain.bit(possible_number)
+        else:
+            changed = changed_cells(state, mark)
+            supports = ({other: domains[other] for other in changed}
+                        if supports is None else
+                        {other: support | domains[other]
+                         for other, support in supports.items()
+                         if other in changed})
+        state.undo(mark)
+    if tracer is not None:
+        tracer.probe(state, cell, perf_counter() - started)
+    return impossible, {} if supports is None else supports
+
+
+def exclude_state(state: State, cells=None) -> State:
+    def schedule(changed):
+        for changed_cell in changed:
+            for other in (changed_cell, *neighbors[changed_cell]):
+                if not values[other] and not queued[other]:
+                    queued[other] = True
+                    queue.append(other)
+
+    def wipe_out(free_cell: int):
+        state.conflict = state.layout.cell_numbers[free_cell]
+        if state.tracer is not None:
+            state.tracer.wipe_out(state)
+        return (UnsolvablePuzzleError
+                ('No possible number after reduce in '
+                 '{0} line, {1} token.'
+                 .format(*Iterable(state.layout.cells[free_cell])
+                         .map(inc))))
+
+    domains, values = state.domains, state.values
+    neighbors = state.layout.neighbors
+    queued = [False] * len(values)
+    queue = deque()
+    schedule(range(len(values)) if cells is None else cells)
+
+    while queue:
+        free_cell = queue.popleft()
+        queued[free_cell] = False
+        if values[free_cell]:
+            continue
+        impossible, supports = probe_cell(state, free_cell)
+        mark = state.mark()
+        if impossible:
+            state.restrict(free_cell, domains[free_cell] & ~impossible)
+            if not domains[free_cell]:
+                raise wipe_out(free_cell)
+            propagate(state, [free_cell])
+        reduced = [other for other, support in supports.items()
+                   if not values[other] and domains[other] & ~support]
+        for other in reduced:
+            state.restrict(other, domains[other] & supports[other])
+            if not domains[other]:
+                raise wipe_out(other)
+        if reduced:
+            propagate(state, reduced)
+        schedule(changed_cells(state, mark))
+
+    return state
+
+
+def is_state_valid(state: State) -> bool:
+    sums = state.totals.sums
+    return all(sums[number] == block.summary
+               for number, block in enumerate(state.layout.blocks))
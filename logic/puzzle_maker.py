@@ -1,6 +1,14 @@
-from re import finditer
+import mmap
+
+from logic.grid import Grid, encode
 from utilities.iterable import Iterable
 
+__all__ = ['parse_token', 'iterate_lines', 'parse_rows', 'make_puzzle',
+           'split_puzzles', 'make_puzzles', 'read_puzzles']
+
+TABLE_LIMIT = 1 << 16
+TOKENS = {}
+
 
 def parse_token(token: str) -> object:
     message = 'Invalid token "{0}" in {1} line, {2} token.'
@@ -24,29 +32,85 @@ def parse_token(token: str) -> object:
                 .to_tuple(lambda part: int(part) if part != '' else None))
 
 
-def make_puzzle(file) -> dict:
-    def yield_tokens():
-        nonlocal line_number, token_number
-        line = file.readline()
-        while line != '':
-            tokens = (Iterable(finditer('\S+', line))
-                      .map(lambda match_object: match_object.group(0)))
-            for part in tokens:
-                yield part
-                token_number += 1
-            line = file.readline()
-            line_number += 1
-            token_number = 0
-
-    line_number = token_number = 0
-    puzzle = {}
-
-    for token in yield_tokens():
-        try:
-            cell = parse_token(token)
-            puzzle[line_number, token_number] = cell
-        except SyntaxError as exception:
-            raise SyntaxError(
-                str(exception).format(token, line_number, token_number))
-
-    return puzzle
+def intern_token(token, table: dict, line_number: int,
+                 token_number: int) -> tuple:
+    text = token if isinstance(token, str) else token.decode('utf-8')
+    try:
+        entry = encode(parse_token(text))
+    except SyntaxError as exception:
+        raise SyntaxError(
+            str(exception).format(text, line_number, token_number))
+    if len(table) < TABLE_LIMIT:
+        table[token] = entry
+    return entry
+
+
+def iterate_lines(buffer):
+    newline = '\n' if isinstance(buffer, str) else b'\n'
+    start, length = 0, len(buffer)
+    while start < length:
+        end = buffer.find(newline, start)
+        end = length if end < 0 else end
+        yield buffer[start:end]
+        start = end + 1
+
+
+def parse_rows(rows: list, first_line: int = 0, table: dict = None) -> Grid:
+    table = TOKENS if table is None else table
+    width = max(map(len, rows), default=0)
+    grid = Grid(len(rows), width)
+    kinds, contents = grid.kinds, grid.contents
+    for row, tokens in enumerate(rows):
+        start = row * width
+        for column, token in enumerate(tokens):
+            entry = table.get(token)
+            if entry is None:
+                entry = intern_token(token, table, first_line + row, column)
+            kinds[start + column], contents[start + column] = entry
+    return grid
+
+
+def trim(rows: list) -> list:
+    while rows and not rows[-1]:
+        rows.pop()
+    return rows
+
+
+def make_puzzle(file) -> Grid:
+    return parse_rows(trim([line.split()
+                            for line in iterate_lines(file.read())]))
+
+
+def split_puzzles(lines, delimiter=None):
+    rows, first_line = [], 0
+    for line_number, line in enumerate(lines):
+        tokens = line.split()
+        if (not tokens if delimiter is None else tokens == [delimiter]):
+            if trim(rows):
+                yield first_line, rows
+            rows = []
+        elif tokens or rows:
+            if not rows:
+                first_line = line_number
+            rows.append(tokens)
+    if trim(rows):
+        yield first_line, rows
+
+
+def parse_puzzles(buffer, delimiter: str = None):
+    if delimiter is not None and not isinstance(buffer, str):
+        delimiter = delimiter.encode('utf-8')
+    for first_line, rows in split_puzzles(iterate_lines(buffer), delimiter):
+        yield parse_rows(rows, first_line)
+
+
+def make_puzzles(file, delimiter: str = None):
+    yield from parse_puzzles(file.read(), delimiter)
+
+
+def read_puzzles(path: str, delimiter: str = None):
+    with open(path, 'rb') as file:
+        if not file.seek(0, 2):
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield from parse_puzzles(buffer, delimiter)
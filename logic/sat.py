@@ -0,0 +1,117 @@
+from itertools import combinations as pairs
+
+from logic import combinations, domain
+from logic.cdcl import Solver
+from logic.exceptions import UnsolvablePuzzleError
+from logic.propagation import reduce_state
+from logic.search import SearchStatistics
+from logic.state import State
+
+__all__ = ['Encoding', 'solve_puzzle_sat', 'count_solutions_sat']
+
+
+def at_most_one(solver: Solver, literals: list):
+    for first, second in pairs(literals, 2):
+        solver.add_clause((-first, -second))
+
+
+class Encoding:
+    __slots__ = ('state', 'solver', 'variables', 'free')
+
+    def __init__(self, state: State):
+        self.state = state
+        self.solver = Solver()
+        self.free = [cell for cell, value in enumerate(state.values)
+                     if not value]
+        self.variables = {(cell, digit): self.solver.new_variable()
+                          for cell in self.free
+                          for digit in domain.to_digits(state.domains[cell])}
+        for cell in self.free:
+            cell_variables = self.cell_variables(cell)
+            self.solver.add_clause(cell_variables)
+            at_most_one(self.solver, cell_variables)
+        for number in range(len(state.layout.blocks)):
+            self.encode_block(number)
+
+    def cell_variables(self, cell: int) -> list:
+        return [self.variables[cell, digit]
+                for digit in domain.to_digits(self.state.domains[cell])]
+
+    def encode_block(self, number: int):
+        block, totals = self.state.layout.blocks[number], self.state.totals
+        free = [cell for cell in block.cells if not self.state.values[cell]]
+        if not free:
+            if totals.sums[number] != block.summary:
+                self.solver.add_clause(())
+            return
+
+        holders = {digit: [self.variables[cell, digit] for cell in free
+                           if (cell, digit) in self.variables]
+                   for digit in domain.DIGITS}
+        reachable = domain.from_digits(digit for digit in domain.DIGITS
+                                       if holders[digit])
+        candidates = [candidate for candidate in combinations.subsets(
+                      block.summary - totals.sums[number], len(free))
+                      if not candidate & (totals.used[number] | ~reachable)]
+        selectors = [self.solver.new_variable() for _ in candidates]
+        self.solver.add_clause(selectors)
+        for digit in domain.DIGITS:
+            at_most_one(self.solver, holders[digit])
+            supporting = [selector for selector, candidate
+                          in zip(selectors, candidates)
+                          if candidate & domain.bit(digit)]
+            for variable in holders[digit]:
+                self.solver.add_clause((-variable, *supporting))
+            for selector, candidate in zip(selectors, candidates):
+                if candidate & domain.bit(digit):
+                    self.solver.add_clause((-selector, *holders[digit]))
+
+    def decode(self, puzzle: dict) -> dict:
+        model = self.solver.model()
+        solution = self.state.to_puzzle(puzzle)
+        for (cell, digit), variable in self.variables.items():
+            if variable in model:
+                solution[self.state.layout.cells[cell]] = digit
+        return solution
+
+    def block_solution(self) -> bool:
+        model = self.solver.model()
+        return self.solver.add_clause(
+            [-variable for variable in self.variables.values()
+             if variable in model])
+
+    def solutions(self, statistics: SearchStatistics = None):
+        statistics = SearchStatistics() if statistics is None else statistics
+        nodes, backtracks = statistics.nodes, statistics.backtracks
+        try:
+            while self.solver.solve():
+                statistics.solutions += 1
+                yield self
+                if not self.free or not self.block_solution():
+                    return
+        finally:
+            statistics.nodes = nodes + self.solver.decisions
+            statistics.backtracks = backtracks + self.solver.conflicts
+
+
+def solve_puzzle_sat(puzzle: dict, statistics: SearchStatistics = None):
+    encoding = Encoding(reduce_state(State(puzzle)))
+    found_solution = False
+    for _ in encoding.solutions(statistics):
+        found_solution = True
+        yield encoding.decode(puzzle)
+    if not found_solution:
+        raise UnsolvablePuzzleError('No solutions were found '
+                                    'by the SAT engine.')
+
+
+def count_solutions_sat(puzzle: dict,
+                        statistics: SearchStatistics = None) -> int:
+    try:
+        encoding = Encoding(reduce_state(State(puzzle)))
+    except UnsolvablePuzzleError:
+        return 0
+    total = 0
+    for _ in encoding.solutions(statistics):
+        total += 1
+    return total
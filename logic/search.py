@@ -0,0 +1,164 @@
+from logic import domain
+from logic.exceptions import UnsolvablePuzzleError
+from logic.heuristics import FirstUnsolved, Strategy
+from logic.propagation import (changed_cells, exclude_state, is_state_valid,
+                               propagate)
+from logic.state import State
+from logic.transposition import TranspositionTable, residual_key
+
+__all__ = ['SearchStatistics', 'decide', 'search', 'count_determined',
+           'count']
+
+
+class SearchStatistics:
+    __slots__ = ('nodes', 'backtracks', 'solutions')
+
+    def __init__(self):
+        self.nodes = self.backtracks = self.solutions = 0
+
+    def __repr__(self) -> str:
+        return ('SearchStatistics(nodes={0}, backtracks={1}, solutions={2})'
+                .format(self.nodes, self.backtracks, self.solutions))
+
+
+def decide(state: State, cell: int, value: int) -> State:
+    mark = state.mark()
+    state.restrict(cell, domain.bit(value))
+    propagate(state, [cell])
+    return exclude_state(state, changed_cells(state, mark))
+
+
+def search(state: State, statistics: SearchStatistics = None,
+           strategy: Strategy = None, table: TranspositionTable = None):
+    def generator(depth: int):
+        statistics.nodes += 1
+        cell = strategy.select(state)
+        if cell is None:
+            if is_state_valid(state):
+                statistics.solutions += 1
+                if tracer is not None:
+                    tracer.solution(state)
+                yield state
+            return
+        for possible_number in strategy.order(state, cell):
+            key = (None if table is None else
+                   residual_key(state, cell, possible_number))
+            if key is not None and table.get(key) == 0:
+                continue
+            mark, solutions = state.mark(), statistics.solutions
+            if tracer is not None:
+                tracer.decision(state, cell, possible_number, depth)
+            try:
+                decide(state, cell, possible_number)
+                yield from generator(depth + 1)
+            except UnsolvablePuzzleError:
+                statistics.backtracks += 1
+                if tracer is not None:
+                    tracer.backtrack(state, cell, possible_number)
+                strategy.on_failure(state)
+            if key is not None and statistics.solutions == solutions:
+                table.put(key, 0)
+            state.undo(mark)
+
+    statistics = SearchStatistics() if statistics is None else statistics
+    strategy = FirstUnsolved() if strategy is None else strategy
+    tracer = state.tracer
+    yield from generator(1)
+
+
+def count_determined(state: State):
+    def partner(cell: int, number: int) -> int:
+        return next(other for other in blocks[number].cells
+                    if other != cell and not values[other])
+
+    def follow(start: int, value: int) -> set:
+        chosen = {start: value}
+        queue = [start]
+        for cell in queue:
+            for number in cell_numbers[cell]:
+                other = partner(cell, number)
+                other_value = (blocks[number].summary - totals.sums[number]
+                               - chosen[cell])
+                if chosen.get(other) == other_value:
+                    continue
+                if (other in chosen or other_value == chosen[cell]
+                        or not 0 < other_value <= len(domain.DIGITS)
+                        or not domains[other] & domain.bit(other_value)):
+                    return set()
+                chosen[other] = other_value
+                queue.append(other)
+        return {*chosen}
+
+    blocks, totals = state.layout.blocks, state.totals
+    for number, block in enumerate(blocks):
+        if totals.remaining[number] not in (0, 2):
+            return None
+        if (not totals.remaining[number]
+                and totals.sums[number] != block.summary):
+            return 0
+
+    values, domains = state.values, state.domains
+    cell_numbers = state.layout.cell_numbers
+    visited, total = set(), 1
+    for start, value in enumerate(values):
+        if value or start in visited:
+            continue
+        if not cell_numbers[start]:
+            return None
+        components = [follow(start, possible_number) for possible_number
+                      in domain.to_digits(domains[start])]
+        choices = sum(map(bool, components))
+        if not choices:
+            return 0
+        visited.update(next(filter(None, components)))
+        total *= choices
+    return total
+
+
+def count(state: State, statistics: SearchStatistics = None,
+          strategy: Strategy = None, table: TranspositionTable = None) -> int:
+    def counter(depth: int) -> int:
+        statistics.nodes += 1
+        cell = strategy.select(state)
+        if cell is None:
+            if not is_state_valid(state):
+                return 0
+            if tracer is not None:
+                tracer.solution(state)
+            return 1
+        total = count_determined(state)
+        if total is not None:
+            if total and tracer is not None:
+                tracer.solution(state, total)
+            return total
+        total = 0
+        for possible_number in strategy.order(state, cell):
+            key = (None if table is None else
+                   residual_key(state, cell, possible_number))
+            subtotal = None if key is None else table.get(key)
+            if subtotal is not None:
+                total += subtotal
+                continue
+            mark, subtotal = state.mark(), 0
+            if tracer is not None:
+                tracer.decision(state, cell, possible_number, depth)
+            try:
+                decide(state, cell, possible_number)
+                subtotal = counter(depth + 1)
+            except UnsolvablePuzzleError:
+                statistics.backtracks += 1
+                if tracer is not None:
+                    tracer.backtrack(state, cell, possible_number)
+                strategy.on_failure(state)
+            if key is not None:
+                table.put(key, subtotal)
+            total += subtotal
+            state.undo(mark)
+        return total
+
+    statistics = SearchStatistics() if statistics is None else statistics
+    strategy = FirstUnsolved() if strategy is None else strategy
+    tracer = state.tracer
+    total = counter(1)
+    statistics.solutions += total
+    return total
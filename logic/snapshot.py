@@ -0,0 +1,130 @@
+import mmap
+import struct
+import sys
+import zlib
+from array import array
+
+from logic import domain
+from logic.error_checker import check_puzzle
+from logic.exceptions import UnsolvablePuzzleError
+from logic.grid import DIGIT, FREE, Grid, to_grid
+from logic.puzzle_maker import make_puzzle, read_puzzles
+from logic.solver import prepare_state
+
+__all__ = ['MAGIC', 'VERSION', 'CHECKED', 'PROPAGATED', 'dump_snapshot',
+           'parse_snapshot', 'iterate_snapshots', 'snapshot_puzzle',
+           'write_snapshots', 'read_snapshots', 'is_snapshot',
+           'load_puzzle', 'load_puzzles']
+
+MAGIC = b'XSUM'
+VERSION = 1
+CHECKED, PROPAGATED = 1, 2
+HEADER = struct.Struct('<4sHHIII')
+
+
+def to_little_endian(contents: array) -> bytes:
+    if sys.byteorder == 'little':
+        return contents.tobytes()
+    swapped = array(contents.typecode, contents)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def dump_snapshot(grid: Grid, flags: int = 0) -> bytes:
+    payload = bytes(grid.kinds) + to_little_endian(grid.contents)
+    return HEADER.pack(MAGIC, VERSION, flags, grid.height, grid.width,
+                       zlib.crc32(payload)) + payload
+
+
+def parse_snapshot(buffer, offset: int = 0) -> tuple:
+    if len(buffer) - offset < HEADER.size:
+        raise ValueError('Snapshot is truncated at byte {0}.'.format(offset))
+    magic, version, flags, height, width, checksum = HEADER.unpack_from(
+        buffer, offset)
+    if magic != MAGIC:
+        raise ValueError('Not a puzzle snapshot at byte {0}.'.format(offset))
+    if version != VERSION:
+        raise ValueError('Unsupported snapshot version {0}, expected {1}.'
+                         .format(version, VERSION))
+    grid = Grid(height, width)
+    start = offset + HEADER.size
+    end = start + len(grid.kinds) * (1 + grid.contents.itemsize)
+    if len(buffer) < end:
+        raise ValueError('Snapshot is truncated at byte {0}.'.format(offset))
+    view = memoryview(buffer)[start:end]
+    try:
+        if zlib.crc32(view) != checksum:
+            raise ValueError('Snapshot checksum does not match at byte {0}.'
+                             .format(offset))
+        grid.kinds[:] = view[:len(grid.kinds)]
+        grid.contents = array(grid.contents.typecode,
+                              view[len(grid.kinds):].tobytes())
+    finally:
+        view.release()
+    if sys.byteorder != 'little':
+        grid.contents.byteswap()
+    return grid, flags, end
+
+
+def iterate_snapshots(buffer):
+    offset = 0
+    while offset < len(buffer):
+        grid, flags, offset = parse_snapshot(buffer, offset)
+        yield grid, flags
+
+
+def snapshot_puzzle(puzzle: dict, propagate: bool = True,
+                    consistency: str = 'sums') -> tuple:
+    grid = to_grid(puzzle)
+    check_puzzle(grid)
+    if not propagate:
+        return grid, CHECKED
+    propagated = prepare_state(grid, consistency).to_puzzle(grid)
+    for index, kind in enumerate(grid.kinds):
+        if kind == FREE and propagated.kinds[index] == DIGIT:
+            propagated.kinds[index] = FREE
+            propagated.contents[index] = domain.bit(
+                propagated.contents[index])
+    return propagated, CHECKED | PROPAGATED
+
+
+def write_snapshots(path: str, puzzles, propagate: bool = True,
+                    consistency: str = 'sums') -> int:
+    total = 0
+    with open(path, 'wb') as file:
+        for puzzle in puzzles:
+            try:
+                snapshot = snapshot_puzzle(puzzle, propagate, consistency)
+            except UnsolvablePuzzleError:
+                snapshot = snapshot_puzzle(puzzle, False)
+            file.write(dump_snapshot(*snapshot))
+            total += 1
+    return total
+
+
+def read_snapshots(path: str):
+    with open(path, 'rb') as file:
+        if not file.seek(0, 2):
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield from iterate_snapshots(buffer)
+
+
+def is_snapshot(path: str) -> bool:
+    with open(path, 'rb') as file:
+        return file.read(len(MAGIC)) == MAGIC
+
+
+def load_puzzle(path: str) -> tuple:
+    if is_snapshot(path):
+        return next(read_snapshots(path))
+    with open(path, encoding='utf-8') as file:
+        return make_puzzle(file), 0
+
+
+def load_puzzles(path: str, delimiter: str = None):
+    if is_snapshot(path):
+        yield from read_snapshots(path)
+        return
+    for puzzle in read_puzzles(path, delimiter):
+        yield puzzle, 0
@@ -1,215 +1,222 @@
-from functools import lru_cache
+from itertools import islice
+from time import perf_counter
+
 from utilities.iterable import Iterable
+from logic import combinations, domain
 from logic.exceptions import UnsolvablePuzzleError
+from logic.decomposition import (count_components, find_components,
+                                 solve_components)
+from logic.layout import BlockTotals, Layout
+from logic.propagation import (BLOCK_FILTERS, exclude_state, filter_block,
+                               filter_blocks, inc, is_state_valid, propagate,
+                               reduce_state)
+from logic.heuristics import STRATEGIES, Strategy, make_strategy
+from logic.sat import count_solutions_sat, solve_puzzle_sat
+from logic.search import SearchStatistics, count, search
+from logic.state import State
+from logic.tracing import Tracer
+from logic.transposition import TranspositionTable
 
 
-def inc(number: int):
-    return number + 1
-
-
-@lru_cache(maxsize=(sum(range(1, 10)) * 9 * 2 ** 9))
 def find_unique_combinations(summary: int, parts_quantity: int,
                              restricted: frozenset = frozenset({})) -> set:
-    @lru_cache(maxsize=(sum(range(1, 10)) * 9 * 2 ** 9))
-    def yield_unique_combinations(number: int, part_count: int,
-                                  restricted_numbers: frozenset):
-        if part_count == 1:
-            if 1 <= number <= 9 and number not in restricted_numbers:
-                yield restricted_numbers.union([number])
-        else:
-            for part in set(range(1, 10)).difference(restricted_numbers):
-                yield from yield_unique_combinations(number - part,
-                                                     part_count - 1,
-                                                     restricted_numbers.union
-                                                     ([part]))
-
-    return set(yield_unique_combinations(summary, parts_quantity, restricted))
-
-
-def get_block(puzzle: dict, hint: tuple, horizontal: bool) -> (int, list):
-    hint_sum = puzzle.get(hint)[horizontal]
-    current = [*iter(hint)]
-    block = []
-    restricted = []
-
-    while True:
-        current[horizontal] += 1
-        current_value = puzzle.get(tuple(current))
-        if current_value is None or isinstance(current_value, tuple):
-            break
-        if isinstance(current_value, int):
-            hint_sum -= current_value
-            restricted.append(current_value)
-        if isinstance(current_value, set):
-            block.append(tuple(current))
-
-    return hint_sum, block, frozenset(restricted)
-
-
-def fill_block(puzzle: dict, hint: tuple, horizontal: bool):
-    hint_sum, block, restricted = get_block(puzzle, hint, horizontal)
-    if not block:
-        return puzzle
-    combinations = find_unique_combinations(hint_sum, len(block), restricted)
-    if combinations == set():
-        raise UnsolvablePuzzleError('No possible sum combination for {0} hint '
-                                    'in {1} line, {2} token.'
-                                    .format('horizontal' if horizontal
-                                            else 'vertical',
-                                            *Iterable(hint).map(inc)))
-
-    possible_numbers = Iterable(combinations).chain().to_set()
-    for cell in block:
-        puzzle[cell] = puzzle.get(cell).intersection(possible_numbers)
-        if puzzle.get(cell) == set():
-            raise UnsolvablePuzzleError('No possible values to fill free '
-                                        'cell in {0} line, {1} token.'
-                                        .format(*Iterable(cell).map(inc)))
-    return puzzle
-
-
-def fill_free_cells(puzzle: dict):
-    hints = (Iterable(puzzle)
-             .filter(lambda cell: isinstance(puzzle.get(cell), tuple)))
-    for hint in hints:
-        value = puzzle.get(hint)
-        if value[0] is not None:
-            fill_block(puzzle, hint, False)
-        if value[1] is not None:
-            fill_block(puzzle, hint, True)
-
-    return puzzle
-
-
-def get_neighbor_cells(puzzle: dict, cell: tuple):
-    def update_current():
-        nonlocal current
-        offset = (Iterable(direction)
-                  .map(lambda number: number * multiplier))
-        current = (Iterable(offset)
-                   .zip(cell)
-                   .to_tuple(lambda iterable: sum(iterable)))
-
-    directions = (Iterable((-1, 1))
-                  .chain(lambda number: ((0, number), (number, 0))))
-    for direction in directions:
-        multiplier = 1
-        current = None
-        update_current()
-        value = puzzle.get(current)
-        while isinstance(value, (int, set)):
-            if isinstance(value, set):
-                yield current
-            multiplier += 1
-            update_current()
-            value = puzzle.get(current)
-
-
-def reduce_puzzle(puzzle: dict) -> dict:
-    def is_cell_solved(cell: tuple):
-        value = puzzle.get(cell)
-        return isinstance(value, set) and len(value) == 1
-
-    was_reduce = True
-    while was_reduce:
-        was_reduce = False
-        puzzle = fill_free_cells(puzzle)
-        solved_cells = (Iterable(puzzle)
-                        .filter(lambda cell: is_cell_solved(cell))
-                        .to_tuple())
-        for solved_cell in solved_cells:
-            was_reduce = True
-            new_value = Iterable(puzzle.get(solved_cell)).first()
-            puzzle[solved_cell] = new_value
-            for neighbor in get_neighbor_cells(puzzle, solved_cell):
-                reduced_cell = puzzle.get(neighbor) - {new_value}
-                if reduced_cell == set():
-                    raise (UnsolvablePuzzleError
-                           ('No possible number after '
-                            'reduce in {0} line, '
-                            '{1} token.'
-                            .format(*Iterable(solved_cell).map(inc))))
-                puzzle[neighbor] = reduced_cell
-
-    return puzzle
-
-
-def exclude_impossible_numbers(puzzle: dict) -> dict:
-    was_reduce = True
-    while was_reduce:
-        was_reduce = False
-        free_cells = (Iterable(puzzle)
-                      .filter(lambda cell:
-                              isinstance(puzzle.get(cell), set)))
-        for free_cell in free_cells:
-            for possible_number in puzzle.get(free_cell):
-                new_puzzle = puzzle.copy()
-                new_puzzle[free_cell] = {possible_number}
-                try:
-                    reduce_puzzle(new_puzzle)
-                except UnsolvablePuzzleError:
-                    reduced_cell = puzzle.get(free_cell) - {possible_number}
-                    if reduced_cell == set():
-                        raise (UnsolvablePuzzleError
-                               ('No possible number after reduce in '
-                                '{0} line, {1} token.'
-                                .format(*Iterable(free_cell).map(inc))))
-                    was_reduce = True
-                    puzzle[free_cell] = reduced_cell
-            reduce_puzzle(puzzle)
-
-    return reduce_puzzle(puzzle)
-
-
-def solve_puzzle(puzzle: dict) -> dict:
-    function_sequence = (reduce_puzzle, exclude_impossible_numbers)
-    for func in function_sequence:
-        puzzle = func(puzzle)
-        if is_puzzle_solved(puzzle):
-            yield puzzle
-            return
-
-    yield from yield_all_possible_solutions(puzzle)
-
-
-def is_puzzle_solved(puzzle: dict) -> bool:
-    return (Iterable(puzzle.values())
-            .count(lambda value: isinstance(value, set))) == 0
-
-
-def yield_all_possible_solutions(puzzle: dict):
-    # noinspection PyShadowingNames
-    def generator(puzzle: dict):
-        nonlocal found_solution
-        first_unsolved_cell = (
-            Iterable(puzzle)
-            .first_or_default(lambda cell: isinstance(puzzle.get(cell), set)))
-        if first_unsolved_cell is None:
-            if is_solution_valid(puzzle):
-                found_solution = True
-                yield puzzle
-            return
-        for possible_number in puzzle.get(first_unsolved_cell):
-            new_puzzle = puzzle.copy()
-            new_puzzle[first_unsolved_cell] = {possible_number}
-            try:
-                reduce_puzzle(new_puzzle)
-                exclude_impossible_numbers(new_puzzle)
-                yield from generator(new_puzzle)
-            except UnsolvablePuzzleError:
-                pass
-
+    restricted_digits = domain.from_digits(restricted)
+    return {frozenset(domain.to_digits(mask | restricted_digits))
+            for mask in combinations.subsets(summary, parts_quantity)
+            if not mask & restricted_digits}
+
+
+def get_block(puzzle: dict, hint: tuple, horizontal: bool,
+              layout: Layout = None, totals: BlockTotals = None) -> tuple:
+    layout = Layout(puzzle) if layout is None else layout
+    number = layout.hint_blocks[hint, horizontal]
+    cells = layout.blocks[number].coordinates
+    block = [cell for cell in cells if domain.is_domain(puzzle.get(cell))]
+    if totals is not None:
+        return (layout.blocks[number].summary - totals.sums[number],
+                block, frozenset(domain.to_digits(totals.used[number])))
+
+    restricted = [puzzle.get(cell) for cell in cells
+                  if not domain.is_domain(puzzle.get(cell))]
+    return (layout.blocks[number].summary - sum(restricted),
+            block, frozenset(restricted))
+
+
+def fill_block(puzzle: dict, hint: tuple, horizontal: bool,
+               layout: Layout = None):
+    state = State(puzzle, layout)
+    number = state.layout.hint_blocks[hint, horizontal]
+    filter_block(state, number)
+    return state.store(puzzle, state.layout.blocks[number].cells)
+
+
+def fill_free_cells(puzzle: dict, layout: Layout = None):
+    state = State(puzzle, layout)
+    filter_blocks(state)
+    return state.store(puzzle)
+
+
+def get_neighbor_cells(puzzle: dict, cell: tuple, layout: Layout = None):
+    layout = Layout(puzzle) if layout is None else layout
+    for neighbor in layout.neighbors[layout.indices[cell]]:
+        if domain.is_domain(puzzle.get(layout.cells[neighbor])):
+            yield layout.cells[neighbor]
+
+
+def reduce_puzzle(puzzle: dict, layout: Layout = None) -> dict:
+    return reduce_state(State(puzzle, layout)).store(puzzle)
+
+
+def exclude_impossible_numbers(puzzle: dict, layout: Layout = None) -> dict:
+    return exclude_state(State(puzzle, layout)).store(puzzle)
+
+
+ENGINES = ('search', 'sat')
+ENGINE_VERSION = 2
+
+
+def check_engine(engine: str):
+    if engine not in ENGINES:
+        raise ValueError('Unknown engine "{0}". Expected one of: {1}.'
+                         .format(engine, ', '.join(ENGINES)))
+
+
+def prepare_state(puzzle: dict, consistency: str = 'sums',
+                  probe: bool = True, tracer: Tracer = None) -> State:
+    if consistency not in BLOCK_FILTERS:
+        raise ValueError('Unknown consistency "{0}". Expected one of: {1}.'
+                         .format(consistency, ', '.join(BLOCK_FILTERS)))
+    started = perf_counter()
+    state = State(puzzle, consistency=consistency, tracer=tracer)
+    function_sequence = ((reduce_state, exclude_state) if probe
+                         else (reduce_state,))
+    try:
+        for func in function_sequence:
+            state = func(state)
+            if state.is_solved():
+                break
+    finally:
+        if tracer is not None:
+            tracer.phase('prepare', perf_counter() - started)
+    return state
+
+
+def solve_puzzle(puzzle: dict, strategy: str = 'first',
+                 statistics: SearchStatistics = None,
+                 consistency: str = 'sums', engine: str = 'search',
+                 table: TranspositionTable = None,
+                 tracer: Tracer = None, prepared: bool = False) -> dict:
+    check_engine(engine)
+    if engine == 'sat':
+        yield from solve_puzzle_sat(puzzle, statistics)
+        return
+    search_strategy = make_strategy(strategy)
+    state = prepare_state(puzzle, consistency, not prepared, tracer)
+    if state.is_solved():
+        if not is_state_valid(state):
+            raise UnsolvablePuzzleError('No solutions were found via brute '
+                                        'force.')
+        yield state.to_puzzle(puzzle)
+        return
+
+    components = find_components(state)
+    if len(components) > 1:
+        yield from solve_components(puzzle, state, components, strategy,
+                                    statistics, table)
+        return
+    yield from yield_all_possible_solutions(puzzle, state.layout, state,
+                                            search_strategy, statistics,
+                                            table)
+
+
+def count_solutions(puzzle: dict, strategy: str = 'first',
+                    statistics: SearchStatistics = None,
+                    consistency: str = 'sums', engine: str = 'search',
+                    table: TranspositionTable = None,
+                    tracer: Tracer = None, prepared: bool = False) -> int:
+    check_engine(engine)
+    if engine == 'sat':
+        return count_solutions_sat(puzzle, statistics)
+    search_strategy = make_strategy(strategy)
+    try:
+        state = prepare_state(puzzle, consistency, not prepared, tracer)
+    except UnsolvablePuzzleError:
+        return 0
+    if state.is_solved():
+        return int(is_state_valid(state))
+
+    components = find_components(state)
+    if len(components) > 1:
+        return count_components(state, components, strategy, statistics,
+                                table)
+    return count(state, statistics, search_strategy, table)
+
+
+UNIQUENESS = ('unsolvable', 'unique', 'multiple')
+
+
+def check_uniqueness(puzzle: dict, strategy: str = 'first',
+                     statistics: SearchStatistics = None,
+                     consistency: str = 'sums', engine: str = 'search',
+                     table: TranspositionTable = None,
+                     tracer: Tracer = None, prepared: bool = False) -> tuple:
+    check_engine(engine)
+    try:
+        if engine == 'sat':
+            solutions = (*islice(solve_puzzle_sat(puzzle, statistics), 2),)
+            return UNIQUENESS[len(solutions)], solutions
+        state = prepare_state(puzzle, consistency, not prepared, tracer)
+        if state.is_solved():
+            solutions = ((state.to_puzzle(puzzle),)
+                         if is_state_valid(state) else ())
+            return UNIQUENESS[len(solutions)], solutions
+        components = find_components(state)
+        solutions = (solve_components(puzzle, state, components, strategy,
+                                      statistics, table)
+                     if len(components) > 1 else
+                     (solution.to_puzzle(puzzle) for solution
+                      in search(state, statistics, make_strategy(strategy),
+                                table)))
+        solutions = (*islice(solutions, 2),)
+    except UnsolvablePuzzleError:
+        solutions = ()
+    return UNIQUENESS[len(solutions)], solutions
+
+
+def compare_strategies(puzzle: dict, limit: int = None,
+                       consistency: str = 'sums') -> dict:
+    report = {}
+    for name in STRATEGIES:
+        statistics = report[name] = SearchStatistics()
+        solutions = solve_puzzle(puzzle, name, statistics, consistency)
+        solutions = (Iterable(solutions).take(limit) if limit is not None
+                     else Iterable(solutions))
+        try:
+            solutions.count()
+        except UnsolvablePuzzleError:
+            pass
+    return report
+
+
+def is_puzzle_solved(puzzle: dict, layout: Layout = None) -> bool:
+    cells = puzzle if layout is None else layout.cells
+    return (Iterable(cells)
+            .count(lambda cell: domain.is_domain(puzzle.get(cell)))) == 0
+
+
+def yield_all_possible_solutions(puzzle: dict, layout: Layout = None,
+                                 state: State = None,
+                                 strategy: Strategy = None,
+                                 statistics: SearchStatistics = None,
+                                 table: TranspositionTable = None):
+    state = State(puzzle, layout) if state is None else state
     found_solution = False
-    yield from generator(puzzle)
+    for solution in search(state, statistics, strategy, table):
+        found_solution = True
+        yield solution.to_puzzle(puzzle)
     if not found_solution:
         raise UnsolvablePuzzleError('No solutions were found via brute force.')
 
 
-def is_solution_valid(puzzle: dict) -> bool:
-    for hint in (Iterable(puzzle)
-                 .filter(lambda cell: isinstance(puzzle.get(cell), tuple))):
-        for orientation in range(2):
-            if puzzle.get(hint)[orientation] is not None:
-                if get_block(puzzle, hint, bool(orientation))[0] != 0:
-                    return False
-    return True
+def is_solution_valid(puzzle: dict, layout: Layout = None) -> bool:
+    return is_state_valid(State(puzzle, layout))
@@ -0,0 +1,95 @@
+from logic import domain
+from logic.grid import DIGIT, Grid
+from logic.layout import BlockTotals, Layout
+
+__all__ = ['State']
+
+
+def read_grid(grid: Grid, cells: tuple) -> tuple:
+    domains, values = [], []
+    for cell in cells:
+        index = grid.index(cell)
+        content = grid.contents[index]
+        is_digit = grid.kinds[index] == DIGIT
+        domains.append(domain.bit(content) if is_digit else content)
+        values.append(content if is_digit else 0)
+    return domains, values
+
+
+class State:
+    __slots__ = ('layout', 'domains', 'values', 'totals', 'trail',
+                 'conflict', 'consistency', 'tracer')
+
+    def __init__(self, puzzle: dict, layout: Layout = None,
+                 consistency: str = 'sums', tracer=None):
+        self.layout = Layout(puzzle) if layout is None else layout
+        if isinstance(puzzle, Grid):
+            self.domains, self.values = read_grid(puzzle, self.layout.cells)
+        else:
+            cells = (puzzle.get(cell) for cell in self.layout.cells)
+            self.domains = [*map(domain.mask_of, cells)]
+            self.values = [0 if domain.is_domain(puzzle.get(cell))
+                           else puzzle.get(cell)
+                           for cell in self.layout.cells]
+        self.totals = BlockTotals(self.layout, puzzle)
+        self.trail = []
+        self.conflict = ()
+        self.consistency = consistency
+        self.tracer = tracer
+
+    def copy(self):
+        state = State.__new__(State)
+        state.layout = self.layout
+        state.domains = self.domains.copy()
+        state.values = self.values.copy()
+        state.totals = self.totals.copy()
+        state.trail = []
+        state.conflict = ()
+        state.consistency = self.consistency
+        state.tracer = self.tracer
+        return state
+
+    def restrict(self, cell: int, mask: int):
+        self.trail.append(cell)
+        self.trail.append(self.domains[cell])
+        self.domains[cell] = mask
+
+    def assign(self, cell: int, value: int):
+        self.trail.append(~cell)
+        self.trail.append(self.domains[cell])
+        self.values[cell] = value
+        self.domains[cell] = domain.bit(value)
+        self.totals.assign(self.layout, cell, value)
+
+    def mark(self) -> int:
+        return len(self.trail)
+
+    def undo(self, mark: int):
+        entries = self.trail[mark:]
+        del self.trail[mark:]
+        domains, values = self.domains, self.values
+        for position in range(len(entries) - 2, -1, -2):
+            cell = entries[position]
+            if cell < 0:
+                cell = ~cell
+                self.totals.unassign(self.layout, cell, values[cell])
+                values[cell] = 0
+            domains[cell] = entries[position + 1]
+
+    def is_solved(self) -> bool:
+        return all(self.values)
+
+    def store(self, puzzle: dict, cells=None) -> dict:
+        if isinstance(puzzle, Grid):
+            for cell in range(len(self.values)) if cells is None else cells:
+                puzzle.assign(self.layout.cells[cell], self.values[cell],
+                              self.domains[cell])
+            return puzzle
+        for cell in range(len(self.values)) if cells is None else cells:
+            value = self.values[cell]
+            puzzle[self.layout.cells[cell]] = (
+                value if value else domain.to_set(self.domains[cell]))
+        return puzzle
+
+    def to_puzzle(self, puzzle: dict) -> dict:
+        return self.store(puzzle.copy())
@@ -0,0 +1,118 @@
+from time import perf_counter
+
+from logic.propagation import find_supports
+from logic.state import State
+from logic.transposition import TranspositionTable
+
+__all__ = ['Tracer', 'Profiler', 'timed']
+
+
+class Tracer:
+    __slots__ = ()
+
+    def decision(self, state: State, cell: int, value: int, depth: int):
+        pass
+
+    def propagation(self, state: State, elapsed: float):
+        pass
+
+    def probe(self, state: State, cell: int, elapsed: float):
+        pass
+
+    def wipe_out(self, state: State):
+        pass
+
+    def backtrack(self, state: State, cell: int, value: int):
+        pass
+
+    def solution(self, state: State, solutions: int = 1):
+        pass
+
+    def phase(self, name: str, elapsed: float):
+        pass
+
+
+def ratio(hits: int, misses: int) -> dict:
+    lookups = hits + misses
+    return {'hits': hits, 'misses': misses,
+            'hit_rate': hits / lookups if lookups else 0.0}
+
+
+class Profiler(Tracer):
+    __slots__ = ('decisions', 'propagations', 'probes', 'wipe_outs',
+                 'backtracks', 'solutions', 'depth', 'propagation_time',
+                 'probe_time', 'phases', 'supports', 'table')
+
+    def __init__(self, table: TranspositionTable = None):
+        self.decisions = self.propagations = self.probes = 0
+        self.wipe_outs = self.backtracks = self.solutions = self.depth = 0
+        self.propagation_time = self.probe_time = 0.0
+        self.phases = {}
+        self.supports = find_supports.cache_info()
+        self.table = table
+
+    def __repr__(self) -> str:
+        return ('Profiler(decisions={0}, backtracks={1}, solutions={2}, '
+                'depth={3})'.format(self.decisions, self.backtracks,
+                                    self.solutions, self.depth))
+
+    def decision(self, state: State, cell: int, value: int, depth: int):
+        self.decisions += 1
+        if depth > self.depth:
+            self.depth = depth
+
+    def propagation(self, state: State, elapsed: float):
+        self.propagations += 1
+        self.propagation_time += elapsed
+
+    def probe(self, state: State, cell: int, elapsed: float):
+        self.probes += 1
+        self.probe_time += elapsed
+
+    def wipe_out(self, state: State):
+        self.wipe_outs += 1
+
+    def backtrack(self, state: State, cell: int, value: int):
+        self.backtracks += 1
+
+    def solution(self, state: State, solutions: int = 1):
+        self.solutions += solutions
+
+    def phase(self, name: str, elapsed: float):
+        self.phases[name] = self.phases.get(name, 0.0) + elapsed
+
+    def report(self) -> dict:
+        supports = find_supports.cache_info()
+        report = {'phases': self.phases.copy(),
+                  'decisions': self.decisions,
+                  'backtracks': self.backtracks,
+                  'solutions': self.solutions,
+                  'depth': self.depth,
+                  'propagations': self.propagations,
+                  'propagation_time': self.propagation_time,
+                  'probes': self.probes,
+                  'probe_time': self.probe_time,
+                  'wipe_outs': self.wipe_outs,
+                  'caches': {'supports': ratio(
+                      supports.hits - self.supports.hits,
+                      supports.misses - self.supports.misses)}}
+        if self.table is not None:
+            report['caches']['table'] = ratio(self.table.hits,
+                                              self.table.misses)
+        return report
+
+
+def timed(iterable, tracer: Tracer, name: str):
+    iterator, elapsed = iter(iterable), 0.0
+    try:
+        while True:
+            started = perf_counter()
+            try:
+                entry = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                elapsed += perf_counter() - started
+            yield entry
+    finally:
+        tracer.phase(name, elapsed)
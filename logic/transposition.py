@@ -0,0 +1,71 @@
+from array import array
+from collections import OrderedDict
+
+from logic import domain
+from logic.state import State
+
+__all__ = ['ENTRY_OVERHEAD', 'residual_key', 'TranspositionTable']
+
+ENTRY_OVERHEAD = 128
+
+
+def residual_key(state: State, cell: int = None, value: int = 0) -> bytes:
+    layout, values, domains = state.layout, state.values, state.domains
+    data = array('H')
+    for index, current in enumerate(values):
+        if not current:
+            data.extend((*layout.cells[index],
+                         domain.bit(value) if index == cell
+                         else domains[index]))
+    totals = state.totals
+    for number, block in enumerate(layout.blocks):
+        remaining = block.summary - totals.sums[number]
+        if totals.remaining[number] or remaining:
+            row, column = block.hint
+            data.extend((row, column << 1 | block.horizontal,
+                         remaining & 0xFFFF))
+    return data.tobytes()
+
+
+class TranspositionTable:
+    __slots__ = ('entries', 'capacity', 'size', 'hits', 'misses',
+                 'evictions')
+
+    def __init__(self, capacity: int = 64 << 20):
+        self.entries = OrderedDict()
+        self.capacity = capacity
+        self.size = self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __repr__(self) -> str:
+        return ('TranspositionTable(entries={0}, size={1}, hits={2}, '
+                'misses={3}, evictions={4})'
+                .format(len(self), self.size, self.hits, self.misses,
+                        self.evictions))
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: bytes):
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return value
+
+    def put(self, key: bytes, value: int):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+        else:
+            self.size += len(key) + ENTRY_OVERHEAD
+        self.entries[key] = value
+        while self.size > self.capacity and self.entries:
+            evicted, _ = self.entries.popitem(last=False)
+            self.size -= len(evicted) + ENTRY_OVERHEAD
+            self.evictions += 1
@@ -0,0 +1,196 @@
+import json
+from itertools import compress
+
+from logic.converter import convert_cells, convert_puzzle
+from logic.grid import DIGIT, FREE, HINT, Grid, to_grid
+
+__all__ = ['FORMATS', 'Template', 'make_template', 'encode_delta',
+           'decode_deltas', 'apply_digits', 'SolutionWriter']
+
+FORMATS = ('text', 'digits', 'json', 'delta')
+DIGITS = bytes.maketrans(bytes(range(10)), b'0123456789')
+CHANGED = bytes([0] + [1] * 255)
+
+
+class Template:
+    __slots__ = ('height', 'width', 'kinds', 'hint_mask', 'hints',
+                 'digit_mask', 'text')
+
+    def __init__(self, grid: Grid, text: bytes):
+        self.height = grid.height
+        self.width = grid.width
+        self.kinds = bytes(grid.kinds)
+        self.hint_mask = bytes(kind == HINT for kind in grid.kinds)
+        self.hints = [*compress(grid.contents, self.hint_mask)]
+        self.digit_mask = bytes(kind == DIGIT for kind in grid.kinds)
+        self.text = text
+
+    def __repr__(self) -> str:
+        return 'Template({0}, {1})'.format(self.height, self.width)
+
+    def matches(self, grid: Grid) -> bool:
+        return (grid.width == self.width and grid.kinds == self.kinds
+                and [*compress(grid.contents, self.hint_mask)] == self.hints)
+
+    def digits(self, grid: Grid) -> bytes:
+        return bytes(compress(grid.contents, self.digit_mask)).translate(
+            DIGITS)
+
+    def render(self, grid: Grid) -> bytes:
+        return self.text % tuple(compress(grid.contents, self.digit_mask))
+
+
+def make_template(grid: Grid) -> Template:
+    if FREE in grid.kinds:
+        return None
+    tokens = convert_cells(grid)
+    length = max(map(len, tokens), default=0) + 1
+    cells = [b'%d' + b' ' * (length - 1) if kind == DIGIT
+             else token.ljust(length).replace('%', '%%').encode('utf-8')
+             for kind, token in zip(grid.kinds, tokens)]
+    return Template(grid, b'\n'.join(
+        b''.join(cells[row * grid.width:(row + 1) * grid.width])
+        for row in range(grid.height)) + b'\n' if grid.height else b'')
+
+
+def render_digits(grid: Grid) -> bytes:
+    return bytes(48 + value if kind == DIGIT else 46
+                 for kind, value in zip(grid.kinds, grid.contents)
+                 if kind in (DIGIT, FREE))
+
+
+def encode_delta(previous: bytes, digits: bytes) -> bytes:
+    length = len(digits)
+    changed = (int.from_bytes(previous, 'big')
+               ^ int.from_bytes(digits, 'big')).to_bytes(
+        length, 'big').translate(CHANGED)
+    pairs, index = [], changed.find(1)
+    while index >= 0:
+        pairs.append(b'%d%c' % (index, digits[index]))
+        index = changed.find(1, index + 1)
+    return b' '.join(pairs)
+
+
+def decode_deltas(lines):
+    digits = None
+    for line_number, line in enumerate(lines):
+        if line.startswith(b'#'):
+            continue
+        if line.startswith(b'='):
+            digits = bytearray(line[1:].rstrip())
+            yield bytes(digits)
+            continue
+        if digits is None:
+            raise ValueError('Delta in {0} line has no full solution before '
+                             'it.'.format(line_number))
+        for token in line.split():
+            index = token[:-1]
+            if (not index.isdigit() or int(index) >= len(digits)
+                    or token[-1] not in b'123456789'):
+                raise ValueError('Invalid delta "{0}" in {1} line.'.format(
+                    token.decode('utf-8', 'replace'), line_number))
+            digits[int(index)] = token[-1]
+        yield bytes(digits)
+
+
+def apply_digits(puzzle: dict, digits: bytes) -> Grid:
+    grid = to_grid(puzzle).copy()
+    indices = [index for index, kind in enumerate(grid.kinds)
+               if kind in (DIGIT, FREE)]
+    if len(indices) != len(digits):
+        raise ValueError('Solution has {0} digits, but the puzzle has {1} '
+                         'white cells.'.format(len(digits), len(indices)))
+    for index, digit in zip(indices, digits):
+        if digit != 46:
+            grid.kinds[index], grid.contents[index] = DIGIT, digit - 48
+    return grid
+
+
+class SolutionWriter:
+    __slots__ = ('sink', 'format', 'buffer_size', 'chunks', 'size',
+                 'template', 'previous')
+
+    def __init__(self, sink, format: str = 'text',
+                 buffer_size: int = 1 << 16):
+        if format not in FORMATS:
+            raise ValueError('Unknown format "{0}". Expected one of: {1}.'
+                             .format(format, ', '.join(FORMATS)))
+        self.sink = sink
+        self.format = format
+        self.buffer_size = buffer_size
+        self.chunks = []
+        self.size = 0
+        self.template = None
+        self.previous = None
+
+    def __repr__(self) -> str:
+        return 'SolutionWriter(format={0!r}, buffered={1})'.format(
+            self.format, self.size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.flush()
+
+    def write(self, data: bytes):
+        self.chunks.append(data)
+        self.size += len(data)
+        if self.size >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self.chunks:
+            self.sink.write(b''.join(self.chunks))
+            self.chunks = []
+            self.size = 0
+        self.sink.flush()
+
+    def layout(self, grid: Grid) -> Template:
+        template = self.template
+        if template is None or not template.matches(grid):
+            template = make_template(grid)
+            if template is not None:
+                self.template = template
+        return template
+
+    def digits(self, grid: Grid) -> bytes:
+        template = self.layout(grid)
+        return (template.digits(grid) if template is not None
+                else render_digits(grid))
+
+    def write_status(self, status: str):
+        if self.format == 'json':
+            line = json.dumps({'uniqueness': status})
+        elif self.format == 'delta':
+            line = '# Uniqueness: {0}'.format(status)
+        else:
+            line = 'Uniqueness: {0}'.format(status)
+        self.write(line.encode('utf-8') + b'\n')
+
+    def write_delta(self, grid: Grid):
+        template = self.template
+        digits = self.digits(grid)
+        previous = self.previous
+        self.previous = digits
+        if (previous is None or len(previous) != len(digits)
+                or self.template is not template):
+            self.write(b'=%s\n' % digits)
+        else:
+            self.write(encode_delta(previous, digits) + b'\n')
+
+    def write_solution(self, number: int, solution: dict):
+        grid = to_grid(solution)
+        if self.format == 'digits':
+            self.write(self.digits(grid) + b'\n')
+        elif self.format == 'delta':
+            self.write_delta(grid)
+        elif self.format == 'json':
+            self.write(b'{"solution": %d, "digits": "%s"}\n'
+                       % (number, self.digits(grid)))
+        else:
+            template = self.layout(grid)
+            body = (template.render(grid) if template is not None else
+                    b''.join(row.encode('utf-8') + b'\n'
+                             for row in convert_puzzle(grid)))
+            self.write(b'Solution #%d\n%s\n' % (number, body))
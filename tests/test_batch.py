@@ -0,0 +1,99 @@
+import os
+import shutil
+import tempfile
+
+from logic import batch
+from tests.decorators import *
+
+RESOURCES = os.path.join(os.path.dirname(__file__), os.pardir,
+                         'test_resources')
+
+
+def resource(name: str) -> str:
+    return os.path.join(RESOURCES, name)
+
+
+def solve_stream(text: str) -> list:
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False,
+                                     encoding='utf-8') as file:
+        file.write(text)
+    try:
+        return [*batch.solve_batch([file.name], count=True, split=True)]
+    finally:
+        os.remove(file.name)
+
+
+def solve_cached(text: str, modes) -> list:
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'puzzle.txt')
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(text)
+    try:
+        return [(lambda record: (record['status'], record.get('error')))(
+            batch.solve_file(path, count=count, cache=directory))
+            for count in modes]
+    finally:
+        shutil.rmtree(directory)
+
+
+class BatchTests(unittest.TestCase):
+    @assert_equality(lambda patterns: [*map(os.path.basename,
+                                            batch.collect_paths(patterns))])
+    def test_collect_paths(self):
+        return [([RESOURCES], ['1.txt', '2.txt', '3.txt', '4.txt']),
+                ([resource('[34].txt'), resource('3.txt')],
+                 ['3.txt', '4.txt']),
+                ([resource('missing.txt')], ['missing.txt'])]
+
+    @assert_equality(lambda path, count: (lambda record:
+                                          (record['status'],
+                                           record.get('count'),
+                                           record.get('error')))
+                     (batch.solve_file(path, count=count)))
+    def test_solve_file(self):
+        return [(resource('4.txt'), True, ('solved', 12, None)),
+                (resource('missing.txt'), True,
+                 ('failed', None, 'FileNotFoundError'))]
+
+    @assert_equality(lambda path, limit: len(batch.solve_file(
+                         path, limit)['solutions']))
+    def test_solution_limit(self):
+        return [(resource('4.txt'), 5, 5), (resource('4.txt'), None, 12)]
+
+    @assert_equality(lambda path: (lambda record:
+                                   (record['uniqueness'],
+                                    len(record['solutions'])))
+                     (batch.solve_file(path, unique=True)))
+    def test_unique(self):
+        return [(resource('3.txt'), ('unique', 1)),
+                (resource('4.txt'), ('multiple', 2))]
+
+    @assert_equality(lambda paths: sorted(
+                         record['file'] for record in batch.solve_batch(
+                             paths, 2, count=True)))
+    def test_solve_batch(self):
+        paths = batch.collect_paths([RESOURCES])
+        return [(paths, sorted(paths))]
+
+    @assert_equality(lambda text: sorted(
+        (record['puzzle'], record['status'], record.get('count'))
+        for record in solve_stream(text)))
+    def test_split(self):
+        return [('\\ 3\\\n\\3 _\n\n\\ 4\\\n\\4 _\n\n\\ 3\\\n\\4 x',
+                 [(1, 'solved', 1), (2, 'solved', 1),
+                  (3, 'failed', None)])]
+
+    @assert_equality(solve_cached)
+    def test_cached_unsolvable(self):
+        unsolvable = ('\\   9\\ 12\\ 8\\\n'
+                      '\\8  _  _   _\n'
+                      '\\6  _  _   _\n'
+                      '\\10 _  _   _\n')
+        return [(unsolvable, [True, False, False],
+                 [('solved', None),
+                  ('failed', 'UnsolvablePuzzleError'),
+                  ('failed', 'UnsolvablePuzzleError')])]
+
+
+if __name__ == '__main__':
+    unittest.main()
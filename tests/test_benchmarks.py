@@ -0,0 +1,97 @@
+import os
+
+from benchmarks import compare, iterable, runner
+from tests.decorators import *
+
+
+def results(environment: dict = None, **phases) -> dict:
+    return {**(environment or {}), 'results': {'a.txt': {
+        phase: {'median': median, 'p90': median, 'min': median, 'peak': peak}
+        for phase, (median, peak) in phases.items()}}}
+
+
+class BenchmarkTests(unittest.TestCase):
+    @assert_equality(runner.percentile)
+    def test_percentile(self):
+        return [([3.0, 1.0, 2.0], 0.5, 2.0),
+                ([1.0, 2.0, 3.0, 4.0], 0.9, 3.7),
+                ([5.0], 0.9, 5.0),
+                ([1.0, 2.0], 0.0, 1.0)]
+
+    @assert_equality(lambda patterns: [
+        os.path.basename(path) for path in runner.collect_corpus(patterns)])
+    def test_collect_corpus(self):
+        return [([os.path.join('test_resources', '[12].txt')],
+                 ['1.txt', '2.txt']),
+                ([os.path.join('test_resources', 'missing.txt')], [])]
+
+    @assert_equality(lambda phases: (lambda report: (
+        report['repeats'], report['reference'] > 0, [*report['results']],
+        [*report['results']['test_resources/4.txt']],
+        sorted(report['results']['test_resources/4.txt']['parse'])))(
+        runner.run_benchmarks([os.path.join('test_resources', '4.txt')], 1,
+                              {name: runner.PHASES[name]
+                               for name in phases})))
+    def test_run_benchmarks(self):
+        return [(['parse', 'enumeration'],
+                 (1, True, ['test_resources/4.txt'], ['parse', 'enumeration'],
+                  ['median', 'min', 'p90', 'peak']))]
+
+    @assert_raises(runner.run_benchmarks, ValueError,
+                   'Repeats must be positive', iterable=False)
+    def test_run_benchmarks_raises(self):
+        return [([], 0)]
+
+    @assert_equality(lambda baseline, current, tolerance: [
+        (regression.phase, regression.metric) for regression
+        in compare.compare_results(baseline, current, tolerance)])
+    def test_compare_results(self):
+        baseline = results(first=(0.1, 1000), parse=(0.0001, 10))
+        return [(baseline, results(first=(0.12, 1000)), 0.25, []),
+                (baseline, results(first=(0.13, 1000)), 0.25,
+                 [('first', 'median')]),
+                (baseline, results(first=(0.1, 2000)), 0.25,
+                 [('first', 'peak')]),
+                (baseline, results(parse=(0.0005, 10)), 0.25, []),
+                (baseline, results(enumeration=(1.0, 10)), 0.25, []),
+                (results({'reference': 0.01}, first=(0.1, 1000)),
+                 results({'reference': 0.02}, first=(0.2, 1000)), 0.25, []),
+                (results({'reference': 0.02}, first=(0.2, 1000)),
+                 results({'reference': 0.01}, first=(0.2, 1000)), 0.25,
+                 [('first', 'median')]),
+                (results({'python': '3.11.7'}, first=(0.1, 1000)),
+                 results({'python': '3.11.2'}, first=(0.1, 1000)), 0.25,
+                 [])]
+
+    @assert_raises(compare.compare_results, ValueError,
+                   'Tolerance must not be negative', iterable=False)
+    def test_compare_results_raises(self):
+        return [(results(), results(), -0.5)]
+
+    @assert_raises(compare.compare_results, ValueError,
+                   'Regenerate the baseline locally', iterable=False)
+    def test_compare_results_environment_raises(self):
+        return [(results({'python': '3.11.7'}), results({'python': '3.12.1'})),
+                (results({'machine': 'x86_64'}),
+                 results({'machine': 'arm64'}))]
+
+    @assert_equality(lambda name, data: (lambda pipeline, comprehension:
+                                         pipeline(data) == comprehension(data))
+                     (*iterable.MICROBENCHMARKS[name]))
+    def test_microbenchmark_results(self):
+        data = [entry % 7 for entry in range(50)]
+        return [(name, data, True) for name in iterable.MICROBENCHMARKS]
+
+    @assert_equality(lambda size: sorted(iterable.run_microbenchmarks(
+        size, 1, {'map': iterable.MICROBENCHMARKS['map']})['map']))
+    def test_run_microbenchmarks(self):
+        return [(10, ['comprehension', 'iterable', 'overhead'])]
+
+    @assert_raises(iterable.run_microbenchmarks, ValueError,
+                   'Size and repeats must be positive', iterable=False)
+    def test_run_microbenchmarks_raises(self):
+        return [(0,), (10, 0)]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,218 @@
+import importlib.util
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from unittest import mock
+
+from logic import cache
+from logic.exceptions import UnsolvablePuzzleError
+from logic.grid import to_grid
+from logic.puzzle_maker import make_puzzle
+from logic.snapshot import snapshot_puzzle
+from logic.solver import count_solutions, solve_puzzle
+from tests.decorators import *
+
+RESOURCES = os.path.join(os.path.dirname(__file__), os.pardir,
+                         'test_resources')
+PUZZLE = {(0, 0): None, (0, 1): (4, None), (0, 2): (3, None),
+          (1, 0): (None, 3), (1, 1): {*range(1, 10)},
+          (1, 2): {*range(1, 10)},
+          (2, 0): (None, 4), (2, 1): {*range(1, 10)},
+          (2, 2): {*range(1, 10)}}
+UNSOLVABLE = ('\\   9\\ 12\\ 8\\\n'
+              '\\8  _  _   _\n'
+              '\\6  _  _   _\n'
+              '\\10 _  _   _\n')
+MAIN = os.path.join(os.path.dirname(__file__), os.pardir, '__main__.py')
+
+
+def load(name: str) -> dict:
+    with open(os.path.join(RESOURCES, name), encoding='utf-8') as file:
+        return make_puzzle(file)
+
+
+def transposed(puzzle: dict) -> dict:
+    return {(column, row): value[::-1] if isinstance(value, tuple)
+            else value for (row, column), value in puzzle.items()}
+
+
+def with_cache(function, **options):
+    directory = tempfile.mkdtemp()
+    solutions_cache = cache.SolutionCache(directory, **options)
+    try:
+        return function(solutions_cache)
+    finally:
+        solutions_cache.close()
+        shutil.rmtree(directory)
+
+
+def store_and_load(puzzle: dict, other: dict, limit: int, count: int):
+    def function(solutions_cache: cache.SolutionCache):
+        solutions = (*solve_puzzle(puzzle),)
+        solutions_cache.put(cache.canonical_key(puzzle), solutions, count)
+        return solutions_cache.solutions(cache.canonical_key(other), other,
+                                         limit)
+
+    return with_cache(function)
+
+
+def evict(capacity: int, operations) -> tuple:
+    def function(solutions_cache: cache.SolutionCache):
+        for name, total in operations:
+            key = (name.encode(), ())
+            if total is None:
+                solutions_cache.count(key)
+            else:
+                solutions_cache.put(key, count=total)
+        return (tuple(key.decode() for key, in solutions_cache.connection
+                      .execute('SELECT key FROM solutions ORDER BY key')),
+                solutions_cache.evictions)
+
+    return with_cache(function, capacity=capacity)
+
+
+def count_twice(puzzle: dict) -> tuple:
+    calls = []
+
+    def counter() -> int:
+        calls.append(None)
+        return count_solutions(puzzle)
+
+    return with_cache(lambda solutions_cache: (
+        cache.cached_count(solutions_cache, puzzle, counter),
+        cache.cached_count(solutions_cache, transposed(puzzle), counter),
+        len(calls)))
+
+
+def solve_twice(puzzle: dict, limit: int) -> tuple:
+    def function(solutions_cache: cache.SolutionCache):
+        first = [*cache.cached_solutions(solutions_cache, puzzle, limit,
+                                         lambda: solve_puzzle(puzzle))]
+        second = [*cache.cached_solutions(solutions_cache, puzzle, limit,
+                                          lambda: iter(()))]
+        return first == second, solutions_cache.hits
+
+    return with_cache(function)
+
+
+def solve_counted(string: str, limit: int) -> list:
+    puzzle = make_puzzle(StringIO(string))
+
+    def function(solutions_cache: cache.SolutionCache):
+        cache.cached_count(solutions_cache, puzzle,
+                           lambda: count_solutions(puzzle))
+        return [*cache.cached_solutions(solutions_cache, puzzle, limit,
+                                        lambda: solve_puzzle(puzzle))]
+
+    return with_cache(function)
+
+
+def run_main(directory: str, *arguments) -> tuple:
+    path = os.path.join(directory, 'puzzle.txt')
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(UNSOLVABLE)
+    process = subprocess.run(
+        [sys.executable, MAIN, '-f', path, '--cache', directory,
+         *arguments], capture_output=True, text=True)
+    return process.returncode, process.stdout, process.stderr.strip()
+
+
+def upgraded(puzzle: dict):
+    def function(solutions_cache: cache.SolutionCache):
+        key = cache.canonical_key(puzzle)
+        solutions_cache.put(key, count=1)
+        with mock.patch.object(cache, 'ENGINE_VERSION', cache.ENGINE_VERSION
+                               + 1):
+            return solutions_cache.count(key)
+
+    return with_cache(function)
+
+
+class CacheTests(unittest.TestCase):
+    @assert_equality(lambda puzzle: cache.transpose(to_grid(puzzle)))
+    def test_transpose(self):
+        return [(PUZZLE, to_grid(transposed(PUZZLE))),
+                (load('1.txt'), to_grid(transposed(load('1.txt'))))]
+
+    @assert_equality(lambda first, second: cache.canonical_key(first)[0] ==
+                     cache.canonical_key(second)[0])
+    def test_canonical_key(self):
+        return [(PUZZLE, transposed(PUZZLE), True),
+                (load('1.txt'), transposed(load('1.txt')), True),
+                (load('1.txt'), load('2.txt'), False),
+                (PUZZLE, {**PUZZLE, (1, 2): 2}, False),
+                (PUZZLE, {**PUZZLE, (1, 1): {1, 2, 3}}, True),
+                *((load(name), snapshot_puzzle(load(name))[0], True)
+                  for name in ('1.txt', '3.txt', '4.txt'))]
+
+    @assert_equality(lambda name: with_cache(lambda solutions_cache: (
+        cache.cached_count(solutions_cache, load(name),
+                           lambda: count_solutions(load(name))),
+        cache.cached_count(solutions_cache, snapshot_puzzle(load(name))[0],
+                           lambda: None),
+        solutions_cache.hits)))
+    def test_snapshot_hits(self):
+        return [('1.txt', (1, 1, 1)), ('4.txt', (12, 12, 1))]
+
+    @assert_equality(store_and_load)
+    def test_solutions(self):
+        puzzle = load('4.txt')
+        solutions = (*solve_puzzle(puzzle),)
+        return [(PUZZLE, PUZZLE, 1, None, (*solve_puzzle(PUZZLE),)),
+                (PUZZLE, transposed(PUZZLE), None, 1,
+                 (to_grid(transposed(next(solve_puzzle(PUZZLE)))),)),
+                (puzzle, puzzle, 3, None, solutions[:3]),
+                (puzzle, puzzle, None, None, None),
+                (puzzle, puzzle, None, len(solutions), solutions[:16]),
+                (puzzle, transposed(puzzle), 20, None, None)]
+
+    @assert_equality(evict)
+    def test_least_recently_used_eviction(self):
+        return [(2, [('a', 1), ('b', 2), ('a', None), ('c', 3)],
+                 (('a', 'c'), 1)),
+                (2, [('a', 1), ('b', 2), ('c', 3), ('d', 4)],
+                 (('c', 'd'), 2)),
+                (3, [('a', 1), ('a', 2)], (('a',), 0))]
+
+    @assert_equality(count_twice)
+    def test_cached_count(self):
+        return [(load('4.txt'), (12, 12, 1)), (PUZZLE, (1, 1, 1))]
+
+    @assert_equality(solve_twice)
+    def test_cached_solutions(self):
+        return [(load('4.txt'), 2, (True, 1)),
+                (load('4.txt'), None, (True, 1)),
+                (load('1.txt'), 1, (True, 1))]
+
+    @assert_raises(solve_counted, UnsolvablePuzzleError, iterable=False)
+    def test_cached_unsolvable(self):
+        return [(UNSOLVABLE, 1), (UNSOLVABLE, None)]
+
+    @unittest.skipUnless(importlib.util.find_spec('PyQt5'),
+                         'the command line interface imports PyQt5')
+    def test_cached_unsolvable_main(self):
+        directory = tempfile.mkdtemp()
+        try:
+            status, output, _ = run_main(directory, '--count')
+            self.assertEqual((status, output.startswith('0 solutions')),
+                             (0, True))
+            for _ in range(2):
+                self.assertEqual(run_main(directory),
+                                 (1, '', 'Puzzle is unsolvable. No solutions '
+                                         'were found via brute force.'))
+        finally:
+            shutil.rmtree(directory)
+
+    @assert_equality(upgraded)
+    def test_engine_version(self):
+        return [(PUZZLE, None)]
+
+    @assert_raises(cache.SolutionCache, ValueError, iterable=False)
+    def test_solution_cache_raises(self):
+        return [(tempfile.gettempdir(), 0), (tempfile.gettempdir(), 1, -1)]
+
+
+if __name__ == '__main__':
+    unittest.main()
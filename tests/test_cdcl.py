@@ -0,0 +1,74 @@
+from logic import cdcl
+from tests.decorators import *
+
+
+def make_solver(variables: int, clauses: list) -> cdcl.Solver:
+    solver = cdcl.Solver()
+    for _ in range(variables):
+        solver.new_variable()
+    for clause in clauses:
+        solver.add_clause(clause)
+    return solver
+
+
+def count_models(solver: cdcl.Solver, variables: int) -> int:
+    total = 0
+    while solver.solve():
+        total += 1
+        model = solver.model()
+        solver.add_clause([-variable if variable in model else variable
+                           for variable in range(1, variables + 1)])
+    return total
+
+
+def pigeonhole(pigeons: int, holes: int) -> list:
+    def variable(pigeon: int, hole: int) -> int:
+        return pigeon * holes + hole + 1
+
+    return ([[variable(pigeon, hole) for hole in range(holes)]
+             for pigeon in range(pigeons)]
+            + [[-variable(first, hole), -variable(second, hole)]
+               for hole in range(holes) for first in range(pigeons)
+               for second in range(first + 1, pigeons)])
+
+
+class CdclTests(unittest.TestCase):
+    @assert_equality(lambda amount: [*map(cdcl.luby, range(amount))])
+    def test_luby(self):
+        return [(15, [1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8])]
+
+    @assert_equality(lambda variables, clauses:
+                     (lambda solver: solver.solve() and solver.model())
+                     (make_solver(variables, clauses)))
+    def test_solve(self):
+        return [(3, [[1, 2], [-1], [-2, 3]], {2, 3}),
+                (2, [[1, 2], [-1, 2], [1, -2], [-1, -2]], False),
+                (1, [[1, -1]], set()),
+                (1, [[]], False)]
+
+    @assert_equality(lambda variables, clauses:
+                     count_models(make_solver(variables, clauses),
+                                  variables))
+    def test_model_enumeration(self):
+        return [(3, [], 8),
+                (3, [[1, 2, 3]], 7),
+                (4, [[1, 2], [-1, -2], [3, 4], [-3, -4]], 4),
+                (12, pigeonhole(4, 3), 0),
+                (12, pigeonhole(3, 4), 60)]
+
+    @assert_equality(lambda clauses: (lambda solver:
+                                      (solver.solve(), solver.conflicts > 0))
+                     (make_solver(42, clauses)))
+    def test_learning_refutes_pigeonhole(self):
+        return [(pigeonhole(7, 6), (False, True))]
+
+    @assert_equality(lambda limit: (lambda solver: (
+        solver.solve(limit), solver.solve()))(
+        make_solver(42, pigeonhole(7, 6))))
+    def test_conflict_limit(self):
+        return [(0, (None, False)),
+                (1 << 20, (False, False))]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+from itertools import combinations as choose
+
+from logic import combinations, domain
+from tests.decorators import *
+
+
+def brute_force_lookup(summary: int, length: int, restricted: int):
+    masks = [domain.from_digits(digits)
+             for digits in choose(domain.DIGITS, length)
+             if sum(digits) == summary
+             and not domain.from_digits(digits) & restricted]
+    if not masks:
+        return 0, 0, 0
+    union, common = 0, domain.FULL_DOMAIN
+    for mask in masks:
+        union |= mask
+        common &= mask
+    return union, common, len(masks)
+
+
+class CombinationsTests(unittest.TestCase):
+    @assert_equality(combinations.lookup)
+    def test_lookup(self):
+        return [(10, 3, 0, (domain.from_digits(range(1, 8)), 0, 4)),
+                (17, 2, 0, (domain.from_digits({8, 9}),
+                            domain.from_digits({8, 9}), 1)),
+                (10, 3, domain.bit(1), (domain.from_digits({2, 3, 5}),
+                                        domain.from_digits({2, 3, 5}), 1)),
+                (45, 9, 0, (domain.FULL_DOMAIN, domain.FULL_DOMAIN, 1)),
+                (0, 0, 0, (0, 0, 1)),
+                (46, 1, 0, (0, 0, 0)), (-1, 1, 0, (0, 0, 0)),
+                (5, 10, 0, (0, 0, 0)), (9, 1, domain.bit(9), (0, 0, 0))]
+
+    @assert_equality(combinations.lookup)
+    def test_lookup_matches_brute_force(self):
+        return [(summary, length, restricted,
+                 brute_force_lookup(summary, length, restricted))
+                for summary in range(1, 46, 4)
+                for length in range(1, 10)
+                for restricted in (0, 0b1, 0b100010000, 0b11110000)]
+
+    @assert_equality(lambda *args: (combinations.possible_digits(*args),
+                                    combinations.required_digits(*args),
+                                    combinations.count_combinations(*args)))
+    def test_accessors(self):
+        return [(*args, combinations.lookup(*args))
+                for args in ((10, 3, 0), (24, 3, 0), (16, 5, domain.bit(1)),
+                             (50, 2, 0))]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,7 +9,9 @@ class ConverterTests(unittest.TestCase):
                   (2, 0): {1}, (2, 1): (None, 3)}
         return [(puzzle, ('1      1\\     ',
                           '{1, 2} \\      ',
-                          '{1}    \\3     '))]
+                          '{1}    \\3     ')),
+                ({(0, 0): (3, None), (1, 0): {*range(1, 10)}},
+                 ('3\\ ', '_  '))]
 
 
 if __name__ == '__main__':
@@ -0,0 +1,56 @@
+from itertools import count, product
+
+from logic import decomposition
+from logic.puzzle_maker import make_puzzle
+from logic.solver import count_solutions, prepare_state, solve_puzzle
+from tests.decorators import *
+
+PUZZLE = ('\\ 5\\ 4\\ \\ 5\\ 4\\\n'
+          '\\4 _ _ \\4 _ _\n'
+          '\\5 _ _ \\5 _ _')
+
+
+def make_state(string: str):
+    return prepare_state(make_puzzle(StringIO(string)))
+
+
+class DecompositionTests(unittest.TestCase):
+    @assert_equality(decomposition.find_components)
+    def test_find_components(self):
+        return [(make_state(PUZZLE), [(0, 1, 4, 5), (2, 3, 6, 7)]),
+                (make_state('\\   6\\ 6\\  6\\\n'
+                            '\\6  _  _   _\n'
+                            '\\6  _  _   _\n'
+                            '\\6  _  _   _'), [tuple(range(9))])]
+
+    @assert_equality(lambda string, component:
+                     decomposition.component_puzzle(make_state(string),
+                                                    component))
+    def test_component_puzzle(self):
+        return [(PUZZLE, (2, 3, 6, 7),
+                 {(0, 4): (5, None), (0, 5): (4, None), (1, 3): (None, 4),
+                  (2, 3): (None, 5), (1, 4): {1, 3}, (1, 5): {1, 3},
+                  (2, 4): {2, 4}, (2, 5): {1, 3}})]
+
+    @assert_equality(lambda iterables: [*decomposition.lazy_product(
+                         *iterables)])
+    def test_lazy_product(self):
+        return [(((1, 2), 'ab', (3,)), [*product((1, 2), 'ab', (3,))]),
+                (((1, 2), ()), []),
+                ((), [()])]
+
+    @assert_equality(lambda iterables: next(decomposition.lazy_product(
+                         *iterables)))
+    def test_lazy_product_is_lazy(self):
+        return [((count(), count(1)), (0, 1))]
+
+    @assert_equality(lambda string: (len([*solve_puzzle(make_puzzle(
+                                         StringIO(string)))]),
+                                     count_solutions(make_puzzle(
+                                         StringIO(string)))))
+    def test_solve_components(self):
+        return [(PUZZLE, (4, 4))]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+from logic import domain
+from tests.decorators import *
+
+
+class DomainTests(unittest.TestCase):
+    @assert_equality(domain.from_digits)
+    def test_from_digits(self):
+        return [((), domain.EMPTY_DOMAIN), ((1,), 0b1), ((9,), 0b100000000),
+                ({1, 3, 9}, 0b100000101), (range(1, 10), domain.FULL_DOMAIN)]
+
+    @assert_equality(domain.to_digits)
+    def test_to_digits(self):
+        return [(domain.EMPTY_DOMAIN, ()), (0b100000101, (1, 3, 9)),
+                (domain.FULL_DOMAIN, tuple(range(1, 10)))]
+
+    @assert_equality(lambda mask: (domain.popcount(mask),
+                                   domain.lowest_digit(mask),
+                                   domain.is_singleton(mask)))
+    def test_mask_helpers(self):
+        return [(domain.EMPTY_DOMAIN, (0, 0, False)),
+                (0b10000, (1, 5, True)),
+                (0b110100, (3, 3, False)),
+                (domain.FULL_DOMAIN, (9, 1, False))]
+
+    @assert_equality(domain.mask_of)
+    def test_mask_of(self):
+        return [(7, 0b1000000), ({2, 4}, 0b1010), (set(), 0)]
+
+
+if __name__ == '__main__':
+    unittest.main()
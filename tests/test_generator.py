@@ -0,0 +1,65 @@
+from random import Random
+
+from logic import generator
+from logic.converter import convert_puzzle
+from logic.error_checker import check_puzzle
+from logic.puzzle_maker import make_puzzle
+from logic.solver import check_uniqueness
+from tests.decorators import *
+
+
+def generate(rows: int, columns: int, seed: int, **options) -> dict:
+    return generator.generate_puzzle(rows, columns, rng=Random(seed),
+                                     **options)
+
+
+def round_trip(puzzle: dict) -> dict:
+    return make_puzzle(StringIO('\n'.join(convert_puzzle(puzzle))))
+
+
+def runs(white: list) -> list:
+    return [len(run) for line in [*white, *zip(*white)]
+            for run in ''.join('#' if cell else ' '
+                               for cell in line).split() if run]
+
+
+class GeneratorTests(unittest.TestCase):
+    @assert_equality(lambda rows, columns, density: (lambda white: (
+        len(white), {*map(len, white)}, not any(white[0] + white[-1]),
+        all(2 <= length <= generator.MAXIMUM_RUN for length in runs(white))))(
+        generator.make_layout(rows, columns, density, Random(7))))
+    def test_make_layout(self):
+        return [(12, 15, 0.8, (13, {16}, True, True)),
+                (30, 30, 1.0, (31, {31}, True, True))]
+
+    @assert_equality(lambda rows, columns, seed: (lambda puzzle: (
+        check_puzzle(puzzle), round_trip(puzzle) == puzzle,
+        max(puzzle)))(generate(rows, columns, seed)))
+    def test_generate_puzzle(self):
+        return [(8, 8, 1, (None, True, (7, 7))),
+                (30, 30, 2, (None, True, (29, 29)))]
+
+    @assert_equality(lambda seed: [*generator.generate_puzzles(
+        3, 10, 10, seed=seed)] == [*generator.generate_puzzles(
+        3, 10, 10, seed=seed)])
+    def test_seed(self):
+        return [(5, True), (11, True)]
+
+    @assert_equality(lambda seed: check_uniqueness(
+        generate(10, 10, seed, unique=True))[0])
+    def test_unique(self):
+        return [(3, 'unique'), (4, 'unique')]
+
+    @assert_equality(lambda seed, nodes: nodes[0] <= generator.count_nodes(
+        generate(6, 6, seed, nodes=nodes), nodes[1]) <= nodes[1])
+    def test_nodes(self):
+        return [(6, (0, 8), True), (6, (10, 20), True)]
+
+    @assert_raises(generator.generate_puzzle, ValueError, iterable=False)
+    def test_generate_puzzle_raises(self):
+        return [(2, 10), (10, 10, 0.0), (10, 10, 1.5),
+                (10, 10, 0.8, None, False, (5, 2))]
+
+
+if __name__ == '__main__':
+    unittest.main()
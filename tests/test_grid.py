@@ -0,0 +1,53 @@
+import pickle
+
+from logic import grid
+from tests.decorators import *
+
+PUZZLE = {(0, 0): None, (0, 1): (4, None), (0, 2): (3, None),
+          (1, 0): (None, 3), (1, 1): {1, 2}, (1, 2): 1,
+          (2, 0): (None, 4), (2, 1): {*range(1, 10)}, (2, 2): set()}
+
+
+class GridTests(unittest.TestCase):
+    @assert_equality(lambda puzzle: grid.Grid.from_dict(puzzle).to_dict())
+    def test_round_trip(self):
+        return [(PUZZLE, PUZZLE), ({}, {}),
+                ({(0, 1): (0, 45), (1, 0): 9},
+                 {(0, 0): None, (0, 1): (0, 45), (1, 0): 9, (1, 1): None})]
+
+    @assert_equality(lambda puzzle, cell: (lambda subject: (
+        subject.get(cell), cell in subject))(grid.to_grid(puzzle)))
+    def test_get(self):
+        return [(PUZZLE, (1, 1), ({1, 2}, True)),
+                (PUZZLE, (0, 2), ((3, None), True)),
+                (PUZZLE, (3, 0), (None, False)),
+                (PUZZLE, (0, -1), (None, False))]
+
+    @assert_equality(lambda puzzle, kinds: grid.to_grid(puzzle).positions(
+        *kinds))
+    def test_positions(self):
+        return [(PUZZLE, (grid.FREE,), ((1, 1), (2, 1), (2, 2))),
+                (PUZZLE, (grid.DIGIT, grid.HINT),
+                 ((0, 1), (0, 2), (1, 0), (1, 2), (2, 0)))]
+
+    @assert_equality(lambda puzzle, cell, value: (lambda subject, copy: (
+        copy.update({cell: value}), subject == puzzle, copy[cell],
+        copy == subject))(*(lambda subject: (subject, subject.copy()))(
+        grid.to_grid(puzzle))))
+    def test_copy(self):
+        return [(PUZZLE, (1, 1), 2, (None, True, 2, False)),
+                (PUZZLE, (0, 0), (None, 7), (None, True, (None, 7), False))]
+
+    @assert_equality(lambda puzzle: pickle.loads(pickle.dumps(
+        grid.to_grid(puzzle))) == grid.to_grid(puzzle))
+    def test_pickle(self):
+        return [(PUZZLE, True)]
+
+    @assert_raises(lambda cell, value: grid.to_grid(PUZZLE).__setitem__(
+        cell, value), (KeyError, ValueError), iterable=False)
+    def test_set_raises(self):
+        return [((3, 0), 1), ((0, 3), None), ((0, 0), (1 << 16, None))]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+from logic import domain, heuristics
+from logic.puzzle_maker import make_puzzle
+from logic.solver import solve_puzzle
+from logic.state import State
+from tests.decorators import *
+
+
+def make_state(string: str) -> State:
+    return State(make_puzzle(StringIO(string)))
+
+
+class HeuristicsTests(unittest.TestCase):
+    @assert_equality(lambda strategy, state:
+                     state.layout.cells[heuristics.make_strategy(strategy)
+                                        .select(state)])
+    def test_select(self):
+        state = make_state('\\ 6\\ 15\\ 24\\\n'
+                           '\\6 _ _ _\n'
+                           '\\15 _ _ _\n'
+                           '\\24 _ _ _')
+        state.restrict(4, domain.from_digits({2, 3}))
+        return [('first', state, (1, 1)), ('mrv', state, (2, 2)),
+                ('block', state, (1, 1)), ('domwdeg', state, (2, 2)),
+                ('lcv', state, (2, 2))]
+
+    @assert_equality(lambda strategy, state, cell:
+                     heuristics.make_strategy(strategy).order(state, cell))
+    def test_order(self):
+        state = make_state('\\ 6\\ 15\\ 24\\\n'
+                           '\\6 _ _ _\n'
+                           '\\15 _ _ _\n'
+                           '\\24 _ _ _')
+        return [('first', state, 1, tuple(range(1, 10))),
+                ('lcv', state, 1, (2, 5, 1, 3, 4, 6, 8, 7, 9))]
+
+    @assert_equality(lambda strategy: {tuple(sorted(solution.items()))
+                                       for solution in solve_puzzle(
+                                           make_puzzle(StringIO(
+                                               '\\   6\\ 6\\  6\\\n'
+                                               '\\6  _  _   _\n'
+                                               '\\6  _  _   _\n'
+                                               '\\6  _  _   _')),
+                                           strategy)})
+    def test_strategies_agree(self):
+        expected = {tuple(sorted(solution.items()))
+                    for solution in solve_puzzle(make_puzzle(StringIO(
+                        '\\   6\\ 6\\  6\\\n'
+                        '\\6  _  _   _\n'
+                        '\\6  _  _   _\n'
+                        '\\6  _  _   _')))}
+        return [(name, expected) for name in heuristics.STRATEGIES]
+
+    @assert_raises(heuristics.make_strategy, ValueError,
+                   'Unknown strategy "random".', iterable=False)
+    def test_unknown_strategy(self):
+        return [('random',)]
+
+
+if __name__ == '__main__':
+    unittest.main()
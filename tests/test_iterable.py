@@ -0,0 +1,71 @@
+from utilities import iterable
+from tests.decorators import *
+
+
+def increment(entry: int) -> int:
+    return entry + 1
+
+
+def is_odd(entry: int) -> bool:
+    return entry % 2 == 1
+
+
+class IterableTests(unittest.TestCase):
+    @assert_equality(lambda data, stages: iterable.fuse(iter(data), stages),
+                     iterable=True)
+    def test_fuse(self):
+        return [([1, 2, 3], [(False, increment)], (2, 3, 4)),
+                ([1, 2, 3], [(True, is_odd)], (1, 3)),
+                ([1, 2, 3], [(False, increment), (True, is_odd)], (3,)),
+                ([1, 2, 3], [(True, is_odd), (False, increment)], (2, 4)),
+                ([1, 2, 3, 4], [(False, increment), (False, increment),
+                                (True, is_odd), (False, str)], ('3', '5')),
+                ([1, 2, 3], [], (1, 2, 3))]
+
+    @assert_equality(lambda data, selectors: Iterable(data)
+                     .to_tuple(*selectors))
+    def test_to_tuple(self):
+        return [([1, 2], (), (1, 2)),
+                ([1, 2], (increment,), (2, 3)),
+                ([1, 2], (increment, str), ('2', '3')),
+                ([], (increment,), ())]
+
+    @assert_equality(lambda data, predicate: (
+        Iterable(data).map(increment).count(predicate)))
+    def test_count(self):
+        return [([1, 2, 3], None, 3), ([1, 2, 3], is_odd, 1),
+                ([], is_odd, 0), ([], None, 0)]
+
+    @assert_equality(lambda data, predicate, default: Iterable(data)
+                     .filter(is_odd).first_or_default(predicate, default))
+    def test_first_or_default(self):
+        return [([2, 3, 5], None, 0, 3),
+                ([2, 3, 5], lambda entry: entry > 3, 0, 5),
+                ([2, 4], None, 0, 0),
+                ([3, 5], lambda entry: entry > 5, None, None)]
+
+    @assert_equality(lambda data, key_selector: Iterable(data)
+                     .distinct(key_selector).to_list())
+    def test_distinct(self):
+        return [([3, 1, 3, 2, 1], lambda entry: entry, [3, 1, 2]),
+                ([[1], [2], [1]], lambda entry: entry, [[1], [2]]),
+                ([(1, 'a'), (2, 'b'), (1, 'c')], lambda entry: [entry[0]],
+                 [(1, 'a'), (2, 'b')]),
+                ([{1}, {2}, {1, 3}], len, [{1}, {1, 3}])]
+
+    @assert_equality(lambda data: Iterable(data).distinct().to_list())
+    def test_distinct_default(self):
+        return [([3, 1, 3, 2, 1], [3, 1, 2]),
+                ([[1], [2], [1]], [[1], [2]]),
+                ([1, [1], 1, [1]], [1, [1]]),
+                ([], [])]
+
+    @assert_equality(lambda data, selectors: Iterable(data)
+                     .chain(*selectors).to_tuple())
+    def test_chain(self):
+        return [([[1], [], [2, 3]], (), (1, 2, 3)),
+                ([1, 3], (lambda entry: range(entry),), (0, 0, 1, 2))]
+
+
+if __name__ == '__main__':
+    unittest.main()
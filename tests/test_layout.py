@@ -0,0 +1,63 @@
+from logic import domain, layout
+from logic.puzzle_maker import make_puzzle
+from tests.decorators import *
+
+
+def make_example_layout():
+    return layout.Layout(make_puzzle(StringIO(
+        '\\   23\\ 30\\   \\     \\     27\\ 12\\ 16\\\n'
+        '\\16 _   _     \\     17\\24 _   _   _\n'
+        '\\17 _   _     15\\29 _     _   _   _\n'
+        '\\35 _   _     _     _     _   12\\ \\\n'
+        '\\   \\7  _     _     7\\8   _   _   7\\\n'
+        '\\   11\\ 10\\16 _     _     8   _   _\n'
+        '\\21 _   _     _     _     \\5  _   _\n'
+        '\\6  _   _     _     \\     \\3  _   _')))
+
+
+class LayoutTests(unittest.TestCase):
+    @assert_equality(lambda subject, hint, horizontal:
+                     (subject.block_of(hint, horizontal).coordinates,
+                      subject.block_of(hint, horizontal).summary))
+    def test_block_of(self):
+        subject = make_example_layout()
+        return [(subject, (2, 3), False,
+                 (tuple((number, 3) for number in range(3, 8)), 15)),
+                (subject, (3, 0), True,
+                 (tuple((3, number) for number in range(1, 6)), 35)),
+                (subject, (5, 2), True,
+                 (((5, 3), (5, 4), (5, 5), (5, 6), (5, 7)), 16))]
+
+    @assert_equality(lambda subject, cell:
+                     (Iterable(subject.neighbors[subject.indices[cell]])
+                      .to_set(lambda index: subject.cells[index])))
+    def test_neighbors(self):
+        subject = make_example_layout()
+        return [(subject, (3, 2),
+                 {(3, 1), (3, 3), (3, 4), (3, 5), (1, 2), (2, 2), (4, 2)}),
+                (subject, (6, 4), {(6, 1), (6, 2), (6, 3), (5, 4)}),
+                (subject, (5, 5), {(5, 3), (5, 4), (5, 6), (5, 7), (1, 5),
+                                   (2, 5), (3, 5), (4, 5)})]
+
+    @assert_equality(lambda subject, hint, horizontal:
+                     (lambda totals, number:
+                      (totals.sums[number], totals.remaining[number],
+                       totals.used[number]))
+                     (layout.BlockTotals(subject[0], subject[1]),
+                      subject[0].hint_blocks[hint, horizontal]))
+    def test_block_totals(self):
+        puzzle = make_puzzle(StringIO('\\ 4\\ 9\\\n\\6 _ 5\n\\7 _ _'))
+        subject = (layout.Layout(puzzle), puzzle)
+        return [(subject, (1, 0), True, (5, 1, domain.bit(5))),
+                (subject, (0, 2), False, (5, 1, domain.bit(5))),
+                (subject, (2, 0), True, (0, 2, domain.EMPTY_DOMAIN))]
+
+    @assert_equality(lambda subject: subject.cell_blocks)
+    def test_cell_blocks(self):
+        subject = layout.Layout(make_puzzle(StringIO(
+            '1 \\ 4\\ 9\\\n\\ \\6 _ _\n\\ \\7 _ _')))
+        return [(subject, ((None, None), (0, 2), (1, 2), (0, 3), (1, 3)))]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import multiprocessing
+from unittest import mock
+
+from logic import parallel
+from logic.puzzle_maker import make_puzzle
+from logic.solver import prepare_state, solve_puzzle
+from logic.state import State
+from tests.decorators import *
+
+PUZZLE = ('\\   6\\ 6\\  6\\\n'
+          '\\6  _  _   _\n'
+          '\\6  _  _   _\n'
+          '\\6  _  _   _')
+OPEN = ('\\   25\\ 25\\ 25\\ 25\\ 25\\\n'
+        + '\\25 _  _  _  _  _\n' * 5)
+
+
+def stop_early(string: str, limit: int) -> list:
+    solutions = parallel.solve_puzzle_parallel(
+        make_puzzle(StringIO(string)), 2, 1, limit=limit)
+    next(solutions)
+    solutions.close()
+    return multiprocessing.active_children()
+
+
+def unpropagated(function, string: str):
+    puzzle = make_puzzle(StringIO(string))
+    with mock.patch.object(parallel, 'prepare_state',
+                           lambda *arguments: State(puzzle)):
+        return function(puzzle)
+
+
+def chunked(string: str, ordered: bool) -> bool:
+    puzzle = make_puzzle(StringIO(string))
+    with mock.patch.object(parallel, 'CHUNK_SIZE', 1):
+        solutions = [*parallel.solve_puzzle_parallel(puzzle, 2, 1,
+                                                     ordered=ordered)]
+    expected = [*solve_puzzle(puzzle)]
+    return (solutions == expected if ordered else
+            len(solutions) == len(expected)
+            and all(solution in expected for solution in solutions))
+
+
+class ParallelTests(unittest.TestCase):
+    @assert_equality(lambda string, depth:
+                     Iterable(parallel.split_search(
+                         prepare_state(make_puzzle(StringIO(string))),
+                         depth)).to_tuple(len))
+    def test_split_search(self):
+        return [(PUZZLE, 0, (0,)),
+                (PUZZLE, 1, (1, 1, 1)),
+                (PUZZLE, 9, (3,) * 12)]
+
+    @assert_equality(lambda string, arguments:
+                     [*parallel.solve_puzzle_parallel(
+                         make_puzzle(StringIO(string)), *arguments)]
+                     == [*solve_puzzle(make_puzzle(StringIO(string)))])
+    def test_ordered_solutions(self):
+        return [(PUZZLE, (2, 1), True),
+                (PUZZLE, (1, 0), True)]
+
+    @assert_equality(lambda string: parallel.count_solutions_parallel(
+                         make_puzzle(StringIO(string)), 2, 1))
+    def test_count_solutions(self):
+        return [(PUZZLE, 12)]
+
+    @assert_equality(stop_early)
+    def test_stop_early(self):
+        return [(OPEN, 1, []), (OPEN, None, []), (PUZZLE, None, [])]
+
+    @assert_equality(chunked)
+    def test_chunked_solutions(self):
+        return [(PUZZLE, True, True), (PUZZLE, False, True)]
+
+    @assert_equality(lambda string: unpropagated(
+        lambda puzzle: parallel.count_solutions_parallel(puzzle, 2, 1),
+        string))
+    def test_count_assigned_state(self):
+        return [('\\ 5\\ 4\\\n\\4 1 3\n\\5 4 1', 1),
+                ('\\ 5\\ 4\\\n\\4 1 3\n\\5 2 3', 0)]
+
+    @assert_equality(lambda string: unpropagated(
+        lambda puzzle: len([*parallel.solve_puzzle_parallel(puzzle, 2, 1)]),
+        string))
+    def test_solve_assigned_state(self):
+        return [('\\ 5\\ 4\\\n\\4 1 3\n\\5 4 1', 1)]
+
+    @assert_raises(lambda string: unpropagated(
+                       lambda puzzle: [*parallel.solve_puzzle_parallel(
+                           puzzle, 2, 1)], string),
+                   RuntimeError, 'No solutions were found via brute force.',
+                   iterable=False)
+    def test_invalid_assigned_state(self):
+        return [('\\ 5\\ 4\\\n\\4 1 3\n\\5 2 3',)]
+
+    @assert_raises(lambda string: [*parallel.solve_puzzle_parallel(
+                       make_puzzle(StringIO(string)), 2, 1)],
+                   RuntimeError, 'No solutions were found via brute force.',
+                   iterable=False)
+    def test_unsolvable_puzzle(self):
+        return [('\\   9\\ 12\\ 8\\\n'
+                 '\\8  _  _   _\n'
+                 '\\6  _  _   _\n'
+                 '\\10 _  _   _\n',)]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+from logic import domain, propagation
+from logic.puzzle_maker import make_puzzle
+from logic.state import State
+from tests.decorators import *
+
+ASSIGNED = '\\ \\ \\\n\\ 14\\ 7\\\n\\14 _ _\n\\8 _ _\n\\ \\ \\'
+WRONG = '\\ 5\\ 4\\\n\\4 1 3\n\\5 2 3'
+
+
+def make_state(string: str) -> State:
+    return propagation.reduce_state(State(make_puzzle(StringIO(string))))
+
+
+def describe(state: State) -> tuple:
+    return tuple(map(domain.to_digits, state.domains))
+
+
+class PropagationTests(unittest.TestCase):
+    @assert_equality(lambda state, cell:
+                     (lambda result: (domain.to_digits(result[0]),
+                                      {other: domain.to_digits(support)
+                                       for other, support
+                                       in result[1].items()}))
+                     (propagation.probe_cell(state, cell)))
+    def test_probe_cell(self):
+        state = make_state('\\ 5\\ 4\\\n\\4 _ _\n\\5 _ _')
+        return [(state, 0, ((), {0: (1, 3), 1: (1, 3), 2: (2, 4),
+                                 3: (1, 3)}))]
+
+    @assert_equality(lambda state, cell: (propagation.probe_cell(state, cell),
+                                          describe(state))[1])
+    def test_probe_cell_restores_state(self):
+        state = make_state('\\ 5\\ 4\\\n\\4 _ _\n\\5 _ _')
+        return [(state, 0, describe(state))]
+
+    @assert_equality(lambda state, cells:
+                     describe(propagation.exclude_state(state, cells)))
+    def test_exclude_state_reuses_probes(self):
+        return [(make_state('\\ 5\\ 4\\\n\\4 _ _\n\\5 _ _'), [0],
+                 ((1, 3), (1, 3), (2, 4), (1, 3)))]
+
+    @assert_equality(lambda state, mark: propagation.changed_cells(state,
+                                                                   mark))
+    def test_changed_cells(self):
+        state = make_state('\\ 5\\ 4\\\n\\4 _ _\n\\5 _ _')
+        mark = state.mark()
+        state.restrict(0, domain.bit(1))
+        propagation.propagate(state, [0])
+        return [(state, mark, {0, 1, 2, 3})]
+
+    @assert_raises(lambda state: propagation.exclude_state(state),
+                   RuntimeError, 'No possible number after reduce in '
+                                 '\\d+ line, \\d+ token.', iterable=False)
+    def test_exclude_state_wipe_out(self):
+        return [(make_state('\\ 3\\ 5\\\n\\3 _ _\n\\7 _ _'),)]
+
+    @assert_raises(lambda state: propagation.exclude_state(state),
+                   RuntimeError, 'No possible number after reduce in '
+                                 '\\d+ line, \\d+ token.', iterable=False)
+    def test_exclude_state_assigned_block(self):
+        return [(make_state(ASSIGNED),)]
+
+    @assert_equality(lambda cell_domains, candidates:
+                     propagation.find_supports(cell_domains, candidates))
+    def test_find_supports(self):
+        return [((domain.from_digits({1}), domain.from_digits({2, 3, 4})),
+                 (domain.from_digits({1, 4}), domain.from_digits({2, 3})),
+                 ((domain.from_digits({1, 4}),),
+                  (domain.from_digits({1}), domain.from_digits({4})))),
+                ((domain.from_digits({1, 2}), domain.from_digits({1, 2})),
+                 (domain.from_digits({1, 3}),), ((), (0, 0)))]
+
+    @assert_equality(lambda string, consistency:
+                     describe(propagation.reduce_state(
+                         State(make_puzzle(StringIO(string)),
+                               consistency=consistency))))
+    def test_filter_combinations(self):
+        string = '\\ 3\\ 8\\\n\\5 _ _\n\\6 _ _'
+        return [(string, 'sums', ((1, 2), (1, 2, 3), (1, 2), (1, 2, 5))),
+                (string, 'combinations', ((2,), (3,), (1,), (5,)))]
+
+    @assert_raises(lambda state: propagation.reduce_state(state),
+                   RuntimeError, 'No possible sum combination for '
+                                 '\\w+ hint in \\d+ line, \\d+ token.',
+                   iterable=False)
+    def test_filter_combinations_wipe_out(self):
+        string = '\\ 3\\ 5\\\n\\3 _ _\n\\7 _ _'
+        return [(State(make_puzzle(StringIO(string)),
+                       consistency='combinations'),),
+                (State(make_puzzle(StringIO(ASSIGNED)),
+                       consistency='combinations'),)]
+
+    @assert_raises(lambda state: propagation.reduce_state(state),
+                   RuntimeError, 'No possible sum combination for '
+                                 '\\w+ hint in \\d+ line, \\d+ token.',
+                   iterable=False)
+    def test_filter_assigned_block(self):
+        return [(State(make_puzzle(StringIO(WRONG)),
+                       consistency=consistency),)
+                for consistency in ('sums', 'combinations')]
+
+
+if __name__ == '__main__':
+    unittest.main()
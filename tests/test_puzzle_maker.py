@@ -1,6 +1,25 @@
+import os
+import tempfile
+
 from logic import puzzle_maker
 from tests.decorators import *
 
+STREAM = '\n\\ 3\\\n\\3 _\n\n\n\\ 4\\\n\\4 _  \n\n'
+FIRST = {(0, 0): None, (0, 1): (3, None), (1, 0): (None, 3),
+         (1, 1): {*range(1, 10)}}
+SECOND = {(0, 0): None, (0, 1): (4, None), (1, 0): (None, 4),
+          (1, 1): {*range(1, 10)}}
+
+
+def read_file(text: str, delimiter: str = None) -> list:
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False,
+                                     encoding='utf-8') as file:
+        file.write(text)
+    try:
+        return [*puzzle_maker.read_puzzles(file.name, delimiter)]
+    finally:
+        os.remove(file.name)
+
 
 class PuzzleMakerTests(unittest.TestCase):
     @assert_equality(puzzle_maker.make_puzzle)
@@ -55,6 +74,40 @@ class PuzzleMakerTests(unittest.TestCase):
         return [['3 7\\\\'], ['1\\2\\3'], ['\\ \\ _\n _ None'], ['__ 1 2'],
                 ['3\\2 \\2 _ 2.1'], ['4 5 \\\n3\\3 42 3\\']]
 
+    @assert_equality(lambda text: [*puzzle_maker.iterate_lines(text)])
+    def test_iterate_lines(self):
+        return [('a\nb', ['a', 'b']), ('a\n\nb\n', ['a', '', 'b']),
+                (b'a\r\nb', [b'a\r', b'b']), ('', [])]
+
+    @assert_equality(lambda text, delimiter: [*puzzle_maker.make_puzzles(
+        StringIO(text), delimiter)])
+    def test_make_puzzles(self):
+        return [(STREAM, None, [FIRST, SECOND]),
+                ('%\n' + STREAM.replace('\n\n\n', '\n%\n'), '%',
+                 [FIRST, SECOND]),
+                ('\\ 3\\\n\n\\3 _\n%\n', '%',
+                 [{(0, 0): None, (0, 1): (3, None), (1, 0): None,
+                   (1, 1): None, (2, 0): (None, 3),
+                   (2, 1): {*range(1, 10)}}]),
+                ('\n\n', None, [])]
+
+    @assert_equality(read_file)
+    def test_read_puzzles(self):
+        return [(STREAM, None, [FIRST, SECOND]),
+                (STREAM.replace('\n\n\n', '\n---\n'), '---',
+                 [FIRST, SECOND]),
+                ('', None, [])]
+
+    @assert_raises(lambda text: read_file(text), SyntaxError,
+                   'Invalid token "x" in 6 line, 1 token.', iterable=False)
+    def test_read_puzzles_raises(self):
+        return [(STREAM.replace('\\4 _', '\\4 x'),)]
+
+    @assert_raises(lambda text: puzzle_maker.make_puzzles(StringIO(text)),
+                   SyntaxError, 'Invalid token "0" in 4 line, 1 token.')
+    def test_make_puzzles_raises(self):
+        return [('\\ 3\\\n\\3 _\n\n\\ 4\\\n\\4 0',)]
+
 
 if __name__ == '__main__':
     unittest.main()
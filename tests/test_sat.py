@@ -0,0 +1,44 @@
+from logic import sat
+from logic.puzzle_maker import make_puzzle
+from logic.solver import solve_puzzle
+from tests.decorators import *
+
+PUZZLES = ['\\ 5\\ 4\\\n\\4 _ _\n\\5 _ _',
+           '\\   6\\ 6\\  6\\\n'
+           '\\6  _  _   _\n'
+           '\\6  _  _   _\n'
+           '\\6  _  _   _',
+           '\\ 3\\ 4\\ 9\\\n'
+           '\\6 _ _ _\n'
+           '\\10 _ _ _']
+
+
+class SatTests(unittest.TestCase):
+    @assert_equality(lambda string: sat.solve_puzzle_sat(
+                         make_puzzle(StringIO(string))),
+                     iterable=True, orderless=True)
+    def test_solutions_match_search(self):
+        return [(string, tuple(solve_puzzle(make_puzzle(StringIO(string)))))
+                for string in PUZZLES]
+
+    @assert_equality(lambda string: sat.count_solutions_sat(
+                         make_puzzle(StringIO(string))))
+    def test_count_solutions(self):
+        return [(PUZZLES[0], 2), (PUZZLES[1], 12),
+                ('\\   9\\ 12\\ 8\\\n'
+                 '\\8  _  _   _\n'
+                 '\\6  _  _   _\n'
+                 '\\10 _  _   _\n', 0)]
+
+    @assert_raises(lambda string: sat.solve_puzzle_sat(
+                       make_puzzle(StringIO(string))),
+                   RuntimeError, 'No solutions were found by the SAT engine.')
+    def test_unsolvable_puzzle(self):
+        return [('\\   9\\ 12\\ 8\\\n'
+                 '\\8  _  _   _\n'
+                 '\\6  _  _   _\n'
+                 '\\10 _  _   _\n',)]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+from logic import search
+from logic.propagation import reduce_state
+from logic.puzzle_maker import make_puzzle
+from logic.state import State
+from tests.decorators import *
+
+
+def make_state(string: str) -> State:
+    return reduce_state(State(make_puzzle(StringIO(string))))
+
+
+class SearchTests(unittest.TestCase):
+    @assert_equality(lambda subject: len([*search.search(subject)]))
+    def test_solution_count(self):
+        return [(make_state('\\   6\\ 6\\  6\\\n'
+                            '\\6  _  _   _\n'
+                            '\\6  _  _   _\n'
+                            '\\6  _  _   _'), 12),
+                (make_state('\\ 5\\ 4\\\n\\4 _ _\n\\5 _ _'), 2),
+                (make_state('\\   9\\ 12\\ 8\\\n'
+                            '\\8  _  _   _\n'
+                            '\\6  _  _   _\n'
+                            '\\10 _  _   _\n'), 0)]
+
+    @assert_equality(lambda subject: (lambda statistics, mark:
+                                      ([*search.search(subject, statistics)],
+                                       statistics.solutions,
+                                       subject.mark() == mark)[1:])
+                     (search.SearchStatistics(), subject.mark()))
+    def test_state_is_restored(self):
+        return [(make_state('\\ 5\\ 4\\\n\\4 _ _\n\\5 _ _'), (2, True))]
+
+    @assert_equality(lambda subject: Iterable(search.search(subject))
+                     .to_tuple(lambda solution: tuple(solution.values)))
+    def test_solutions_are_leaves(self):
+        return [(make_state('\\ 5\\ 4\\\n\\4 _ _\n\\5 _ _'),
+                 ((1, 3, 4, 1), (3, 1, 2, 3)))]
+
+    @assert_equality(lambda subject: (lambda statistics:
+                                      (search.count(subject, statistics),
+                                       statistics.nodes))
+                     (search.SearchStatistics()))
+    def test_count(self):
+        return [(make_state('\\   6\\ 6\\  6\\\n'
+                            '\\6  _  _   _\n'
+                            '\\6  _  _   _\n'
+                            '\\6  _  _   _'), (12, 22)),
+                (make_state('\\ 5\\ 4\\\n\\4 _ _\n\\5 _ _'), (2, 1)),
+                (make_state('\\   9\\ 12\\ 8\\\n'
+                            '\\8  _  _   _\n'
+                            '\\6  _  _   _\n'
+                            '\\10 _  _   _\n'), (0, 1))]
+
+    @assert_equality(search.count_determined)
+    def test_count_determined(self):
+        return [(make_state('\\ 5\\ 4\\\n\\4 _ _\n\\5 _ _'), 2),
+                (make_state('\\ 3\\ 4\\\n\\4 _ _\n\\3 _ _'), 1),
+                (make_state('\\   6\\ 6\\  6\\\n'
+                            '\\6  _  _   _\n'
+                            '\\6  _  _   _\n'
+                            '\\6  _  _   _'), None)]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+import os
+import tempfile
+
+from logic import snapshot
+from logic.exceptions import UnsolvablePuzzleError
+from logic.grid import to_grid
+from logic.puzzle_maker import make_puzzle
+from logic.search import SearchStatistics
+from logic.solver import check_uniqueness, solve_puzzle
+from tests.decorators import *
+
+RESOURCES = os.path.join(os.path.dirname(__file__), os.pardir,
+                         'test_resources')
+PUZZLE = {(0, 0): None, (0, 1): (4, None), (0, 2): (3, None),
+          (1, 0): (None, 3), (1, 1): {*range(1, 10)}, (1, 2): 1,
+          (2, 0): (None, 4), (2, 1): {*range(1, 10)},
+          (2, 2): {*range(1, 10)}}
+UNSOLVABLE = '\\ \\ \\\n\\ 14\\ 7\\\n\\14 _ _\n\\8 _ _\n\\ \\ \\'
+
+
+def load(name: str) -> dict:
+    with open(os.path.join(RESOURCES, name), encoding='utf-8') as file:
+        return make_puzzle(file)
+
+
+def temporary_path() -> str:
+    with tempfile.NamedTemporaryFile(suffix='.snap', delete=False) as file:
+        return file.name
+
+
+def round_trip(puzzles: list, propagate: bool) -> list:
+    path = temporary_path()
+    try:
+        snapshot.write_snapshots(path, puzzles, propagate)
+        return [*snapshot.read_snapshots(path)]
+    finally:
+        os.remove(path)
+
+
+def load_first(names: list) -> tuple:
+    path = temporary_path()
+    try:
+        snapshot.write_snapshots(path, [load(name) for name in names], False)
+        return snapshot.load_puzzle(path)
+    finally:
+        os.remove(path)
+
+
+def unique_nodes(puzzle: dict, prepared: bool) -> tuple:
+    statistics = SearchStatistics()
+    status, solutions = check_uniqueness(puzzle, statistics=statistics,
+                                         prepared=prepared)
+    return status, [*map(to_grid, solutions)], statistics.nodes
+
+
+def corrupt(data: bytes, position: int, value: int) -> bytes:
+    return data[:position] + bytes([value]) + data[position + 1:]
+
+
+class SnapshotTests(unittest.TestCase):
+    @assert_equality(lambda puzzle, flags: (lambda data: snapshot
+                     .parse_snapshot(data)[:2] + (snapshot.parse_snapshot(
+                         data)[2] == len(data),))(
+        snapshot.dump_snapshot(to_grid(puzzle), flags)))
+    def test_dump_snapshot(self):
+        return [(PUZZLE, 0, (to_grid(PUZZLE), 0, True)),
+                ({}, snapshot.CHECKED, (to_grid({}), snapshot.CHECKED, True))]
+
+    @assert_equality(lambda names, propagate: [
+        (grid, flags) for grid, flags in round_trip(
+            [load(name) for name in names], propagate)])
+    def test_round_trip(self):
+        return [(['1.txt', '4.txt'], False,
+                 [(load('1.txt'), snapshot.CHECKED),
+                  (load('4.txt'), snapshot.CHECKED)]),
+                (['3.txt'], True,
+                 [(snapshot.snapshot_puzzle(load('3.txt'))[0],
+                   snapshot.CHECKED | snapshot.PROPAGATED)])]
+
+    @assert_equality(lambda puzzles: [flags for _, flags in round_trip(
+        puzzles, True)])
+    def test_round_trip_unsolvable(self):
+        return [([load('1.txt'), make_puzzle(StringIO(UNSOLVABLE)),
+                  load('4.txt')],
+                 [snapshot.CHECKED | snapshot.PROPAGATED, snapshot.CHECKED,
+                  snapshot.CHECKED | snapshot.PROPAGATED])]
+
+    @assert_raises(lambda string: (lambda grid, flags: [*solve_puzzle(
+                       grid, prepared=bool(flags & snapshot.PROPAGATED))])(
+                       *round_trip([make_puzzle(StringIO(string))], True)[0]),
+                   UnsolvablePuzzleError, iterable=False)
+    def test_solve_unsolvable_snapshot(self):
+        return [(UNSOLVABLE,)]
+
+    @assert_equality(lambda name: (lambda grid, flags: [
+        *solve_puzzle(grid, prepared=bool(flags & snapshot.PROPAGATED))])(
+        *round_trip([load(name)], True)[0]))
+    def test_solve_snapshot(self):
+        return [(name, [*solve_puzzle(load(name))])
+                for name in ('1.txt', '3.txt', '4.txt')]
+
+    @assert_equality(lambda name: unique_nodes(
+        *round_trip([load(name)], True)[0][:1], True))
+    def test_check_uniqueness_snapshot(self):
+        return [(name, unique_nodes(load(name), False))
+                for name in ('1.txt', '3.txt', '4.txt')]
+
+    @assert_equality(load_first)
+    def test_load_puzzle(self):
+        return [(['4.txt', '1.txt'], (load('4.txt'), snapshot.CHECKED))]
+
+    @assert_equality(lambda name: snapshot.load_puzzle(
+        os.path.join(RESOURCES, name)))
+    def test_load_text_puzzle(self):
+        return [('4.txt', (load('4.txt'), 0))]
+
+    @assert_raises(snapshot.parse_snapshot, ValueError, iterable=False)
+    def test_parse_snapshot_raises(self):
+        data = snapshot.dump_snapshot(to_grid(PUZZLE))
+        return [(b'XSU',), (b'ABCD' + data[4:],),
+                (corrupt(data, 4, 9),),
+                (corrupt(data, len(data) - 1, 7),),
+                (data[:-1],)]
+
+    @assert_raises(snapshot.snapshot_puzzle, (ValueError,
+                                              UnsolvablePuzzleError),
+                   iterable=False)
+    def test_snapshot_puzzle_raises(self):
+        return [({(0, 0): None, (0, 1): (None, 3)},),
+                ({(0, 0): (None, 3), (0, 1): {5, 6}},)]
+
+
+if __name__ == '__main__':
+    unittest.main()
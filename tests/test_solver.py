@@ -1,7 +1,20 @@
+from unittest import mock
+
 from logic import solver
 from logic.puzzle_maker import make_puzzle
+from logic.state import State
 from tests.decorators import *
 
+ASSIGNED = '\\ \\ \\\n\\ 14\\ 7\\\n\\14 _ _\n\\8 _ _\n\\ \\ \\'
+WRONG = '\\ 5\\ 4\\\n\\4 1 3\n\\5 2 3'
+
+
+def unpropagated(function, string: str):
+    puzzle = make_puzzle(StringIO(string))
+    with mock.patch.object(solver, 'prepare_state',
+                           lambda *arguments: State(puzzle)):
+        return function(puzzle)
+
 
 class SolverTests(unittest.TestCase):
     @assert_equality(solver.find_unique_combinations)
@@ -166,6 +179,25 @@ class SolverTests(unittest.TestCase):
                           (7, 3): {2, 3}, (7, 4): None, (7, 5): (None, 3),
                           (7, 6): {1, 2}, (7, 7): {1, 2}})]
 
+    @assert_equality(lambda puzzle, cell, value:
+                     (lambda state:
+                      solver.propagate(state, [state.layout.indices[cell]])
+                      .store({**puzzle}))
+                     (State({**puzzle, cell: {value}})))
+    def test_propagate_changed_cell(self):
+        string = StringIO('\\   23\\ 30\\   \\     \\     27\\ 12\\ 16\\\n'
+                          '\\16 _   _     \\     17\\24 _   _   _\n'
+                          '\\17 _   _     15\\29 _     _   _   _\n'
+                          '\\35 _   _     _     _     _   12\\ \\\n'
+                          '\\   \\7  _     _     7\\8   _   _   7\\\n'
+                          '\\   11\\ 10\\16 _     _     _   _   _\n'
+                          '\\21 _   _     _     _     \\5  _   _\n'
+                          '\\6  _   _     _     \\     \\3  _   _')
+        puzzle = solver.reduce_puzzle(make_puzzle(string))
+        return [(puzzle, cell, value,
+                 solver.reduce_puzzle({**puzzle, cell: {value}}))
+                for cell, value in (((5, 3), 4), ((1, 5), 8), ((7, 7), 1))]
+
     @assert_raises(solver.reduce_puzzle, RuntimeError,
                    'No possible number after reduce in \d+ line, \d+ token.')
     def test_unsolvable_puzzle_after_reduce(self):
@@ -187,6 +219,21 @@ class SolverTests(unittest.TestCase):
         puzzle = solver.fill_free_cells(puzzle)
         return [[puzzle]]
 
+    @assert_raises(lambda string, prepared: [*solver.solve_puzzle(
+                       make_puzzle(StringIO(string)), prepared=prepared)],
+                   RuntimeError, 'unsolvable', iterable=False)
+    def test_unsolvable_assigned_puzzle(self):
+        return [(string, prepared)
+                for string in (ASSIGNED, WRONG)
+                for prepared in (False, True)]
+
+    @assert_raises(lambda string: unpropagated(
+                       lambda puzzle: [*solver.solve_puzzle(puzzle)], string),
+                   RuntimeError, 'No solutions were found via brute force.',
+                   iterable=False)
+    def test_solve_invalid_assigned_state(self):
+        return [(WRONG,)]
+
     @assert_equality(lambda subject:
                      solver.exclude_impossible_numbers(
                          solver.reduce_puzzle(make_puzzle(subject))))
@@ -346,6 +393,38 @@ class SolverTests(unittest.TestCase):
                    (1, 0): (None, 4), (1, 1): 3, (1, 2): 1, (2, 0): (None, 5),
                    (2, 1): 2, (2, 2): 3})]]
 
+    @assert_equality(lambda subject: solver.count_solutions(
+                         make_puzzle(subject)))
+    @wrap_string_in_io()
+    def test_count_solutions(self):
+        return [['\\ 5\\ 4\\\n\\4 _ _\n\\5 _ _', 2],
+                ['\\   6\\ 6\\  6\\\n'
+                 '\\6  _  _   _\n'
+                 '\\6  _  _   _\n'
+                 '\\6  _  _   _', 12],
+                ['\\   9\\ 12\\ 8\\\n'
+                 '\\8  _  _   _\n'
+                 '\\6  _  _   _\n'
+                 '\\10 _  _   _\n', 0],
+                ['\\ 3\\ 5\\\n\\3 _ _\n\\7 _ _', 0],
+                [ASSIGNED, 0], [WRONG, 0]]
+
+    @assert_equality(lambda string: unpropagated(solver.count_solutions,
+                                                 string))
+    def test_count_invalid_assigned_state(self):
+        return [(WRONG, 0), ('\\ 5\\ 4\\\n\\4 1 3\n\\5 4 1', 1)]
+
+    @assert_equality(lambda string: unpropagated(
+        lambda puzzle: solver.check_uniqueness(puzzle)[0], string))
+    def test_check_uniqueness_invalid_assigned_state(self):
+        return [(WRONG, 'unsolvable'),
+                ('\\ 5\\ 4\\\n\\4 1 3\n\\5 4 1', 'unique')]
+
+    @assert_equality(lambda string: solver.check_uniqueness(
+        make_puzzle(StringIO(string))))
+    def test_check_uniqueness_assigned_puzzle(self):
+        return [(ASSIGNED, ('unsolvable', ())), (WRONG, ('unsolvable', ()))]
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,46 @@
+from logic import domain
+from logic.puzzle_maker import make_puzzle
+from logic.state import State
+from tests.decorators import *
+
+
+class StateTests(unittest.TestCase):
+    @assert_equality(lambda subject, puzzle: subject.to_puzzle(puzzle))
+    def test_copy_is_independent(self):
+        puzzle = make_puzzle(StringIO('\\ 4\\ 9\\\n\\6 _ 5\n\\7 _ _'))
+        state = State(puzzle)
+        copied = state.copy()
+        copied.assign(0, 1)
+        copied.domains[3] &= ~domain.bit(1)
+        return [(state, puzzle, puzzle),
+                (copied, puzzle, {**puzzle, (1, 1): 1,
+                                  (2, 2): {*range(2, 10)}})]
+
+    @assert_equality(lambda subject: (subject.values,
+                                      subject.totals.sums,
+                                      subject.is_solved()))
+    def test_assign(self):
+        puzzle = make_puzzle(StringIO('\\ 3\\\n\\3 _'))
+        state = State(puzzle)
+        copied = state.copy()
+        copied.assign(0, 3)
+        return [(state, ([0], [0, 0], False)),
+                (copied, ([3], [3, 3], True))]
+
+    @assert_equality(lambda subject: (subject.domains, subject.values,
+                                      subject.totals.sums,
+                                      subject.totals.used, subject.trail))
+    def test_undo(self):
+        puzzle = make_puzzle(StringIO('\\ 4\\ 9\\\n\\6 _ 5\n\\7 _ _'))
+        state, expected = State(puzzle), State(puzzle)
+        mark = state.mark()
+        state.restrict(0, domain.bit(1))
+        state.assign(0, 1)
+        state.restrict(3, state.domains[3] & ~domain.bit(1))
+        state.undo(mark)
+        return [(state, (expected.domains, expected.values,
+                         expected.totals.sums, expected.totals.used, []))]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+from logic import tracing
+from logic.exceptions import UnsolvablePuzzleError
+from logic.puzzle_maker import make_puzzle
+from logic.solver import count_solutions, solve_puzzle
+from tests.decorators import *
+
+SQUARE = ('\\   6\\ 6\\  6\\\n'
+          '\\6  _  _   _\n'
+          '\\6  _  _   _\n'
+          '\\6  _  _   _')
+UNSOLVABLE = ('\\   9\\ 12\\ 8\\\n'
+              '\\8  _  _   _\n'
+              '\\6  _  _   _\n'
+              '\\10 _  _   _\n')
+
+
+def profile(function, string: str) -> tuple:
+    profiler = tracing.Profiler()
+    result = function(make_puzzle(StringIO(string)), tracer=profiler)
+    report = profiler.report()
+    return (result, report['decisions'], report['backtracks'],
+            report['solutions'], report['depth'], bool(report['probes']),
+            [*report['phases']])
+
+
+def enumerate_solutions(puzzle: dict, tracer: tracing.Tracer) -> int:
+    try:
+        return len([*solve_puzzle(puzzle, tracer=tracer)])
+    except UnsolvablePuzzleError:
+        return 0
+
+
+class TracingTests(unittest.TestCase):
+    @assert_equality(profile)
+    def test_profiler(self):
+        return [(enumerate_solutions, SQUARE,
+                 (12, 21, 0, 12, 3, True, ['prepare'])),
+                (count_solutions, SQUARE,
+                 (12, 21, 0, 12, 3, True, ['prepare'])),
+                (enumerate_solutions, UNSOLVABLE,
+                 (0, 5, 5, 0, 1, True, ['prepare'])),
+                (count_solutions, '\\ 5\\ 4\\\n\\4 _ _\n\\5 _ _',
+                 (2, 0, 0, 2, 0, True, ['prepare']))]
+
+    @assert_equality(lambda string: (
+        len([*solve_puzzle(make_puzzle(StringIO(string)))]),
+        len([*solve_puzzle(make_puzzle(StringIO(string)),
+                           tracer=tracing.Tracer())])))
+    def test_tracer_does_not_change_search(self):
+        return [(SQUARE, (12, 12))]
+
+    @assert_equality(lambda iterable: (lambda profiler: (
+        [*tracing.timed(iterable, profiler, 'solve')],
+        [*profiler.phases]))(tracing.Profiler()))
+    def test_timed(self):
+        return [(range(3), ([0, 1, 2], ['solve'])), ((), ([], ['solve']))]
+
+    @assert_equality(lambda hits, misses: tracing.ratio(hits, misses))
+    def test_ratio(self):
+        return [(3, 1, {'hits': 3, 'misses': 1, 'hit_rate': 0.75}),
+                (0, 0, {'hits': 0, 'misses': 0, 'hit_rate': 0.0})]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+from logic import domain, transposition
+from logic.propagation import reduce_state
+from logic.puzzle_maker import make_puzzle
+from logic.search import count, search
+from logic.state import State
+from tests.decorators import *
+
+SQUARE = ('\\   6\\ 6\\  6\\\n'
+          '\\6  _  _   _\n'
+          '\\6  _  _   _\n'
+          '\\6  _  _   _')
+
+
+def make_state(string: str, assignments=()) -> State:
+    state = State(make_puzzle(StringIO(string)))
+    for cell, value in assignments:
+        state.assign(cell, value)
+    return state
+
+
+def restricted_key(state: State, cell: int, value: int) -> bytes:
+    state.restrict(cell, domain.bit(value))
+    return transposition.residual_key(state)
+
+
+def fill_table(capacity: int, operations) -> tuple:
+    table = transposition.TranspositionTable(capacity)
+    for key, value in operations:
+        if value is None:
+            table.get(key)
+        else:
+            table.put(key, value)
+    return (*table.entries.items(),), table.evictions
+
+
+class TranspositionTests(unittest.TestCase):
+    @assert_equality(lambda first, second:
+                     transposition.residual_key(make_state(SQUARE, first)) ==
+                     transposition.residual_key(make_state(SQUARE, second)))
+    def test_residual_key(self):
+        return [(((0, 1), (1, 2), (3, 2), (4, 1)),
+                 ((0, 2), (1, 1), (3, 1), (4, 2)), True),
+                (((0, 1), (4, 2)), ((0, 2), (4, 1)), False),
+                (((0, 1),), ((0, 1), (8, 4)), False)]
+
+    @assert_equality(lambda cell, value: (
+        transposition.residual_key(make_state(SQUARE), cell, value) ==
+        restricted_key(make_state(SQUARE), cell, value)))
+    def test_residual_key_override(self):
+        return [(0, 1, True), (4, 3, True)]
+
+    @assert_equality(fill_table)
+    def test_least_recently_used_eviction(self):
+        size = 2 + transposition.ENTRY_OVERHEAD
+        return [(size * 2, [(b'aa', 1), (b'bb', 2), (b'aa', None),
+                            (b'cc', 3)], (((b'aa', 1), (b'cc', 3)), 1)),
+                (size * 2, [(b'aa', 1), (b'bb', 2), (b'aa', 4),
+                            (b'cc', 3)], (((b'aa', 4), (b'cc', 3)), 1)),
+                (size - 1, [(b'aa', 1)], ((), 1))]
+
+    @assert_equality(lambda keys: (lambda table: (
+        table.put(b'aa', 0), [*map(table.get, keys)],
+        table.hits, table.misses, table.hit_rate)[2:])
+        (transposition.TranspositionTable()))
+    def test_hit_rate(self):
+        return [([b'aa', b'bb', b'aa', b'aa'], (3, 1, 0.75)),
+                ([], (0, 0, 0.0))]
+
+    @assert_equality(lambda string: (
+        count(reduce_state(make_state(string)),
+              table=transposition.TranspositionTable()),
+        len([*search(reduce_state(make_state(string)),
+                     table=transposition.TranspositionTable())])))
+    def test_search_with_table(self):
+        return [(SQUARE, (12, 12)),
+                ('\\ 5\\ 4\\ \\ 5\\ 4\\\n'
+                 '\\4 _ _ \\4 _ _\n'
+                 '\\5 _ _ \\5 _ _', (4, 4)),
+                ('\\   9\\ 12\\ 8\\\n'
+                 '\\8  _  _   _\n'
+                 '\\6  _  _   _\n'
+                 '\\10 _  _   _\n', (0, 0))]
+
+
+if __name__ == '__main__':
+    unittest.main()
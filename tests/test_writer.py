@@ -0,0 +1,141 @@
+import os
+from io import BytesIO
+
+from logic import writer
+from logic.converter import convert_puzzle
+from logic.puzzle_maker import make_puzzle
+from logic.solver import solve_puzzle
+from tests.decorators import *
+
+RESOURCES = os.path.join(os.path.dirname(__file__), os.pardir,
+                         'test_resources')
+
+
+def load(name: str) -> dict:
+    with open(os.path.join(RESOURCES, name), encoding='utf-8') as file:
+        return make_puzzle(file)
+
+
+def render(format: str, puzzles) -> str:
+    sink = BytesIO()
+    with writer.SolutionWriter(sink, format) as solution_writer:
+        for number, puzzle in enumerate(puzzles, start=1):
+            solution_writer.write_solution(number, puzzle)
+    return sink.getvalue().decode('utf-8')
+
+
+def printed(puzzles) -> str:
+    return ''.join('Solution #{0}\n{1}\n'.format(number, ''.join(
+        row + '\n' for row in convert_puzzle(puzzle)))
+        for number, puzzle in enumerate(puzzles, start=1))
+
+
+def solutions(*names) -> list:
+    return [solution for name in names
+            for solution in solve_puzzle(load(name))]
+
+
+def write_status(format: str, status: str) -> bytes:
+    sink = BytesIO()
+    with writer.SolutionWriter(sink, format) as solution_writer:
+        solution_writer.write_status(status)
+    return sink.getvalue()
+
+
+def decode(data: str) -> list:
+    return [digits.decode() for digits in writer.decode_deltas(
+        BytesIO(data.encode()))]
+
+
+def round_trip(puzzle: dict) -> bool:
+    digits = render('digits', solve_puzzle(puzzle)).encode().split()
+    decoded = writer.decode_deltas(BytesIO(render(
+        'delta', solve_puzzle(puzzle)).encode()))
+    return ([writer.apply_digits(puzzle, entry) for entry in decoded] ==
+            [writer.apply_digits(puzzle, entry) for entry in digits] ==
+            [*solve_puzzle(puzzle)])
+
+
+class RecordingSink(BytesIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, data: bytes) -> int:
+        self.writes += 1
+        return super().write(data)
+
+
+def count_writes(buffer_size: int, total: int) -> tuple:
+    sink = RecordingSink()
+    solution_writer = writer.SolutionWriter(sink, 'digits', buffer_size)
+    for number, solution in enumerate(solutions('4.txt')[:total], start=1):
+        solution_writer.write_solution(number, solution)
+    before = sink.writes
+    solution_writer.flush()
+    return before, sink.writes
+
+
+class WriterTests(unittest.TestCase):
+    @assert_equality(lambda puzzles: render('text', puzzles))
+    def test_text_format(self):
+        return [(puzzles, printed(puzzles)) for puzzles in (
+            solutions('4.txt'), solutions('1.txt', '4.txt', '3.txt'),
+            [load('1.txt'), *solutions('1.txt'), load('4.txt')], [])]
+
+    @assert_equality(render)
+    def test_digits_format(self):
+        return [('digits', solutions('4.txt')[:2],
+                 '123231312\n123312231\n'),
+                ('digits', [load('4.txt')], '.........\n'),
+                ('delta', solutions('4.txt')[:3] + solutions('1.txt'),
+                 '=123231312\n33 41 52 62 73 81\n13 22 32 53 63 72\n'
+                 '={0}\n'.format(render('digits', solutions('1.txt'))
+                                  .strip())),
+                ('json', solutions('4.txt')[:2],
+                 '{"solution": 1, "digits": "123231312"}\n'
+                 '{"solution": 2, "digits": "123312231"}\n')]
+
+    @assert_equality(writer.encode_delta)
+    def test_encode_delta(self):
+        return [(b'123231312', b'123312231', b'33 41 52 62 73 81'),
+                (b'123', b'123', b''), (b'1', b'9', b'09'),
+                (b'1' * 12, b'1' * 11 + b'2', b'112')]
+
+    @assert_equality(decode)
+    def test_decode_deltas(self):
+        return [('=123231312\n33 41 52 62 73 81\n\n# comment\n=987\n22\n',
+                 ['123231312', '123312231', '123312231', '987', '982']),
+                ('', [])]
+
+    @assert_equality(round_trip)
+    def test_delta_round_trip(self):
+        return [(load('4.txt'), True), (load('1.txt'), True)]
+
+    @assert_raises(decode, ValueError)
+    def test_decode_deltas_raises(self):
+        return [('12\n',), ('=123\n31\n',), ('=123\n20\n',),
+                ('=123\nx1\n',), ('=123\n1\n',)]
+
+    @assert_raises(writer.apply_digits, ValueError, iterable=False)
+    def test_apply_digits_raises(self):
+        return [(load('4.txt'), b'12'), (load('4.txt'), b'1' * 10)]
+
+    @assert_equality(write_status)
+    def test_write_status(self):
+        return [('text', 'unique', b'Uniqueness: unique\n'),
+                ('json', 'multiple', b'{"uniqueness": "multiple"}\n'),
+                ('delta', 'unique', b'# Uniqueness: unique\n')]
+
+    @assert_equality(count_writes)
+    def test_buffering(self):
+        return [(1 << 16, 12, (0, 1)), (10, 12, (12, 12)),
+                (20, 12, (6, 6))]
+
+    @assert_raises(writer.SolutionWriter, ValueError, iterable=False)
+    def test_solution_writer_raises(self):
+        return [(BytesIO(), 'xml')]
+
+
+if __name__ == '__main__':
+    unittest.main()
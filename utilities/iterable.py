@@ -9,10 +9,62 @@ def compose(*functions):
     return reduce(lambda f, g: lambda x: g(f(x)), functions)
 
 
+def map_filter(data, selector, predicate):
+    for entry in data:
+        entry = selector(entry)
+        if predicate(entry):
+            yield entry
+
+
+def filter_map(data, predicate, selector):
+    return (selector(entry) for entry in data if predicate(entry))
+
+
+def fuse(data, stages: list):
+    position = 0
+    while position < len(stages):
+        is_filter, function = stages[position]
+        if (position + 1 < len(stages)
+                and stages[position + 1][0] != is_filter):
+            data = (filter_map if is_filter else map_filter)(
+                data, function, stages[position + 1][1])
+            position += 2
+            continue
+        data = (filter if is_filter else map)(function, data)
+        position += 1
+    return data
+
+
+def identity(subject):
+    return subject
+
+
+def unique_values(entries: list):
+    try:
+        return iter(dict.fromkeys(entries))
+    except TypeError:
+        return unique_entries(iter(entries), identity)
+
+
+def unique_entries(entries, key_selector):
+    seen, passed = set(), []
+    for entry in entries:
+        key = key_selector(entry)
+        try:
+            if key in seen:
+                continue
+            seen.add(key)
+        except TypeError:
+            if key in passed:
+                continue
+            passed.append(key)
+        yield entry
+
+
 def perform_mapping(func=lambda subject: subject):
     @wraps(func)
-    def wrapped(self, selector=lambda entry: entry, *selectors):
-        self._data = map(compose(selector, *selectors), self)
+    def wrapped(self, *selectors):
+        self._stages.extend((False, selector) for selector in selectors)
         return func(self)
 
     return wrapped
@@ -20,16 +72,21 @@ def perform_mapping(func=lambda subject: subject):
 
 def perform_filtering(func=lambda subject: subject):
     @wraps(func)
-    def wrapped(self, predicate=lambda entry: True):
-        self._data = filter(predicate, self)
+    def wrapped(self, predicate=None):
+        if predicate is not None:
+            self._stages.append((True, predicate))
         return func(self)
 
     return wrapped
 
 
 class Iterable:
+    __slots__ = ('_data', '_stages')
+
     def __init__(self, *iterators):
-        self._data = itertools.chain(*iterators)
+        self._data = (iter(iterators[0]) if len(iterators) == 1
+                      else itertools.chain(*iterators))
+        self._stages = []
 
     def __repr__(self) -> str:
         return str(self)
@@ -37,10 +94,17 @@ class Iterable:
     def __str__(self) -> str:
         return 'Iterable({0})'.format(self._data)
 
+    def _flush(self):
+        if self._stages:
+            self._data = fuse(self._data, self._stages)
+            self._stages = []
+        return self._data
+
     def __iter__(self):
-        return iter(self._data)
+        return iter(self._flush())
 
     def __next__(self):
+        self._data = iter(self._flush())
         return next(self._data)
 
     def __contains__(self, item):
@@ -59,7 +123,7 @@ class Iterable:
 
     @perform_mapping
     def chain(self):
-        self._data = itertools.chain(*self)
+        self._data = itertools.chain.from_iterable(self)
         return self
 
     def concat(self, other):
@@ -70,18 +134,17 @@ class Iterable:
         self._data = zip(self, other)
         return self
 
-    def distinct(self, key_selector=lambda subject: subject,
-                 hashable: bool = False, comparable: bool = False):
-        passed = []
+    def distinct(self, key_selector=identity, hashable: bool = False,
+                 comparable: bool = False):
         if hashable:
             iterator = iter({*map(key_selector, self)})
         elif comparable:
             iterator = map(lambda pair: pair[0],
                            itertools.groupby(sorted(self, key=key_selector)))
+        elif key_selector is identity:
+            iterator = unique_values([*self])
         else:
-            iterator = (entry for entry in self if
-                        (entry not in passed and
-                         (passed.append(key_selector(entry)) or True)))
+            iterator = unique_entries(iter(self), key_selector)
         self._data = iterator
         return self
 
@@ -89,10 +152,10 @@ class Iterable:
         self._data = sorted(self, key=key_selector)
         return self
 
-    def max(self, key_selector=lambda entry: entry):
+    def max(self, key_selector=None):
         return max(self, key=key_selector)
 
-    def min(self, key_selector=lambda entry: entry):
+    def min(self, key_selector=None):
         return min(self, key=key_selector)
 
     @perform_mapping
@@ -107,20 +170,22 @@ class Iterable:
         self._data = itertools.product(self, other)
         return self
 
-    @perform_filtering
-    def count(self) -> int:
+    def count(self, predicate=None) -> int:
+        if predicate is not None:
+            return sum(1 for entry in self if predicate(entry))
         count = 0
-        for _ in self:
-            count += 1
+        for count, _ in enumerate(self, 1):
+            pass
         return count
 
     @perform_filtering
     def first(self):
         return next(self)
 
-    def first_or_default(self, predicate=lambda entry: True, default=None):
-        perform_filtering()(self, predicate)
-        return next(self, default)
+    def first_or_default(self, predicate=None, default=None):
+        if predicate is None:
+            return next(iter(self), default)
+        return next((entry for entry in self if predicate(entry)), default)
 
     def take(self, amount: int):
         self._data = itertools.islice(self, amount)
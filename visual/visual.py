@@ -3,7 +3,9 @@ from functools import wraps
 
 from PyQt5 import QtWidgets, QtCore, QtGui
 
+from logic import domain
 from logic.error_checker import check_puzzle
+from logic.grid import to_grid
 from logic.puzzle_maker import make_puzzle
 from logic.solver import solve_puzzle
 from utilities.iterable import Iterable
@@ -12,7 +14,7 @@ draw_scale = 35
 
 
 class SolveThread(QtCore.QThread):
-    completion_signal = QtCore.pyqtSignal(dict, int, int)
+    completion_signal = QtCore.pyqtSignal(object, int, int)
     failure_signal = QtCore.pyqtSignal(str)
 
     def __init__(self, parent):
@@ -184,13 +186,9 @@ class CrossSumsWindow(QtWidgets.QMainWindow):
     def draw_puzzle(self):
         self.paint_widget.puzzle = self._puzzle
         self.paint_widget.update()
-        width, height = (Iterable(Iterable(self._puzzle)
-                                  .map(lambda pair: pair[dimension])
-                                  .max()
-                                  for dimension in range(2))
-                         .to_tuple(lambda number: number + 1))
-        self.setFixedSize(QtCore.QSize(height * draw_scale + 1,
-                                       width * draw_scale + 2 + 20 + 20))
+        grid = to_grid(self._puzzle)
+        self.setFixedSize(QtCore.QSize(grid.width * draw_scale + 1,
+                                       grid.height * draw_scale + 2 + 20 + 20))
         self.paint_widget.resize(self.width(), self.height())
 
         message = 'Solution # {0}, total: {1}.'
@@ -277,7 +275,7 @@ class PaintWidget(QtWidgets.QWidget):
                       if not orientation
                       else QtCore.Qt.AlignRight | QtCore.Qt.AlignTop,
                       str(component)))
-        elif isinstance(token, set):
+        elif domain.is_domain(token):
             pass
 
     def paintEvent(self, *args):